@@ -1,7 +1,16 @@
 from os import PathLike
-from .core import application
+
+CLI_COMMANDS = {"export", "bench", "probe"}
+"""Headless commands handled by `.cli` instead of opening windows"""
 
 def main(bin_paths:list[PathLike]) -> int:
+
+	# Headless commands must not touch QApplication (or even import the GUI), so check for those first
+	if bin_paths and bin_paths[0] in CLI_COMMANDS:
+		from . import cli
+		return cli.main(list(bin_paths))
+	
+	from .core import application
 	
 	app = application.BSMainApplication()
 
@@ -17,5 +26,9 @@ def main(bin_paths:list[PathLike]) -> int:
 
 if __name__ == "__main__":
 	
-	import sys
-	sys.exit(main(sys.argv[1:]))
\ No newline at end of file
+	import sys, multiprocessing
+
+	# Worker processes for parallel loading and export re-enter here in frozen builds
+	multiprocessing.freeze_support()
+	
+	sys.exit(main(sys.argv[1:]))
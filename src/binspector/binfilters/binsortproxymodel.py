@@ -0,0 +1,764 @@
+"""
+Sorts bin items for the text view
+
+Sort keys for a column are gathered once per sort (straight from the bin item model's columns where possible) and
+sorted natively, rather than compared a pair of rows at a time through `QSortFilterProxyModel.lessThan()`.
+
+Sorts can be by several columns at once, per the bin's stored sort columns.  Large sorts happen in the thread pool, and
+the last few orderings are kept around, so flipping between ascending and descending or going back to an earlier sort
+doesn't sort again.
+"""
+
+import array, collections, dataclasses, itertools, logging, time, typing
+from PySide6 import QtCore
+
+from ..binitems import binitemtypes
+from ..binview  import binviewitemtypes
+from .siftfilter import siftmatchtypes
+
+RESORT_DELAY_MSEC:int = 250
+"""Wait this long after rows are added or changed before re-sorting, so a load's worth of batches only re-sorts now and then"""
+
+SORT_CACHE_SIZE:int = 8
+"""Orderings kept per model, most recently used first"""
+
+SORT_IN_THREAD_MIN_ROWS:int = 20_000
+"""Sort fewer rows than this right away rather than in the thread pool"""
+
+BSBinSortColumns:typing.TypeAlias = tuple[tuple[int, QtCore.Qt.SortOrder], ...]
+"""Columns to sort by and their sort orders, most significant first"""
+
+@dataclasses.dataclass(frozen=True)
+class BSBinSortResult:
+	"""Source rows in sort order"""
+
+	source_rows:array.array
+	"""Source row for each sorted row"""
+
+	run_starts:array.array
+	"""Sorted rows that start a run of rows with equal sort keys (other than the first)"""
+
+	def reversed(self) -> "BSBinSortResult":
+		"""The same sort with every sort order flipped: runs of equal rows in reverse, each still in source order"""
+
+		row_count   = len(self.source_rows)
+		source_rows = self.source_rows[::-1]
+
+		# Reversing everything reverses each run too, so put back any with more than one row
+		if len(self.run_starts) < row_count - 1:
+
+			for start, end in itertools.pairwise([0, *self.run_starts, row_count]):
+
+				if end - start > 1:
+					source_rows[row_count - end:row_count - start] = source_rows[row_count - end:row_count - start][::-1]
+
+		return BSBinSortResult(
+			source_rows = source_rows,
+			run_starts  = array.array("q", (row_count - run_start for run_start in reversed(self.run_starts))),
+		)
+
+def flipped_sort_order(sort_order:QtCore.Qt.SortOrder) -> QtCore.Qt.SortOrder:
+
+	if sort_order == QtCore.Qt.SortOrder.DescendingOrder:
+		return QtCore.Qt.SortOrder.AscendingOrder
+
+	return QtCore.Qt.SortOrder.DescendingOrder
+
+def sort_rows(column_keys:list[list], descending:list[bool]) -> BSBinSortResult:
+	"""Sort rows by one or more columns of sort keys, most significant first"""
+
+	row_count = len(column_keys[0]) if column_keys else 0
+	rows      = list(range(row_count))
+
+	# Stable sorts from the last sort column to the first
+	for sort_keys, is_descending in zip(reversed(column_keys), reversed(descending)):
+
+		try:
+			rows.sort(key=sort_keys.__getitem__, reverse=is_descending)
+		except TypeError:
+			# Keys of unexpected types from somewhere
+			rows.sort(key=lambda row: str(sort_keys[row]), reverse=is_descending)
+
+	row_keys = column_keys[0] if len(column_keys) == 1 else list(zip(*column_keys))
+
+	return BSBinSortResult(
+		source_rows = array.array("q", rows),
+		run_starts  = array.array("q", (idx for idx in range(1, row_count) if not binitemtypes.sort_keys_equal(row_keys[rows[idx]], row_keys[rows[idx - 1]]))),
+	)
+
+class BSBinSortWorker(QtCore.QRunnable):
+	"""Sort rows by their keys in a threadpool"""
+
+	class Signals(QtCore.QObject):
+		"""Signals emitted by `BSBinSortWorker`"""
+
+		sig_sorted = QtCore.Signal(int, int, object, object)
+		"""Sort request ID, data generation, the `BSBinSortColumns` and the `BSBinSortResult`"""
+
+	def __init__(self, signals:Signals, request_id:int, generation:int, sort_columns:BSBinSortColumns, column_keys:list[list], *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._signals      = signals
+		self._request_id   = request_id
+		self._generation   = generation
+		self._sort_columns = sort_columns
+		self._column_keys  = column_keys
+
+	def run(self):
+
+		time_start = time.perf_counter()
+
+		try:
+			sort_result = sort_rows(self._column_keys, [sort_order == QtCore.Qt.SortOrder.DescendingOrder for _, sort_order in self._sort_columns])
+		except Exception as e:
+			logging.getLogger(__name__).exception("Could not sort by %s: %s", self._sort_columns, e)
+			return
+
+		logging.getLogger(__name__).debug("Sorted %s rows by %s in %.3fs", len(sort_result.source_rows), self._sort_columns, time.perf_counter() - time_start)
+
+		try:
+			self._signals.sig_sorted.emit(self._request_id, self._generation, self._sort_columns, sort_result)
+		except RuntimeError:
+			# The model went away while sorting
+			pass
+
+class BSBinSortProxyModel(QtCore.QAbstractProxyModel):
+	"""Flat proxy model putting source rows in sort order"""
+
+	sig_sort_changed = QtCore.Signal(object)
+	"""Sort columns were changed (`list[tuple[int, QtCore.Qt.SortOrder]]`, empty for source order)"""
+
+	def __init__(self, *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._source_rows:list[int]|None = None
+		"""Source row for each proxy row, or `None` while in source order"""
+
+		self._proxy_rows:list[int] = []
+		"""Proxy row for each source row (`-1` if it has none), when sorted"""
+
+		self._sort_columns:BSBinSortColumns = ()
+
+		self._bin_sort_columns:list[tuple[str, QtCore.Qt.SortOrder]] = []
+		"""Sort columns from the bin, by name, until they can be found among the columns"""
+
+		self._sort_cache:collections.OrderedDict[BSBinSortColumns, BSBinSortResult] = collections.OrderedDict()
+		self._sort_generation = 0
+		"""Bumped whenever rows change, so sorts of the rows as they were are thrown out"""
+
+		self._sort_request = 0
+		"""ID of the latest sort asked for.  Sorts still running for earlier ones are only cached, not shown."""
+
+		self._sort_signals = BSBinSortWorker.Signals(self)
+		self._sort_signals.sig_sorted.connect(self.sortFinished)
+
+		self._layout_proxy_indexes :list[QtCore.QModelIndex] = []
+		self._layout_source_indexes:list[QtCore.QPersistentModelIndex] = []
+
+		self._resort_timer = QtCore.QTimer(self)
+		self._resort_timer.setSingleShot(True)
+		self._resort_timer.setInterval(RESORT_DELAY_MSEC)
+		self._resort_timer.timeout.connect(self.resort)
+
+	def setSourceModel(self, sourceModel:QtCore.QAbstractItemModel):
+
+		if self.sourceModel() == sourceModel:
+			return
+
+		if self.sourceModel() is not None:
+			self.sourceModel().disconnect(self)
+
+		sourceModel.dataChanged             .connect(self.sourceDataChanged)
+		sourceModel.headerDataChanged       .connect(self.headerDataChanged)
+
+		sourceModel.columnsAboutToBeInserted.connect(self.sourceColumnsAboutToBeInserted)
+		sourceModel.columnsInserted         .connect(self.sourceColumnsInserted)
+		sourceModel.columnsAboutToBeRemoved .connect(self.sourceColumnsAboutToBeRemoved)
+		sourceModel.columnsRemoved          .connect(self.sourceColumnsRemoved)
+		sourceModel.columnsAboutToBeMoved   .connect(self.sourceColumnsAboutToBeMoved)
+		sourceModel.columnsMoved            .connect(self.sourceColumnsMoved)
+
+		sourceModel.rowsAboutToBeInserted   .connect(self.sourceRowsAboutToBeInserted)
+		sourceModel.rowsInserted            .connect(self.sourceRowsInserted)
+		sourceModel.rowsAboutToBeRemoved    .connect(self.sourceRowsAboutToBeRemoved)
+		sourceModel.rowsRemoved             .connect(self.sourceRowsRemoved)
+		sourceModel.rowsAboutToBeMoved      .connect(self.sourceLayoutAboutToBeChanged)
+		sourceModel.rowsMoved               .connect(self.sourceLayoutChanged)
+
+		sourceModel.layoutAboutToBeChanged  .connect(self.sourceLayoutAboutToBeChanged)
+		sourceModel.layoutChanged           .connect(self.sourceLayoutChanged)
+
+		sourceModel.modelAboutToBeReset     .connect(self.beginResetModel)
+		sourceModel.modelReset              .connect(self.sourceModelReset)
+
+		self.beginResetModel()
+		super().setSourceModel(sourceModel)
+		self._invalidateSortCache()
+		self._setSourceRows(self._sortNow())
+		self.endResetModel()
+
+	# Sorting
+
+	def sort(self, column:int, order:QtCore.Qt.SortOrder=QtCore.Qt.SortOrder.AscendingOrder):
+		"""Sort by a single column, or go back to source order for column `-1`"""
+
+		# Sorting by hand wins out over a bin's sort columns that haven't turned up yet
+		if column >= 0:
+			self._bin_sort_columns = []
+
+		self.setSortColumns([(column, order)] if column >= 0 else [])
+
+	def setSortColumns(self, sort_columns:list[tuple[int, QtCore.Qt.SortOrder]]):
+		"""Sort by several columns, most significant first"""
+
+		sort_columns = tuple((column, QtCore.Qt.SortOrder(order)) for column, order in sort_columns)
+
+		if sort_columns == self._sort_columns and self.isSorted() == bool(sort_columns):
+			return
+
+		self._sort_columns = sort_columns
+		self.sig_sort_changed.emit(list(self._sort_columns))
+
+		self.resort()
+
+	def sortColumns(self) -> list[tuple[int, QtCore.Qt.SortOrder]]:
+		return list(self._sort_columns)
+
+	def sortColumn(self) -> int:
+		return self._sort_columns[0][0] if self._sort_columns else -1
+
+	def sortOrder(self) -> QtCore.Qt.SortOrder:
+		return self._sort_columns[0][1] if self._sort_columns else QtCore.Qt.SortOrder.AscendingOrder
+
+	def isSorted(self) -> bool:
+		return self._source_rows is not None
+
+	@QtCore.Slot(object)
+	def setSortColumnsFromBin(self, sort_settings:list[list[int, str]]):
+		"""Sort by a bin's stored sort columns (`[direction, column name]`, descending if `direction` is set)"""
+
+		self._bin_sort_columns = [
+			(column_name, QtCore.Qt.SortOrder.DescendingOrder if direction else QtCore.Qt.SortOrder.AscendingOrder)
+			for direction, column_name in sort_settings or []
+		]
+
+		self._applyBinSortColumns()
+
+	def _applyBinSortColumns(self):
+		"""Sort by the bin's sort columns once any of them can be found"""
+
+		if not self._bin_sort_columns or not self.sourceModel():
+			return
+
+		column_indexes:dict[str, int] = {}
+
+		for column in range(self.sourceModel().columnCount(QtCore.QModelIndex())):
+			column_name = self.sourceModel().headerData(column, QtCore.Qt.Orientation.Horizontal, binviewitemtypes.BSBinViewColumnInfoRole.DisplayNameRole)
+			column_indexes.setdefault(column_name, column)
+
+		# Columns that aren't shown can't be sorted by, so make do with the rest
+		sort_columns = [
+			(column_indexes[column_name], sort_order)
+			for column_name, sort_order in self._bin_sort_columns
+			if column_name in column_indexes
+		]
+
+		if not sort_columns:
+			return
+
+		logging.getLogger(__name__).debug("Sorting by bin sort columns %s", self._bin_sort_columns)
+
+		self._bin_sort_columns = []
+		self.setSortColumns(sort_columns)
+
+	@QtCore.Slot()
+	def resort(self):
+		"""Sort again by the current sort columns, say after rows were added or changed"""
+
+		self._resort_timer.stop()
+		self._sort_request += 1
+
+		sort_columns = self._validSortColumns()
+
+		if not sort_columns:
+			self._applySort(None)
+			return
+
+		sort_result = self._cachedSort(sort_columns)
+
+		if sort_result is not None:
+			self._applySort(sort_result.source_rows)
+			return
+
+		column_keys = [self.sortKeys(column) for column, _ in sort_columns]
+
+		if self.sourceModel().rowCount(QtCore.QModelIndex()) < SORT_IN_THREAD_MIN_ROWS:
+			sort_result = sort_rows(column_keys, [sort_order == QtCore.Qt.SortOrder.DescendingOrder for _, sort_order in sort_columns])
+			self._cacheSort(sort_columns, sort_result)
+			self._applySort(sort_result.source_rows)
+			return
+
+		# Rows keep their current order until the sort comes back
+		QtCore.QThreadPool.globalInstance().start(
+			BSBinSortWorker(self._sort_signals, self._sort_request, self._sort_generation, sort_columns, column_keys)
+		)
+
+	@QtCore.Slot(int, int, object, object)
+	def sortFinished(self, request_id:int, generation:int, sort_columns:BSBinSortColumns, sort_result:BSBinSortResult):
+		"""A sort came back from the thread pool"""
+
+		# Rows have changed since
+		if generation != self._sort_generation:
+			return
+
+		self._cacheSort(sort_columns, sort_result)
+
+		# Something else was asked for since, but the sort might be wanted again
+		if request_id != self._sort_request:
+			return
+
+		self._applySort(sort_result.source_rows)
+
+	def sortKeys(self, column:int) -> list:
+		"""Native sort key for each source row in a column"""
+
+		source_model = self.sourceModel()
+
+		# The composite model can get these straight from the bin item columns
+		column_sort_keys = getattr(source_model, "columnSortKeys", None)
+		sort_keys        = column_sort_keys(column) if column_sort_keys is not None else None
+
+		if sort_keys is None:
+
+			sort_keys = [
+				source_model.index(row, column, QtCore.QModelIndex()).data(QtCore.Qt.ItemDataRole.InitialSortOrderRole)
+				for row in range(source_model.rowCount(QtCore.QModelIndex()))
+			]
+
+			sort_keys = [binitemtypes.EMPTY_SORT_KEY if sort_key is None else sort_key for sort_key in sort_keys]
+
+		return sort_keys
+
+	def columnSearchText(self, column:int, rows:typing.Sequence[int]) -> list[str]:
+		"""Casefolded display text of a column for the given rows, for sifting"""
+
+		return self.sourceModel().columnSearchText(column, self._mapRowsToSource(rows))
+
+	def rowSearchHaystacks(self, rows:typing.Sequence[int]) -> list[str]:
+		"""Casefolded display text of every column for the given rows, for Find in Bin"""
+
+		return self.sourceModel().rowSearchHaystacks(self._mapRowsToSource(rows))
+
+	def rowsContaining(self, needle:str, rows:typing.Sequence[int], column:int|None=None) -> bytes:
+		"""Whether the search text of each of the given rows contains a casefolded string, in a column or any column"""
+
+		return self.sourceModel().rowsContaining(needle, self._mapRowsToSource(rows), column)
+
+	def rowsMatching(self, sift_string:str, match_type:siftmatchtypes.BSSiftMatchTypes, rows:typing.Sequence[int], column:int) -> bytes:
+		"""Whether a column's search text matches a casefolded string for each of the given rows"""
+
+		return self.sourceModel().rowsMatching(sift_string, match_type, self._mapRowsToSource(rows), column)
+
+	def rowsWithRangeContaining(self, range_role:QtCore.Qt.ItemDataRole, frames_at_rate:typing.Callable[[typing.Any, typing.Any], int|None], rows:typing.Sequence[int]) -> bytes|None:
+		"""Whether each of the given rows has a range containing a value, or `None` if it can't be looked up"""
+
+		return self.sourceModel().rowsWithRangeContaining(range_role, frames_at_rate, self._mapRowsToSource(rows))
+
+	def _mapRowsToSource(self, rows:typing.Sequence[int]) -> typing.Sequence[int]:
+
+		if self._source_rows is None:
+			return rows
+
+		if isinstance(rows, range) and rows.step == 1:
+			return self._source_rows[rows.start:rows.stop]
+
+		return [self._source_rows[row] for row in rows]
+
+	def _validSortColumns(self) -> BSBinSortColumns:
+		"""Sort columns that are actually there"""
+
+		if not self.sourceModel():
+			return ()
+
+		column_count = self.sourceModel().columnCount(QtCore.QModelIndex())
+
+		return tuple((column, sort_order) for column, sort_order in self._sort_columns if 0 <= column < column_count)
+
+	def _sortNow(self) -> array.array|None:
+		"""Sort right away, for when rows can't be left in a stale order"""
+
+		sort_columns = self._validSortColumns()
+
+		if not sort_columns:
+			return None
+
+		sort_result = self._cachedSort(sort_columns)
+
+		if sort_result is None:
+			sort_result = sort_rows([self.sortKeys(column) for column, _ in sort_columns], [sort_order == QtCore.Qt.SortOrder.DescendingOrder for _, sort_order in sort_columns])
+			self._cacheSort(sort_columns, sort_result)
+
+		return sort_result.source_rows
+
+	def _cachedSort(self, sort_columns:BSBinSortColumns) -> BSBinSortResult|None:
+		"""A cached sort by these columns, or by these columns with every order flipped"""
+
+		if sort_columns in self._sort_cache:
+			self._sort_cache.move_to_end(sort_columns)
+			return self._sort_cache[sort_columns]
+
+		flipped_columns = tuple((column, flipped_sort_order(sort_order)) for column, sort_order in sort_columns)
+
+		if flipped_columns in self._sort_cache:
+			sort_result = self._sort_cache[flipped_columns].reversed()
+			self._cacheSort(sort_columns, sort_result)
+			return sort_result
+
+		return None
+
+	def _cacheSort(self, sort_columns:BSBinSortColumns, sort_result:BSBinSortResult):
+
+		self._sort_cache[sort_columns] = sort_result
+		self._sort_cache.move_to_end(sort_columns)
+
+		while len(self._sort_cache) > SORT_CACHE_SIZE:
+			self._sort_cache.popitem(last=False)
+
+	def _invalidateSortCache(self):
+
+		self._sort_cache.clear()
+		self._sort_generation += 1
+
+	def _applySort(self, source_rows:array.array|None):
+		"""Put rows in a new order, keeping track of persistent indexes"""
+
+		self.layoutAboutToBeChanged.emit()
+
+		old_proxy_indexes = self.persistentIndexList()
+		source_indexes    = [self.mapToSource(index) for index in old_proxy_indexes]
+
+		self._setSourceRows(source_rows)
+
+		self.changePersistentIndexList(old_proxy_indexes, [self.mapFromSource(index) for index in source_indexes])
+
+		self.layoutChanged.emit()
+
+	def _setSourceRows(self, source_rows:array.array|None):
+
+		# Copied, as the cached sort shouldn't change as rows come and go
+		self._source_rows = list(source_rows) if source_rows is not None else None
+		self._rebuildProxyRows()
+
+	def _rebuildProxyRows(self):
+
+		if self._source_rows is None:
+			self._proxy_rows = []
+			return
+
+		proxy_rows = [-1] * self.sourceModel().rowCount(QtCore.QModelIndex())
+
+		for proxy_row, source_row in enumerate(self._source_rows):
+			proxy_rows[source_row] = proxy_row
+
+		self._proxy_rows = proxy_rows
+
+	def _scheduleResort(self):
+
+		if self.isSorted():
+			self._resort_timer.start()
+
+	# Source model mapping
+
+	def mapFromSource(self, sourceIndex:QtCore.QModelIndex) -> QtCore.QModelIndex:
+
+		if not sourceIndex.isValid() or not self.sourceModel():
+			return QtCore.QModelIndex()
+
+		if self._source_rows is None:
+			return self.index(sourceIndex.row(), sourceIndex.column(), QtCore.QModelIndex())
+
+		proxy_row = self._proxy_rows[sourceIndex.row()] if sourceIndex.row() < len(self._proxy_rows) else -1
+
+		if proxy_row < 0:
+			return QtCore.QModelIndex()
+
+		return self.index(proxy_row, sourceIndex.column(), QtCore.QModelIndex())
+
+	def mapToSource(self, proxyIndex:QtCore.QModelIndex) -> QtCore.QModelIndex:
+
+		if not proxyIndex.isValid() or not self.sourceModel():
+			return QtCore.QModelIndex()
+
+		source_row = proxyIndex.row() if self._source_rows is None else self._source_rows[proxyIndex.row()]
+
+		return self.sourceModel().index(source_row, proxyIndex.column(), QtCore.QModelIndex())
+
+	@QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+	def sourceDataChanged(self, topLeft:QtCore.QModelIndex, bottomRight:QtCore.QModelIndex, roles:list[QtCore.Qt.ItemDataRole]):
+
+		if self._source_rows is None:
+			self.dataChanged.emit(self.mapFromSource(topLeft), self.mapFromSource(bottomRight), roles)
+			return
+
+		proxy_rows = [self._proxy_rows[row] for row in range(topLeft.row(), bottomRight.row() + 1)]
+
+		self.dataChanged.emit(
+			self.index(min(proxy_rows), topLeft.column(), QtCore.QModelIndex()),
+			self.index(max(proxy_rows), bottomRight.column(), QtCore.QModelIndex()),
+			roles
+		)
+
+		if any(topLeft.column() <= column <= bottomRight.column() for column, _ in self._sort_columns):
+			self._invalidateSortCache()
+			self._scheduleResort()
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsAboutToBeInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		# Sorted or not, new rows go in where they're quickest to put: in place, or at the end until the next re-sort
+		proxy_first = first if self._source_rows is None else len(self._source_rows)
+		self.beginInsertRows(QtCore.QModelIndex(), proxy_first, proxy_first + last - first)
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		if self._source_rows is not None:
+
+			row_count = last - first + 1
+
+			if first < len(self._proxy_rows):
+
+				# Rows inserted mid-way push the rest down
+				self._source_rows = [row + row_count if row >= first else row for row in self._source_rows]
+				self._source_rows.extend(range(first, last + 1))
+				self._rebuildProxyRows()
+
+			else:
+				self._proxy_rows.extend(range(len(self._source_rows), len(self._source_rows) + row_count))
+				self._source_rows.extend(range(first, last + 1))
+
+		self._invalidateSortCache()
+
+		self.endInsertRows()
+		self._scheduleResort()
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsAboutToBeRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		if self._source_rows is None:
+			self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+			return
+
+		# Removed source rows may be scattered around the proxy, so remove them a run at a time, bottom up
+		proxy_rows = sorted(self._proxy_rows[first:last + 1])
+		proxy_runs = []
+
+		for proxy_row in proxy_rows:
+
+			if proxy_runs and proxy_runs[-1][1] == proxy_row - 1:
+				proxy_runs[-1][1] = proxy_row
+			else:
+				proxy_runs.append([proxy_row, proxy_row])
+
+		# Only the removed rows are unmapped as we go; the rest are renumbered in one pass in `sourceRowsRemoved()`
+		for proxy_first, proxy_last in reversed(proxy_runs):
+
+			self.beginRemoveRows(QtCore.QModelIndex(), proxy_first, proxy_last)
+
+			for source_row in self._source_rows[proxy_first:proxy_last + 1]:
+				self._proxy_rows[source_row] = -1
+
+			del self._source_rows[proxy_first:proxy_last + 1]
+			self.endRemoveRows()
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		self._invalidateSortCache()
+
+		if self._source_rows is None:
+			self.endRemoveRows()
+			return
+
+		row_count = last - first + 1
+		self._source_rows = [row - row_count if row > last else row for row in self._source_rows]
+		self._rebuildProxyRows()
+
+	@QtCore.Slot()
+	def sourceLayoutAboutToBeChanged(self):
+
+		self.layoutAboutToBeChanged.emit()
+
+		self._layout_proxy_indexes  = self.persistentIndexList()
+		self._layout_source_indexes = [QtCore.QPersistentModelIndex(self.mapToSource(index)) for index in self._layout_proxy_indexes]
+
+	@QtCore.Slot()
+	def sourceLayoutChanged(self):
+
+		self._resort_timer.stop()
+		self._invalidateSortCache()
+		self._setSourceRows(self._sortNow())
+
+		new_proxy_indexes = [
+			self.mapFromSource(self.sourceModel().index(index.row(), index.column(), QtCore.QModelIndex())) if index.isValid() else QtCore.QModelIndex()
+			for index in self._layout_source_indexes
+		]
+
+		self.changePersistentIndexList(self._layout_proxy_indexes, new_proxy_indexes)
+
+		self._layout_proxy_indexes  = []
+		self._layout_source_indexes = []
+
+		self.layoutChanged.emit()
+
+	@QtCore.Slot()
+	def sourceModelReset(self):
+
+		self._resort_timer.stop()
+		self._invalidateSortCache()
+		self._setSourceRows(self._sortNow())
+
+		self.endResetModel()
+		self._applyBinSortColumns()
+
+	# Columns pass straight through
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceColumnsAboutToBeInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+		self.beginInsertColumns(QtCore.QModelIndex(), first, last)
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceColumnsInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		column_count = last - first + 1
+		sort_changed = self._shiftSortColumns(lambda column: column + column_count if column >= first else column)
+
+		self.endInsertColumns()
+
+		if sort_changed:
+			self.sig_sort_changed.emit(list(self._sort_columns))
+
+		self._applyBinSortColumns()
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceColumnsAboutToBeRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+		self.beginRemoveColumns(QtCore.QModelIndex(), first, last)
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceColumnsRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		# Rows stay where they are if a sort column goes away, it just isn't re-sorted by
+		column_count = last - first + 1
+		sort_changed = self._shiftSortColumns(lambda column: -1 if first <= column <= last else column - column_count if column > last else column)
+
+		self.endRemoveColumns()
+
+		if sort_changed:
+			self.sig_sort_changed.emit(list(self._sort_columns))
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int, QtCore.QModelIndex, int)
+	def sourceColumnsAboutToBeMoved(self, sourceParent:QtCore.QModelIndex, sourceStart:int, sourceEnd:int, destinationParent:QtCore.QModelIndex, destinationColumn:int):
+
+		self.beginMoveColumns(QtCore.QModelIndex(), sourceStart, sourceEnd, QtCore.QModelIndex(), destinationColumn)
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int, QtCore.QModelIndex, int)
+	def sourceColumnsMoved(self, sourceParent:QtCore.QModelIndex, sourceStart:int, sourceEnd:int, destinationParent:QtCore.QModelIndex, destinationColumn:int):
+
+		# Follow the sort columns to wherever they end up
+		column_count = sourceEnd - sourceStart + 1
+		move_offset  = (destinationColumn if destinationColumn < sourceStart else destinationColumn - column_count) - sourceStart
+
+		def moved_column(column:int) -> int:
+
+			if sourceStart <= column <= sourceEnd:
+				return column + move_offset
+			elif destinationColumn <= column < sourceStart:
+				return column + column_count
+			elif sourceEnd < column < destinationColumn:
+				return column - column_count
+
+			return column
+
+		sort_changed = self._shiftSortColumns(moved_column)
+
+		self.endMoveColumns()
+
+		if sort_changed:
+			self.sig_sort_changed.emit(list(self._sort_columns))
+
+	def _shiftSortColumns(self, shifted_column:typing.Callable[[int], int]) -> bool:
+		"""Renumber sort columns as source columns come, go or move, dropping any that went.  Returns whether they changed."""
+
+		sort_columns = tuple((shifted_column(column), sort_order) for column, sort_order in self._sort_columns)
+		sort_columns = tuple((column, sort_order) for column, sort_order in sort_columns if column >= 0)
+
+		if sort_columns == self._sort_columns:
+			return False
+
+		# Cached sorts are by column number
+		self._sort_columns = sort_columns
+		self._invalidateSortCache()
+
+		return True
+
+	def moveColumns(self, sourceParent:QtCore.QModelIndex, sourceColumn:int, count:int, destinationParent:QtCore.QModelIndex, destinationChild:int) -> bool:
+		return self.sourceModel().moveColumns(QtCore.QModelIndex(), sourceColumn, count, QtCore.QModelIndex(), destinationChild)
+
+	def headerData(self, section:int, orientation:QtCore.Qt.Orientation, /, role:QtCore.Qt.ItemDataRole):
+
+		if not self.sourceModel():
+			return None
+
+		if orientation == QtCore.Qt.Orientation.Vertical:
+			return self.sourceModel().headerData(self.mapToSource(self.index(section, 0, QtCore.QModelIndex())).row(), orientation, role)
+
+		return self.sourceModel().headerData(section, orientation, role)
+
+	def setHeaderData(self, section:int, orientation:QtCore.Qt.Orientation, value, /, role:QtCore.Qt.ItemDataRole) -> bool:
+
+		if not self.sourceModel() or orientation != QtCore.Qt.Orientation.Horizontal:
+			return False
+
+		return self.sourceModel().setHeaderData(section, orientation, value, role)
+
+	# Proxy model modifications
+
+	def parent(self, child:QtCore.QModelIndex) -> QtCore.QModelIndex:
+		return QtCore.QModelIndex()
+
+	def hasChildren(self, /, parent:QtCore.QModelIndex) -> bool:
+		return not parent.isValid()
+
+	def columnCount(self, /, parent:QtCore.QModelIndex) -> int:
+
+		if parent.isValid() or not self.sourceModel():
+			return 0
+
+		return self.sourceModel().columnCount(QtCore.QModelIndex())
+
+	def rowCount(self, /, parent:QtCore.QModelIndex) -> int:
+
+		if parent.isValid() or not self.sourceModel():
+			return 0
+
+		if self._source_rows is None:
+			return self.sourceModel().rowCount(QtCore.QModelIndex())
+
+		return len(self._source_rows)
+
+	def index(self, row:int, column:int, /, parent:QtCore.QModelIndex) -> QtCore.QModelIndex:
+
+		source_model = self.sourceModel()
+
+		if parent.isValid() or source_model is None or row < 0 or column < 0:
+			return QtCore.QModelIndex()
+
+		# Called for every row whenever a filter above sifts, so it's kept lean
+		row_count = source_model.rowCount(QtCore.QModelIndex()) if self._source_rows is None else len(self._source_rows)
+
+		if row >= row_count or column >= source_model.columnCount(QtCore.QModelIndex()):
+			return QtCore.QModelIndex()
+
+		return self.createIndex(row, column)
@@ -28,6 +28,16 @@ class BSAbstractSifter(abc.ABC):
 	def isValid(self) -> bool:
 		"""This filter is complete and should be used"""
 
+	def siftRows(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Whether this sifter accepts each of the given rows, one byte (`0` or `1`) per row"""
+
+		return bytes([self.sifterAcceptsIndex(model.index(row, 0, QtCore.QModelIndex())) for row in rows])
+
+	def refines(self, other:"BSAbstractSifter") -> bool:
+		"""Whether every row this sifter accepts is accepted by `other` too, so only those need sifting again"""
+
+		return self == other
+
 	def siftString(self) -> str:
 		"""The user string for which to sift"""
 
@@ -3,6 +3,7 @@ import typing
 import avbutils
 from PySide6 import QtCore
 
+from .. import siftmatchtypes
 from ..siftmatchtypes import BSSiftMatchTypes
 from . import BSAbstractSifter
 
@@ -62,6 +63,83 @@ class BSAnyColumnSifter(BSAbstractSifter):
 					
 		return False
 		
+	def siftRows(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Sift with one substring scan per row over the model's row haystacks, if it has them"""
+
+		if not self._sift_string or self.caseSensitive() or not hasattr(model, "rowsContaining"):
+			return self.siftRowsByColumn(model, rows)
+
+		# Separators around every field mean a field's start, or the whole field, can be found mid-haystack
+		separator = siftmatchtypes.SEARCH_FIELD_SEPARATOR
+
+		if self._match_type == BSSiftMatchTypes.BeginsWith:
+			needle = separator + self._sift_string.casefold()
+
+		elif self._match_type == BSSiftMatchTypes.MatchesExactly:
+			needle = separator + self._sift_string.casefold() + separator
+
+		else:
+			needle = self._sift_string.casefold()
+
+		return model.rowsContaining(needle, rows)
+
+	def siftRowsByColumn(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Sift a column at a time over the model's casefolded column text, if it has it"""
+
+		if not self._sift_string or self.caseSensitive() or not hasattr(model, "columnSearchText"):
+			return super().siftRows(model, rows)
+
+		sift_string = self._sift_string.casefold()
+		accepted    = 0
+
+		for column in self.sift_columns(model):
+
+			if hasattr(model, "rowsMatching"):
+				# Looked up in the column's indexes, where it has them
+				column_matches = model.rowsMatching(sift_string, self._match_type, rows, column)
+
+			elif self._match_type == BSSiftMatchTypes.BeginsWith:
+				column_matches = [text.startswith(sift_string) for text in model.columnSearchText(column, rows)]
+
+			elif self._match_type == BSSiftMatchTypes.MatchesExactly:
+				column_matches = [text == sift_string for text in model.columnSearchText(column, rows)]
+
+			else:
+				column_matches = [sift_string in text for text in model.columnSearchText(column, rows)]
+
+			# Rows as bytes as bits in a big int, so columns are OR'd together in one go
+			accepted |= int.from_bytes(bytes(column_matches))
+
+		return accepted.to_bytes(len(rows))
+
+	def refines(self, other:BSAbstractSifter) -> bool:
+		"""A longer string than `other`'s, found the same way, can only match rows `other` matches"""
+
+		if super().refines(other):
+			return True
+
+		if type(self) is not type(other) or not other.isValid():
+			return False
+
+		if (self.matchType(), self.dataRole(), self.caseSensitive()) != (other.matchType(), other.dataRole(), other.caseSensitive()):
+			return False
+
+		sift_string  = self._sift_string if self.caseSensitive() else self._sift_string.casefold()
+		other_string = other.siftString() if other.caseSensitive() else other.siftString().casefold()
+
+		if self._match_type == BSSiftMatchTypes.Contains:
+			return other_string in sift_string
+
+		elif self._match_type == BSSiftMatchTypes.BeginsWith:
+			return sift_string.startswith(other_string)
+
+		return False
+
+	def sift_columns(self, model:QtCore.QAbstractItemModel) -> list[int]:
+		"""Columns considered for sift"""
+
+		return list(range(model.columnCount(QtCore.QModelIndex())))
+
 	def filter_columns(self, index:QtCore.QModelIndex) -> typing.Generator[QtCore.QModelIndex, None, None]:
 		"""Filter columns considered for sift"""
 
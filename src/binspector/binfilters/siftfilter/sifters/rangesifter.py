@@ -1,4 +1,4 @@
-import dataclasses
+import dataclasses, typing
 
 from PySide6 import QtCore
 from . import BSAbstractSifter
@@ -93,7 +93,6 @@ class BSRangeSifter(BSAbstractSifter):
 		sift_string:str                    = "",
 		data_role  :QtCore.Qt.ItemDataRole = QtCore.Qt.ItemDataRole.DisplayRole,
 	):
-	
 
 		super().__init__(
 			sift_string = sift_string,
@@ -101,6 +100,12 @@ class BSRangeSifter(BSAbstractSifter):
 			data_role   = data_role
 		)
 
+		self._sift_timecode_string = sift_string.strip(":; ")
+		"""Sift string as a timecode, tidied up once"""
+
+		self._sift_timecodes:dict[tuple, timecode.Timecode|None] = {}
+		"""Sift string parsed at each `(rate, mode)` it's been needed at, or `None` if it doesn't parse there"""
+
 	def sifterAcceptsIndex(self, index:QtCore.QModelIndex) -> bool:
 
 		if not index.isValid() or not self._sift_string:
@@ -113,16 +118,44 @@ class BSRangeSifter(BSAbstractSifter):
 		
 		if isinstance(item_range, timecode.TimecodeRange):
 
-			try:
-				# NOTE: Not doing this conversion in __init__ because I'm not sure what item values we'll uncover for now...
+			sift_value = self.siftTimecode(item_range.rate, item_range.mode)
 
-				sift_string_santized = self._sift_string.strip(":; ")
-				sift_value = timecode.Timecode(sift_string_santized, rate=item_range.rate, mode=item_range.mode)
-
-			except Exception as e:
+			if sift_value is None:
 				return False
 			
 			return sift_value in item_range
 		
 		else:
-			raise NotImplementedError(f"** Sift range not yet supported for {repr(item_range)}")
\ No newline at end of file
+			raise NotImplementedError(f"** Sift range not yet supported for {repr(item_range)}")
+
+	def siftRows(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Look up rows with a range containing the sift value in the model's range index, if it can have one"""
+
+		if self._sift_string and hasattr(model, "rowsWithRangeContaining"):
+
+			ranges_containing = model.rowsWithRangeContaining(self._data_role, self.siftFrames, rows)
+
+			if ranges_containing is not None:
+				return ranges_containing
+
+		return super().siftRows(model, rows)
+
+	def siftTimecode(self, rate:typing.Any, mode:typing.Any) -> timecode.Timecode|None:
+		"""The sift string as a timecode at a given rate, or `None` if it isn't one"""
+
+		# NOTE: Not doing this conversion in __init__ because the rate comes from the item, and bins mix rates...
+		if (rate, mode) not in self._sift_timecodes:
+
+			try:
+				self._sift_timecodes[(rate, mode)] = timecode.Timecode(self._sift_timecode_string, rate=rate, mode=mode)
+			except Exception:
+				self._sift_timecodes[(rate, mode)] = None
+
+		return self._sift_timecodes[(rate, mode)]
+
+	def siftFrames(self, rate:typing.Any, mode:typing.Any) -> int|None:
+		"""The sift string as a frame count at a given rate, or `None` if it isn't a timecode"""
+
+		sift_value = self.siftTimecode(rate, mode)
+
+		return sift_value.frame_number if sift_value is not None else None
@@ -48,6 +48,33 @@ class BSSingleColumnSifter(BSAnyColumnSifter):
 
 		raise ValueError(f"Column {self._sift_column_info} not found")
 	
+	def siftRows(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Row haystacks would match any column, so sift the one column's text instead"""
+
+		return self.siftRowsByColumn(model, rows)
+
+	def refines(self, other:BSAnyColumnSifter) -> bool:
+
+		return isinstance(other, BSSingleColumnSifter) and self._sift_column_info == other.siftColumnInfo() and super().refines(other)
+
+	def sift_columns(self, model:QtCore.QAbstractItemModel) -> list[int]:
+		"""Just the column, or none if it isn't there"""
+
+		for col in range(model.columnCount(QtCore.QModelIndex())):
+
+			col_field_id = model.headerData(col, QtCore.Qt.Orientation.Horizontal, binviewitemtypes.BSBinViewColumnInfoRole.FieldIdRole)
+			col_name     = model.headerData(col, QtCore.Qt.Orientation.Horizontal, binviewitemtypes.BSBinViewColumnInfoRole.DisplayNameRole)
+
+			if col_field_id == self._sift_column_info.field_id:
+
+				# User col: Skip if display name also does not match
+				if col_field_id == avbutils.bins.BinColumnFieldIDs.User and col_name != self._sift_column_info.display_name:
+					continue
+
+				return [col]
+
+		return []
+	
 	def siftColumnInfo(self) -> binviewitemtypes.BSBinViewColumnInfo:
 		"""The `BSBinViewColumnInfo` column for which to sift"""
 
@@ -0,0 +1,310 @@
+"""
+Indexes over casefolded search text, to narrow down which rows a sift needs to look at
+
+A `BSTrigramIndex` lists, for every run of three characters, the rows whose text has it.  Any row containing a sift
+string has all of the sift string's trigrams, so only rows listed under every one of them need an actual substring
+check.  Indexes are built in the thread pool; rows added afterwards are appended as they come, and rows whose text
+changes are kept aside as "stale" and always checked, until there are enough of them to build again.
+
+A `BSPrefixIndex` keeps rows sorted by their text, so the rows beginning with or matching a sift string are one range
+of it, found with a binary search.
+
+A `BSFrameRangeIndex` keeps rows' frame ranges in an interval tree per rate, so the rows with a range containing a
+timecode are found without going through every row.
+"""
+
+import array, bisect, collections, logging, time, typing
+from PySide6 import QtCore
+
+TRIGRAM_INDEX_MIN_ROWS:int = 20_000
+"""Just scan fewer rows than this, rather than index them"""
+
+TRIGRAM_INDEX_DELAY_MSEC:int = 1_000
+"""Wait this long after rows are loaded before indexing them, so a load's worth of batches is indexed once"""
+
+TRIGRAM_INDEX_MAX_STALE:float = 0.05
+"""Build an index again once this share of its rows have changed since"""
+
+TRIGRAM_INDEX_MAX_CANDIDATES:float = 0.25
+"""Scan every row instead when even the rarest trigram of a sift string is in more than this share of rows"""
+
+class BSTrigramIndex:
+	"""Rows of text, by the trigrams in them"""
+
+	def __init__(self):
+
+		self._postings:dict[str, array.array] = {}
+		"""Rows having each trigram, in row order"""
+
+		self._row_count = 0
+		"""Rows indexed so far"""
+
+		self._stale_rows:set[int] = set()
+		"""Rows whose text has changed since being indexed"""
+
+	@classmethod
+	def fromTexts(cls, texts:typing.Iterable[str]) -> "BSTrigramIndex":
+		"""Index text for each row"""
+
+		trigram_index = cls()
+		trigram_index.appendRows(texts)
+
+		return trigram_index
+
+	def appendRows(self, texts:typing.Iterable[str]):
+		"""Index text for rows added after the rows already indexed"""
+
+		# Gathered as lists first, which are quicker to append to, then kept as compact arrays
+		new_postings:dict[str, list[int]] = collections.defaultdict(list)
+
+		for row, text in enumerate(texts, start=self._row_count):
+
+			for trigram in {text[idx:idx + 3] for idx in range(len(text) - 2)}:
+				new_postings[trigram].append(row)
+
+			self._row_count = row + 1
+
+		for trigram, rows in new_postings.items():
+
+			if trigram in self._postings:
+				self._postings[trigram].extend(rows)
+			else:
+				self._postings[trigram] = array.array("i", rows)
+
+	def markRowsStale(self, rows:typing.Iterable[int]):
+		"""Text has changed for rows already indexed"""
+
+		self._stale_rows.update(row for row in rows if row < self._row_count)
+
+	def staleRowCount(self) -> int:
+		"""Rows changed since being indexed"""
+
+		return len(self._stale_rows)
+
+	def rowCount(self) -> int:
+		"""Rows indexed"""
+
+		return self._row_count
+
+	def candidateRows(self, needle:str) -> set[int]|None:
+		"""Rows which might contain a string, or `None` if the string is too short to narrow them down"""
+
+		if len(needle) < 3:
+			return None
+
+		postings = []
+
+		for trigram in {needle[idx:idx + 3] for idx in range(len(needle) - 2)}:
+
+			# No row had it when indexed
+			if trigram not in self._postings:
+				return set(self._stale_rows)
+
+			postings.append(self._postings[trigram])
+
+		# Narrow down from the rarest trigram
+		postings.sort(key=len)
+
+		if len(postings[0]) > self._row_count * TRIGRAM_INDEX_MAX_CANDIDATES:
+			return None
+
+		candidates = set(postings[0])
+
+		for posting in postings[1:]:
+
+			# Quicker to check the few rows left than to go through a long list of rows
+			if len(candidates) * 8 < len(posting):
+				break
+
+			candidates.intersection_update(posting)
+
+		return candidates | self._stale_rows
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} at {id(self):#x}: rows={self._row_count} trigrams={len(self._postings)} stale={len(self._stale_rows)}>"
+
+class BSTrigramIndexWorker(QtCore.QRunnable):
+	"""Build a trigram index in a threadpool"""
+
+	class Signals(QtCore.QObject):
+		"""Signals emitted by `BSTrigramIndexWorker`"""
+
+		sig_indexed = QtCore.Signal(object, int, object)
+		"""Index key, build ID and the `BSTrigramIndex`"""
+
+	def __init__(self, signals:Signals, index_key:typing.Hashable, build_id:int, texts:list[str], *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._signals   = signals
+		self._index_key = index_key
+		self._build_id  = build_id
+		self._texts     = texts
+
+	def run(self):
+
+		time_start = time.perf_counter()
+
+		try:
+			trigram_index = BSTrigramIndex.fromTexts(self._texts)
+		except Exception as e:
+			logging.getLogger(__name__).exception("Could not index %s: %s", self._index_key, e)
+			return
+
+		logging.getLogger(__name__).debug("Indexed %s rows for %s in %.3fs", trigram_index.rowCount(), self._index_key, time.perf_counter() - time_start)
+
+		try:
+			self._signals.sig_indexed.emit(self._index_key, self._build_id, trigram_index)
+		except RuntimeError:
+			# The model went away while indexing
+			pass
+
+class BSPrefixIndex:
+	"""Rows of text, sorted by their text"""
+
+	def __init__(self, texts:typing.Sequence[str]):
+
+		self._rows = array.array("i", sorted(range(len(texts)), key=texts.__getitem__))
+		"""Rows in order of their text"""
+
+		self._texts = [texts[row] for row in self._rows]
+		"""Text of each row, in order"""
+
+	def rowsEqualTo(self, text:str) -> array.array:
+		"""Rows with exactly the given text"""
+
+		start = bisect.bisect_left(self._texts, text)
+		end   = bisect.bisect_right(self._texts, text, start)
+
+		return self._rows[start:end]
+
+	def rowsStartingWith(self, prefix:str) -> array.array:
+		"""Rows with text beginning with the given prefix"""
+
+		# Cut down to the length of the prefix, text is still in order, with every match in a row
+		start = bisect.bisect_left(self._texts, prefix)
+		end   = bisect.bisect_right(self._texts, prefix, start, key=lambda text: text[:len(prefix)])
+
+		return self._rows[start:end]
+
+	def rowCount(self) -> int:
+		"""Rows indexed"""
+
+		return len(self._rows)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} at {id(self):#x}: rows={len(self._rows)}>"
+
+class BSIntervalIndex:
+	"""Rows of half-open intervals `[start, end)`, found by the values they contain"""
+
+	def __init__(self, intervals:typing.Iterable[tuple[int, int, int]]):
+		"""Index `(start, end, row)` intervals"""
+
+		self._interval_count = 0
+
+		self._root = self._buildNode([interval for interval in intervals if interval[0] < interval[1]])
+		"""Centered interval tree: `(center, (start, row) ascending, (end, row) descending, left node, right node)`"""
+
+	def _buildNode(self, intervals:list[tuple[int, int, int]]) -> tuple|None:
+
+		if not intervals:
+			return None
+
+		starts = sorted(start for start, _, _ in intervals)
+		center = starts[len(starts) // 2]
+
+		# Intervals over the center stay here; the rest are entirely to one side of it
+		left, right, spanning = [], [], []
+
+		for interval in intervals:
+
+			if interval[1] <= center:
+				left.append(interval)
+			elif interval[0] > center:
+				right.append(interval)
+			else:
+				spanning.append(interval)
+
+		self._interval_count += len(spanning)
+
+		return (
+			center,
+			sorted((start, row) for start, _, row in spanning),
+			sorted(((end, row) for _, end, row in spanning), reverse=True),
+			self._buildNode(left),
+			self._buildNode(right),
+		)
+
+	def rowsContaining(self, value:int) -> list[int]:
+		"""Rows with an interval containing a value"""
+
+		rows = []
+		node = self._root
+
+		while node is not None:
+
+			center, by_start, by_end, left, right = node
+
+			# Everything here contains the center, so it's down to whichever end is on the value's side of it
+			if value < center:
+
+				for start, row in by_start:
+					if start > value:
+						break
+					rows.append(row)
+
+				node = left
+
+			else:
+
+				for end, row in by_end:
+					if end <= value:
+						break
+					rows.append(row)
+
+				node = right
+
+		return rows
+
+	def rowCount(self) -> int:
+		"""Rows indexed"""
+
+		return self._interval_count
+
+class BSFrameRangeIndex:
+	"""Rows of frame ranges at a mix of rates, found by the frame they contain"""
+
+	def __init__(self, starts:typing.Sequence[int], durations:typing.Sequence[int], rates:typing.Sequence[tuple[typing.Any, typing.Any]|None]):
+		"""Index each row's start frame and duration, at its `(rate, mode)` (or `None` for rows without a range)"""
+
+		intervals_by_rate:dict[tuple, list[tuple[int, int, int]]] = collections.defaultdict(list)
+
+		for row, (start, duration, rate) in enumerate(zip(starts, durations, rates)):
+			if rate is not None:
+				intervals_by_rate[rate].append((start, start + duration, row))
+
+		self._interval_indexes = {rate: BSIntervalIndex(intervals) for rate, intervals in intervals_by_rate.items()}
+		"""Interval tree of frame ranges for each `(rate, mode)`"""
+
+	def rowsContaining(self, frames_at_rate:typing.Callable[[typing.Any, typing.Any], int|None]) -> list[int]:
+		"""
+		Rows with a range containing a value
+
+		The same timecode is a different frame count at each rate, so `frames_at_rate(rate, mode)` gives the value at
+		each rate there is, or `None` where it doesn't work out.
+		"""
+
+		rows = []
+
+		for (rate, mode), interval_index in self._interval_indexes.items():
+
+			frames = frames_at_rate(rate, mode)
+
+			if frames is not None:
+				rows.extend(interval_index.rowsContaining(frames))
+
+		return rows
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} at {id(self):#x}: rates={ {rate: index.rowCount() for rate, index in self._interval_indexes.items()} }>"
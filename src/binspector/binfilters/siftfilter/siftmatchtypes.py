@@ -15,4 +15,7 @@ class BSSiftMatchTypes(enum.IntEnum):
 	"""Column begins with a given string"""
  
 	MatchesExactly = 3
-	"""Column matches exactly a given string"""
\ No newline at end of file
+	"""Column matches exactly a given string"""
+
+SEARCH_FIELD_SEPARATOR:str = "\x1f"
+"""Goes between and around the fields of a row's search haystack, so a match can't run from one field into the next"""
@@ -0,0 +1,83 @@
+"""
+Sift criteria compiled down to a predicate over whole ranges of rows
+
+Rather than asking every sifter about every row, each sifter sifts a range of rows at once into a bitmap: one byte
+(`0` or `1`) per row.  Bitmaps are combined as big ints, so the and/or logic costs next to nothing.
+"""
+
+import typing
+from PySide6 import QtCore
+
+from . import sifters
+
+class BSSiftPredicate:
+	"""Sift criteria, compiled for sifting ranges of rows"""
+
+	def __init__(self, sift_criteria:list[list[sifters.BSAbstractSifter]]):
+
+		# Criterion without a sift string set is considered invalid and neither True nor False,
+		# and a set of only those doesn't count either way
+		self._criteria_sets = [
+			[criterion for criterion in criteria_set if criterion.isValid()]
+			for criteria_set in sift_criteria or []
+		]
+
+		self._criteria_sets = [criteria_set for criteria_set in self._criteria_sets if criteria_set]
+
+	def isActive(self) -> bool:
+		"""Whether this predicate would reject anything at all"""
+
+		return bool(self._criteria_sets)
+
+	def siftRows(self, model:QtCore.QAbstractItemModel, rows:typing.Sequence[int]) -> bytes:
+		"""Whether each of the given rows passes the sift, one byte (`0` or `1`) per row"""
+
+		all_rows = int.from_bytes(b"\x01" * len(rows))
+
+		if not self._criteria_sets:
+			return all_rows.to_bytes(len(rows))
+
+		# Sift Criteria is a list of lists of "and" criterion, each "and" list then compared with "or."
+		accepted = 0
+
+		for criteria_set in self._criteria_sets:
+
+			set_accepted = all_rows
+
+			for criterion in criteria_set:
+
+				if not set_accepted:
+					break
+
+				set_accepted &= int.from_bytes(criterion.siftRows(model, rows))
+
+			accepted |= set_accepted
+
+			if accepted == all_rows:
+				break
+
+		return accepted.to_bytes(len(rows))
+
+	def refines(self, other:"BSSiftPredicate") -> bool:
+		"""Whether every row this predicate accepts is accepted by `other` too, say as the user types a longer string"""
+
+		if not other.isActive():
+			return True
+
+		if [len(criteria_set) for criteria_set in self._criteria_sets] != [len(criteria_set) for criteria_set in other._criteria_sets]:
+			return False
+
+		# Each criterion accepting fewer rows means each "and" set does, and so all of them "or"'d together do
+		return all(
+			criterion.refines(other_criterion)
+			for criteria_set, other_set in zip(self._criteria_sets, other._criteria_sets)
+			for criterion, other_criterion in zip(criteria_set, other_set)
+		)
+
+	def __repr__(self) -> str:
+		return f"<{self.__class__.__name__} at {id(self):#x}: criteria={self._criteria_sets}>"
+
+def compile_sift_criteria(sift_criteria:list[list[sifters.BSAbstractSifter]]|None) -> BSSiftPredicate:
+	"""Compile sift criteria into a predicate"""
+
+	return BSSiftPredicate(sift_criteria or [])
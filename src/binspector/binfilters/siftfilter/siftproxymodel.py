@@ -1,7 +1,7 @@
-import logging, typing
+import dataclasses, itertools, logging, typing
 from PySide6 import QtCore
 
-from .  import sifters
+from .  import sifters, siftmatchtypes, siftpredicate
 from .. import abstractfiltermodel
 from ...binview import binviewitemtypes
 
@@ -10,6 +10,24 @@ import avbutils
 SiftCriteria:typing.TypeAlias = list[list[sifters.BSAbstractSifter]]
 """A list lists of `and` criteria, each to be compared with `or`"""
 
+SIFT_CHUNK_ROWS:int = 20_000
+"""Rows sifted at a time for a requested sift, before letting other events (say, more typing) through"""
+
+@dataclasses.dataclass
+class BSPendingSift:
+	"""Requested sift criteria, being sifted a chunk of rows at a time"""
+
+	sift_criteria:SiftCriteria
+	sift_predicate:siftpredicate.BSSiftPredicate
+
+	rows:typing.Sequence[int]
+	"""Source rows to sift: every row, or just those the current criteria accept if the new ones refine them"""
+
+	accepted_rows:bytearray
+	"""Whether each source row passes the sift, so far"""
+
+	rows_sifted:int = 0
+
 class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxyModel):
 
 	DEFAULT_CRITERIA:SiftCriteria = [[sifters.BSAnyColumnSifter()]*3]*2
@@ -25,6 +43,26 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 		super().__init__(*args, **kwargs)
 		
 		self._sift_criteria = sift_criteria or list(self.DEFAULT_CRITERIA)
+		self._sift_predicate = siftpredicate.compile_sift_criteria(self._sift_criteria)
+
+		self._accepted_rows:bytearray|None = None
+		"""Whether each source row passes the sift, one byte per row.  Worked out for every row at once when first needed."""
+
+		self._source_rows:list[int]|None = None
+		"""Source row for each proxy row, for passing column text along to the next filter"""
+
+		self._pending_sift:BSPendingSift|None = None
+		"""Sift criteria requested with `requestSiftCriteria()`, still being sifted"""
+
+		self._pending_sift_timer = QtCore.QTimer(self)
+		self._pending_sift_timer.setSingleShot(True)
+		self._pending_sift_timer.setInterval(0)
+		self._pending_sift_timer.timeout.connect(self.siftPendingRows)
+
+		self.rowsInserted .connect(self._clearSourceRows)
+		self.rowsRemoved  .connect(self._clearSourceRows)
+		self.layoutChanged.connect(self._clearSourceRows)
+		self.modelReset   .connect(self._clearSourceRows)
 
 		# NOTE to self:  Live Sift does two things:
 		# - Toggle dynamic filter here in the proxy so it responds to changes in data
@@ -41,10 +79,25 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 		if self.sourceModel():
 			self.sourceModel().disconnect(self)
 
+		# Connected ahead of the base class, so accepted rows are up to date by the time it asks
+		source_model.rowsInserted           .connect(self.sourceRowsInserted)
+		source_model.rowsRemoved            .connect(self.sourceRowsRemoved)
+		source_model.dataChanged            .connect(self.sourceDataChanged)
+		source_model.layoutChanged          .connect(self.invalidateAcceptedRows)
+		source_model.rowsMoved              .connect(self.invalidateAcceptedRows)
+		source_model.columnsInserted        .connect(self.invalidateAcceptedRows)
+		source_model.columnsMoved           .connect(self.invalidateAcceptedRows)
+
 		source_model.columnsAboutToBeRemoved.connect(self.sourceColumnsAboutToBeRemoved)
 		source_model.modelReset             .connect(self.sourceModelReset)
 		
 		return super().setSourceModel(source_model)
+
+	def sort(self, column:int, order:QtCore.Qt.SortOrder=QtCore.Qt.SortOrder.AscendingOrder):
+		"""Leave sorting to the source model, which sorts all the rows once rather than what each filter lets through"""
+
+		if self.sourceModel():
+			self.sourceModel().sort(column, order)
 	
 	@QtCore.Slot(QtCore.QModelIndex, int, int)
 	def sourceColumnsAboutToBeRemoved(self, source_parent:QtCore.QModelIndex, first:int, last:int):
@@ -112,12 +165,103 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 					validated_criterion_set.append(modified_criterion)
 
 			validated_sift_criteria.append(validated_criterion_set)
+
+		pending_sift = self._pending_sift
 		
 		self.setSiftCriteria(validated_sift_criteria)
 
+		# Columns are changing under a requested sift, so start it over
+		if pending_sift is not None:
+			self.requestSiftCriteria(pending_sift.sift_criteria)
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsInserted(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		# Sift just the new rows
+		if self._accepted_rows is not None:
+			self._accepted_rows[first:first] = self._sift_predicate.siftRows(self.sourceModel(), range(first, last + 1))
+
+		self._restartPendingSift()
+
+	@QtCore.Slot(QtCore.QModelIndex, int, int)
+	def sourceRowsRemoved(self, parent:QtCore.QModelIndex, first:int, last:int):
+
+		if self._accepted_rows is not None:
+			del self._accepted_rows[first:last + 1]
+
+		self._restartPendingSift()
+
+	@QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+	def sourceDataChanged(self, top_left:QtCore.QModelIndex, bottom_right:QtCore.QModelIndex, roles:list[int]=[]):
+
+		if self._accepted_rows is not None:
+			self._accepted_rows[top_left.row():bottom_right.row() + 1] = self._sift_predicate.siftRows(self.sourceModel(), range(top_left.row(), bottom_right.row() + 1))
+
+		self._restartPendingSift()
+
+	@QtCore.Slot()
+	def invalidateAcceptedRows(self):
+		"""Sift every row again next time it's needed"""
+
+		self._accepted_rows = None
+		self._restartPendingSift()
+
+	def acceptedRows(self) -> bytearray:
+		"""Whether each source row passes the sift, one byte (`0` or `1`) per row"""
+
+		row_count = self.sourceModel().rowCount(QtCore.QModelIndex())
+
+		if self._accepted_rows is None or len(self._accepted_rows) != row_count:
+			self._accepted_rows = bytearray(self._sift_predicate.siftRows(self.sourceModel(), range(row_count)))
+
+		return self._accepted_rows
+
+	@QtCore.Slot()
+	def _clearSourceRows(self):
+		self._source_rows = None
+
+	def columnSearchText(self, column:int, rows:typing.Sequence[int]) -> list[str]:
+		"""Casefolded display text of a column for the given rows, for sifting"""
+
+		return self.sourceModel().columnSearchText(column, self._mapRowsToSource(rows))
+
+	def rowSearchHaystacks(self, rows:typing.Sequence[int]) -> list[str]:
+		"""Casefolded display text of every column for the given rows, for Find in Bin"""
+
+		return self.sourceModel().rowSearchHaystacks(self._mapRowsToSource(rows))
+
+	def rowsContaining(self, needle:str, rows:typing.Sequence[int], column:int|None=None) -> bytes:
+		"""Whether the search text of each of the given rows contains a casefolded string, in a column or any column"""
+
+		return self.sourceModel().rowsContaining(needle, self._mapRowsToSource(rows), column)
+
+	def rowsMatching(self, sift_string:str, match_type:siftmatchtypes.BSSiftMatchTypes, rows:typing.Sequence[int], column:int) -> bytes:
+		"""Whether a column's search text matches a casefolded string for each of the given rows"""
+
+		return self.sourceModel().rowsMatching(sift_string, match_type, self._mapRowsToSource(rows), column)
+
+	def rowsWithRangeContaining(self, range_role:QtCore.Qt.ItemDataRole, frames_at_rate:typing.Callable[[typing.Any, typing.Any], int|None], rows:typing.Sequence[int]) -> bytes|None:
+		"""Whether each of the given rows has a range containing a value, or `None` if it can't be looked up"""
+
+		return self.sourceModel().rowsWithRangeContaining(range_role, frames_at_rate, self._mapRowsToSource(rows))
+
+	def _mapRowsToSource(self, rows:typing.Sequence[int]) -> typing.Sequence[int]:
+
+		# Rows are only ever in source order here (see `sort()`), so all rows are the same rows
+		if self.rowCount(QtCore.QModelIndex()) == self.sourceModel().rowCount(QtCore.QModelIndex()):
+			return rows
+
+		if self._source_rows is None:
+			self._source_rows = [self.mapToSource(self.index(row, 0, QtCore.QModelIndex())).row() for row in range(self.rowCount(QtCore.QModelIndex()))]
+
+		return [self._source_rows[row] for row in rows]
+
 	@QtCore.Slot()
 	def sourceModelReset(self):
 
+		self._accepted_rows = None
+		pending_sift = self._pending_sift
+
 		# Ensure sift criteria references columns that exist
 
 		validated_sift_criteria:SiftCriteria = []
@@ -148,6 +292,10 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 		
 		self.setSiftCriteria(validated_sift_criteria)
 
+		# Rows were all replaced under a requested sift, so start it over
+		if pending_sift is not None:
+			self.requestSiftCriteria(pending_sift.sift_criteria)
+
 	def criterionReferencesAvailableColumn(self,
 		criterion        :sifters.BSAbstractSifter,
 		columns_available:list[tuple[avbutils.bins.BinColumnFieldIDs, str]]|None=None
@@ -212,6 +360,8 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 	@QtCore.Slot(object)
 	def setSiftCriteria(self, criteria:SiftCriteria):
 
+		self._cancelPendingSift()
+
 		if not criteria:
 			criteria = list(self.DEFAULT_CRITERIA)
 
@@ -220,14 +370,118 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 			logging.getLogger(__name__).debug("Sift critera unchanged")
 			return
 
+		sift_predicate = siftpredicate.compile_sift_criteria(criteria)
+		refined_rows   = self._refinedRows(sift_predicate)
+
+		if refined_rows is None:
+			accepted_rows = None
+
+		else:
+			# Only rows accepted already can pass, so leave the rest be
+			accepted_rows = bytearray(len(self._accepted_rows))
+
+			for row in itertools.compress(refined_rows, sift_predicate.siftRows(self.sourceModel(), refined_rows)):
+				accepted_rows[row] = 1
+
+		self._applySiftCriteria(criteria, sift_predicate, accepted_rows)
+
+	@QtCore.Slot(object)
+	def requestSiftCriteria(self, criteria:SiftCriteria):
+		"""
+		Sift by new criteria a chunk of rows at a time in between other events, applying them once every row is sifted
+
+		Meant for sifting as the user types:  a newer request (or `setSiftCriteria()`) cancels one still being sifted,
+		and criteria refining the current ones only sift the rows already accepted.
+		"""
+
+		self._cancelPendingSift()
+
+		if not criteria:
+			criteria = list(self.DEFAULT_CRITERIA)
+
+		if self._sift_criteria == criteria:
+			return
+
+		sift_predicate = siftpredicate.compile_sift_criteria(criteria)
+
+		# Nothing to sift
+		if self.sourceModel() is None or not sift_predicate.isActive():
+			self.setSiftCriteria(criteria)
+			return
+
+		row_count    = self.sourceModel().rowCount(QtCore.QModelIndex())
+		refined_rows = self._refinedRows(sift_predicate)
+
+		self._pending_sift = BSPendingSift(
+			sift_criteria  = criteria,
+			sift_predicate = sift_predicate,
+			rows           = refined_rows if refined_rows is not None else range(row_count),
+			accepted_rows  = bytearray(row_count),
+		)
+
+		self._pending_sift_timer.start()
+
+	@QtCore.Slot()
+	def siftPendingRows(self):
+		"""Sift the next chunk of rows for the requested criteria, and apply them once that's all of them"""
+
+		pending_sift = self._pending_sift
+
+		if pending_sift is None:
+			return
+
+		rows = pending_sift.rows[pending_sift.rows_sifted:pending_sift.rows_sifted + SIFT_CHUNK_ROWS]
+
+		for row in itertools.compress(rows, pending_sift.sift_predicate.siftRows(self.sourceModel(), rows)):
+			pending_sift.accepted_rows[row] = 1
+
+		pending_sift.rows_sifted += len(rows)
+
+		if pending_sift.rows_sifted < len(pending_sift.rows):
+			self._pending_sift_timer.start()
+			return
+
+		self._pending_sift = None
+		self._applySiftCriteria(pending_sift.sift_criteria, pending_sift.sift_predicate, pending_sift.accepted_rows)
+
+	def _applySiftCriteria(self, criteria:SiftCriteria, sift_predicate:siftpredicate.BSSiftPredicate, accepted_rows:bytearray|None):
+		"""Filter by new criteria, already sifted for every row if `accepted_rows` is given"""
+
 		self.beginFilterChange()
-		self._sift_criteria = criteria
+		self._sift_criteria  = criteria
+		self._sift_predicate = sift_predicate
+		self._accepted_rows  = accepted_rows
 		self.endFilterChange(QtCore.QSortFilterProxyModel.Direction.Rows)
 		
 		logging.getLogger(__name__).debug("Sift criteria changed: %s", self._sift_criteria)
 
 		self.sig_criteria_changed.emit(self._sift_criteria)
 
+	def _refinedRows(self, sift_predicate:siftpredicate.BSSiftPredicate) -> list[int]|None:
+		"""Source rows accepted now, if a new predicate can only accept some of them.  `None` if every row needs sifting."""
+
+		if self.sourceModel() is None or self._accepted_rows is None or not self._sift_predicate.isActive():
+			return None
+
+		if len(self._accepted_rows) != self.sourceModel().rowCount(QtCore.QModelIndex()):
+			return None
+
+		if not sift_predicate.isActive() or not sift_predicate.refines(self._sift_predicate):
+			return None
+
+		return list(itertools.compress(range(len(self._accepted_rows)), self._accepted_rows))
+
+	def _cancelPendingSift(self):
+
+		self._pending_sift_timer.stop()
+		self._pending_sift = None
+
+	def _restartPendingSift(self):
+		"""Rows changed under a requested sift, so start it over"""
+
+		if self._pending_sift is not None:
+			self.requestSiftCriteria(self._pending_sift.sift_criteria)
+
 	def siftCriteria(self) -> SiftCriteria:
 
 		return self._sift_criteria
@@ -247,47 +501,14 @@ class BSBinSiftFilterProxyModel(abstractfiltermodel.BSAbstractBinSortFilterProxy
 		if not self.isEnabled():
 			return True
 		
-		if not self._sift_criteria:
+		if not self._sift_predicate.isActive():
 			return True
-		
-		source_index = self.sourceModel().index(source_row, 0, QtCore.QModelIndex())
 
-		sift_results = []
-
-		# TODO: Yeah, yeah.  I'll come back to this.
-		# IT WORKS THOUGH DOESN'T IT?? HUH??  Or maybe it doesn't, 
-		# if you're reading this.
-
-		# Sift Criteria is a list of lists of "and" criterion
-		# Each "and" list result is then compared with "or."
-		# So "Match this, this, and this; or this, this, and this."
-		
-		# Criterion without a sift string set is considered invalid 
-		# and neither True nor False.  Otherwise it janks up the sift 
-		# boolean logic.
-
-		for criteria_set in self._sift_criteria:
-
-			local_results = []
-			
-			for criteria in criteria_set:
-
-				# Invalid filters can be neither True nor False soooo
-				if not criteria.isValid():
-					continue
-
-				accepted = criteria.sifterAcceptsIndex(source_index)
-
-				local_results.append(accepted)
-
-				if not accepted: # ngmi
-					break
-			
-			if local_results:
-				
-				if all(local_results): # We got em, fellas.
-					return True
+		# Sift criteria are compiled to a predicate that sifts all the rows in one go, 
+		# so each row here is just a look-up
+		accepted_rows = self._accepted_rows
 
-				sift_results.append(all(local_results))
+		if accepted_rows is None or source_row >= len(accepted_rows):
+			accepted_rows = self.acceptedRows()
 
-		return any(sift_results) if sift_results else True
\ No newline at end of file
+		return bool(accepted_rows[source_row])
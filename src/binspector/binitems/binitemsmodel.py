@@ -1,12 +1,16 @@
 
-import typing
+import array, bisect, collections, math, typing
 from PySide6 import QtCore
-from avbutils import bins
+import avbutils
 
-from . import binitemtypes
+from . import binitemtypes, binitemstore
+from ..core import binparser
 
-type BSBinItemModelEntry = dict[bins.BinColumnFieldIDs, binitemtypes.BSAbstractViewItem]
-"""Each bin item in the model is a dict of BinColumnFieldID and respective view item pairs"""
+type BSBinItemModelEntry = binitemtypes.BSBinItemRecord
+"""Each bin item comes into the model as a parsed record, and is stored by column"""
+
+VIEW_ITEMS_CACHE_ROWS:int = 5_000
+"""Rows to hold on to built view items for.  Any others are rebuilt from the columns when next asked for."""
 
 class BSBinItemModel(QtCore.QAbstractItemModel):
 	"""Single-column item model for bin items"""
@@ -15,7 +19,12 @@ class BSBinItemModel(QtCore.QAbstractItemModel):
 
 		super().__init__(*args, **kwargs)
 
-		self._bin_items:list[binitemtypes.BSBinItemInfo] = []
+		self._bin_items = binitemstore.BSBinItemStore()
+		self._view_items:collections.OrderedDict[int, binitemtypes.BSLazyViewItems] = collections.OrderedDict()
+
+		# Incremental reload state
+		self._merge_rows_by_mob_id:dict[bytes, collections.deque[int]]|None = None
+		self._merge_seen_rows:set[int] = set()
 
 	def rowCount(self, /, parent:QtCore.QModelIndex) -> int:
 		"""Number of bin items"""
@@ -52,33 +61,33 @@ class BSBinItemModel(QtCore.QAbstractItemModel):
 		if not index.isValid():
 			return None
 		
-		bin_item = self._bin_items[index.row()]
+		row = index.row()
 		
 		# Map specialized BinItemDataRoles to their avbutils counterparts
 
 		if role == binitemtypes.BSBinItemDataRoles.ItemNameRole:
-			return bin_item.view_items.get(bins.BinColumnFieldIDs.Name).raw_data()
+			return self._bin_items.name(row)
 				
 		elif role == binitemtypes.BSBinItemDataRoles.ClipColorRole:
-			return bin_item.view_items.get(bins.BinColumnFieldIDs.Color).raw_data()
+			return self._bin_items.clipColor(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.ItemTypesRole:
-			return bin_item.view_items.get(bins.BinColumnFieldIDs.BinItemIcon).raw_data()
+			return self._bin_items.itemType(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.ViewItemsRole:
-			return bin_item.view_items
+			return self.viewItems(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.MobID:
-			return bin_item.mob_id
+			return self._bin_items.mobId(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.FrameCoordinatesRole:
-			return bin_item.frame_coordinates
+			return self._bin_items.frameCoordinates(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.FrameThumbnailRole:
-			return bin_item.keyframe_offset
+			return self._bin_items.keyframeOffset(row)
 		
 		elif role == binitemtypes.BSBinItemDataRoles.TimecodeRangeRole:
-			return bin_item.primary_timecode
+			return self._bin_items.timecodeRange(row)
 
 #		NOTE: I don't remember why this would be here and it would need work anyway
 #
@@ -96,6 +105,149 @@ class BSBinItemModel(QtCore.QAbstractItemModel):
 #			# NOTE: Maybe rethink
 #			return self._getUserColumnItem(index, user_column_name="Comments", role=QtCore.Qt.ItemDataRole.DisplayRole)
 
+	def viewItems(self, row:int) -> binitemtypes.BSLazyViewItems:
+		"""View items for a row, built from its columns if they aren't already cached"""
+
+		view_items = self._view_items.get(row)
+
+		if view_items is not None:
+			self._view_items.move_to_end(row)
+			return view_items
+
+		view_items = binparser.item_info_from_record(self._bin_items.record(row)).view_items
+		self._view_items[row] = view_items
+
+		if len(self._view_items) > VIEW_ITEMS_CACHE_ROWS:
+			self._view_items.popitem(last=False)
+
+		return view_items
+
+	def columnSortKeys(self, field_id:int, field_name:str|None=None) -> list[tuple]|None:
+		"""
+		Sort keys for a field for every row, worked out from the columns rather than from view items
+
+		Keys match what the field's view items give for `InitialSortOrderRole`.  Returns `None` for fields that
+		aren't kept as a column, which need their view items built instead.
+		"""
+
+		store  = self._bin_items
+		fields = avbutils.bins.BinColumnFieldIDs
+
+		def string_keys(column:array.array, to_text:typing.Callable[[typing.Any], str]) -> list[tuple]:
+
+			# Each distinct string only needs its collation key worked out once
+			keys_by_id = {}
+			strings    = store.strings()
+			sort_keys  = []
+
+			for string_id in column:
+
+				sort_key = keys_by_id.get(string_id)
+
+				if sort_key is None:
+					sort_key = binitemtypes.text_sort_key(to_text(strings.value(string_id))) if string_id != binitemstore.NO_VALUE else binitemtypes.EMPTY_SORT_KEY
+					keys_by_id[string_id] = sort_key
+
+				sort_keys.append(sort_key)
+
+			return sort_keys
+
+		def frame_keys(frames_column:binitemstore.BSBinItemColumn, rate_column:binitemstore.BSBinItemColumn) -> list[tuple]:
+
+			return [
+				binitemtypes.number_sort_key(frames) if rate_code != binitemstore.NO_VALUE else binitemtypes.EMPTY_SORT_KEY
+				for frames, rate_code in zip(store.column(frames_column), store.column(rate_column))
+			]
+
+		def date_keys(column:binitemstore.BSBinItemColumn) -> list[tuple]:
+
+			return [
+				binitemtypes.number_sort_key(round(timestamp * 1000)) if not math.isnan(timestamp) else binitemtypes.EMPTY_SORT_KEY
+				for timestamp in store.column(column)
+			]
+
+		if field_id == fields.User or field_id in binparser.USER_ATTRIBUTE_FIELDS:
+
+			attribute_name = field_name if field_id == fields.User else binparser.USER_ATTRIBUTE_FIELDS[field_id]
+			user_column    = store.userColumn(attribute_name)
+
+			if user_column is None:
+				return [binitemtypes.EMPTY_SORT_KEY] * len(store)
+
+			return string_keys(user_column, str)
+
+		elif field_id == fields.Name:
+			return string_keys(store.column(binitemstore.BSBinItemColumn.NAME), str)
+
+		elif field_id == fields.Tracks:
+			return string_keys(store.column(binitemstore.BSBinItemColumn.TRACK_LABELS), str)
+
+		elif field_id == fields.Tape:
+			return string_keys(store.column(binitemstore.BSBinItemColumn.TAPE_NAME), lambda value: value or "")
+
+		elif field_id == fields.Drive:
+			return string_keys(store.column(binitemstore.BSBinItemColumn.SOURCE_DRIVE), lambda value: value or "")
+
+		elif field_id == fields.SourceFile:
+			return string_keys(store.column(binitemstore.BSBinItemColumn.SOURCE_FILE_NAME), lambda value: value or "")
+
+		elif field_id == fields.Start:
+			return frame_keys(binitemstore.BSBinItemColumn.TC_START, binitemstore.BSBinItemColumn.TC_RATE)
+
+		elif field_id == fields.Duration:
+			return frame_keys(binitemstore.BSBinItemColumn.TC_DURATION, binitemstore.BSBinItemColumn.TC_RATE)
+
+		elif field_id == fields.MarkIn:
+			return frame_keys(binitemstore.BSBinItemColumn.MARK_IN, binitemstore.BSBinItemColumn.MARK_IN_RATE)
+
+		elif field_id == fields.MarkOut:
+			return frame_keys(binitemstore.BSBinItemColumn.MARK_OUT, binitemstore.BSBinItemColumn.MARK_OUT_RATE)
+
+		elif field_id == fields.CreationDate:
+			return date_keys(binitemstore.BSBinItemColumn.CREATION_TIME)
+
+		elif field_id == fields.ModifiedDate:
+			return date_keys(binitemstore.BSBinItemColumn.LAST_MODIFIED)
+
+		elif field_id == fields.BinItemIcon:
+			return [binitemtypes.number_sort_key(item_type) for item_type in store.column(binitemstore.BSBinItemColumn.ITEM_TYPE)]
+
+		elif field_id == fields.Color:
+
+			keys_by_color = {}
+
+			for row, packed_color in enumerate(store.column(binitemstore.BSBinItemColumn.CLIP_COLOR)):
+				if packed_color not in keys_by_color:
+					keys_by_color[packed_color] = binitemtypes.color_sort_key(store.clipColor(row))
+
+			return [keys_by_color[packed_color] for packed_color in store.column(binitemstore.BSBinItemColumn.CLIP_COLOR)]
+
+		return None
+
+	def frameRanges(self, role:binitemtypes.BSBinItemDataRoles) -> tuple[array.array, array.array, list[tuple|None]]|None:
+		"""
+		Start frame, duration and `(rate, mode)` of a range for every row, from the columns rather than from each range
+
+		Rows without a range get `None` for their rate.  Returns `None` for ranges that aren't kept as columns.
+		"""
+
+		store = self._bin_items
+
+		if role == binitemtypes.BSBinItemDataRoles.TimecodeRangeRole:
+
+			return (
+				store.column(binitemstore.BSBinItemColumn.TC_START),
+				store.column(binitemstore.BSBinItemColumn.TC_DURATION),
+				[store.rates().value(rate_code) if rate_code != binitemstore.NO_VALUE else None for rate_code in store.column(binitemstore.BSBinItemColumn.TC_RATE)],
+			)
+
+		return None
+
+	def itemStore(self) -> binitemstore.BSBinItemStore:
+		"""The columns behind the model, for working over every row at once.  Don't modify it."""
+
+		return self._bin_items
+
 	@QtCore.Slot(object)
 	def addBinItem(self, bin_item:BSBinItemModelEntry):
 		"""Add a bin item and its properties to the model"""
@@ -104,7 +256,26 @@ class BSBinItemModel(QtCore.QAbstractItemModel):
 
 	@QtCore.Slot(object)
 	def addBinItems(self, bin_items:typing.Iterable[BSBinItemModelEntry]):
-		"""Add bin items and their properties to the model"""
+		"""Add bin items and their properties to the model, in bin order where their place in the bin is known"""
+
+		if not bin_items:
+			return
+
+		# Items loaded ahead of the rest (say, the ones on screen) go in above the rest as they arrive.
+		# Insert bottom-up, so rows for the runs above are still where they were worked out to be.
+		for row, run_items in reversed(self._insertionRuns(bin_items)):
+
+			self.beginInsertRows(QtCore.QModelIndex(), row, row + len(run_items) - 1)
+
+			if row < len(self._bin_items):
+				self._view_items.clear()
+
+			self._bin_items.insert(row, run_items)
+
+			self.endInsertRows()
+
+	def _appendBinItems(self, bin_items:typing.Iterable[BSBinItemModelEntry]):
+		"""Add bin items to the end of the model, wherever they are in the bin"""
 
 		start_row = self.rowCount(QtCore.QModelIndex())
 		end_row   = start_row + len(bin_items)-1
@@ -115,12 +286,125 @@ class BSBinItemModel(QtCore.QAbstractItemModel):
 
 		self.endInsertRows()
 
+	def _insertionRuns(self, bin_items:typing.Iterable[BSBinItemModelEntry]) -> list[tuple[int, list[BSBinItemModelEntry]]]:
+		"""Bin items grouped by the row they go in at, top down: after the rows from earlier in the bin, or at the end if unknown"""
+
+		bin_indexes = self._bin_items.column(binitemstore.BSBinItemColumn.BIN_INDEX)
+		row_count   = len(self._bin_items)
+		last_index  = bin_indexes[-1] if row_count else binitemstore.NO_VALUE
+		runs:list[tuple[int, list[BSBinItemModelEntry]]] = []
+
+		for bin_item in sorted(bin_items, key=lambda bin_item: (bin_item.bin_index is None, bin_item.bin_index or 0)):
+
+			if bin_item.bin_index is None or bin_item.bin_index > last_index:
+				row = row_count
+			else:
+				row = bisect.bisect_right(bin_indexes, bin_item.bin_index)
+
+			if runs and runs[-1][0] == row:
+				runs[-1][1].append(bin_item)
+			else:
+				runs.append((row, [bin_item]))
+
+		return runs
+
+	def isMerging(self) -> bool:
+		"""An incremental reload is in progress"""
+
+		return self._merge_rows_by_mob_id is not None
+
+	@QtCore.Slot()
+	def beginMerge(self):
+		"""Begin an incremental reload, matching incoming bin items to existing rows by mob ID"""
+
+		self._merge_rows_by_mob_id = collections.defaultdict(collections.deque)
+		self._merge_seen_rows      = set()
+
+		for row in range(len(self._bin_items)):
+			self._merge_rows_by_mob_id[self._bin_items.mobIdKey(row)].append(row)
+
+	@QtCore.Slot(object)
+	def mergeBinItems(self, bin_items:typing.Iterable[BSBinItemModelEntry]):
+		"""Update changed rows and append new ones.  Unchanged rows are left alone."""
+
+		if not self.isMerging():
+			self.addBinItems(bin_items)
+			return
+
+		changed_rows = []
+		new_items    = []
+
+		for bin_item in bin_items:
+
+			existing_rows = self._merge_rows_by_mob_id.get(binitemstore.mob_id_key(bin_item.mob_id))
+
+			if not existing_rows:
+				new_items.append(bin_item)
+				continue
+
+			row = existing_rows.popleft()
+			self._merge_seen_rows.add(row)
+
+			if self._bin_items.record(row) != bin_item:
+				self._bin_items.replace(row, bin_item)
+				self._view_items.pop(row, None)
+				changed_rows.append(row)
+
+		for row_start, row_end in self._contiguousRanges(changed_rows):
+			self.dataChanged.emit(self.index(row_start, 0, QtCore.QModelIndex()), self.index(row_end, 0, QtCore.QModelIndex()))
+
+		if new_items:
+
+			# New rows are appended, so they'll never be matched against
+			start_row = len(self._bin_items)
+			self._appendBinItems(new_items)
+			self._merge_seen_rows.update(range(start_row, start_row + len(new_items)))
+
+	@QtCore.Slot()
+	@QtCore.Slot(bool)
+	def endMerge(self, remove_unmatched:bool=True):
+		"""Finish an incremental reload, removing any existing rows that weren't matched"""
+
+		if not self.isMerging():
+			return
+
+		unmatched_rows = [row for row in range(len(self._bin_items)) if row not in self._merge_seen_rows] if remove_unmatched else []
+
+		self._merge_rows_by_mob_id = None
+		self._merge_seen_rows      = set()
+
+		# Remove from the bottom up so earlier ranges stay valid
+		for row_start, row_end in reversed(self._contiguousRanges(unmatched_rows)):
+
+			self.beginRemoveRows(QtCore.QModelIndex(), row_start, row_end)
+			self._bin_items.removeRows(row_start, row_end)
+			self._view_items.clear()
+			self.endRemoveRows()
+
+	@staticmethod
+	def _contiguousRanges(rows:list[int]) -> list[tuple[int,int]]:
+		"""Collapse rows into (start, end) ranges"""
+
+		ranges = []
+
+		for row in sorted(rows):
+
+			if ranges and ranges[-1][1] == row - 1:
+				ranges[-1] = (ranges[-1][0], row)
+			else:
+				ranges.append((row, row))
+
+		return ranges
+
 	@QtCore.Slot()
 	def clear(self):
 		"""Clear and reset the bin items model"""
 
 		self.beginResetModel()
 		
-		self._bin_items = []
+		self._bin_items.clear()
+		self._view_items.clear()
+		self._merge_rows_by_mob_id = None
+		self._merge_seen_rows      = set()
 		
 		self.endResetModel()
\ No newline at end of file
@@ -0,0 +1,451 @@
+"""
+Columnar storage for bin items
+
+Rather than an object per bin item (each with its own dict of view items), every field is kept in one compact
+array for the whole bin: frame counts and a rate code for timecodes, ids into a shared intern table for strings,
+packed flags for item types, RGB ints for clip colors.  Anything richer is rebuilt from the columns as it's asked for.
+"""
+
+import array, datetime, enum, math, sys, typing
+import avb, avbutils
+from timecode import Timecode, TimecodeRange
+from PySide6 import QtGui
+
+from . import binitemtypes
+
+NO_VALUE:int = -1
+"""Stands in for `None` in integer columns"""
+
+MOB_ID_SIZE:int = 32
+"""Bytes per packed `MobID`"""
+
+class BSBinItemColumn(enum.StrEnum):
+	"""Columns kept by `BSBinItemStore`"""
+
+	NAME             = "name"
+	"""String id of the item name"""
+
+	ITEM_TYPE        = "item_type"
+	"""`BinDisplayItemTypes` flags, as an int"""
+
+	CLIP_COLOR       = "clip_color"
+	"""Clip color as 16-bit-per-channel RGB packed into an int, or `NO_VALUE`"""
+
+	FRAME_X          = "frame_x"
+	FRAME_Y          = "frame_y"
+
+	KEYFRAME_OFFSET  = "keyframe_offset"
+
+	TRACK_LABELS     = "track_labels"
+	"""String id of the track labels"""
+
+	TC_START         = "tc_start"
+	"""Start of the item's timecode range, in frames"""
+
+	TC_DURATION      = "tc_duration"
+	"""Duration of the item's timecode range, in frames"""
+
+	TC_RATE          = "tc_rate"
+	"""Rate code of the item's timecode range, or `NO_VALUE` if it has none"""
+
+	MARK_IN          = "mark_in"
+	MARK_IN_RATE     = "mark_in_rate"
+	MARK_OUT         = "mark_out"
+	MARK_OUT_RATE    = "mark_out_rate"
+
+	LAST_MODIFIED    = "last_modified"
+	"""POSIX timestamp, or NaN"""
+
+	CREATION_TIME    = "creation_time"
+	"""POSIX timestamp, or NaN"""
+
+	TAPE_NAME        = "tape_name"
+	"""String id of the tape name"""
+
+	SOURCE_DRIVE     = "source_drive"
+	"""String id of the source drive"""
+
+	SOURCE_FILE_NAME = "source_file_name"
+	"""String id of the source file name"""
+
+	BIN_INDEX        = "bin_index"
+	"""Position of the item in the bin, or `NO_VALUE` if not known"""
+
+class BSInternTable:
+	"""Hands out a small int id for each distinct value, so a value shared by many rows is only stored once"""
+
+	__slots__ = ("_values", "_ids")
+
+	def __init__(self):
+
+		self._values:list[typing.Hashable]     = []
+		self._ids   :dict[typing.Hashable,int] = {}
+
+	def intern(self, value:typing.Hashable) -> int:
+		"""The id for a value, adding it if it's new"""
+
+		value_id = self._ids.get(value)
+
+		if value_id is None:
+			value_id = len(self._values)
+			self._ids[value] = value_id
+			self._values.append(value)
+
+		return value_id
+
+	def lookup(self, value:typing.Hashable) -> int|None:
+		"""The id for a value, or `None` if it has never been interned"""
+
+		return self._ids.get(value)
+
+	def value(self, value_id:int) -> typing.Any:
+		return self._values[value_id]
+
+	def values(self) -> list[typing.Hashable]:
+		"""Every interned value, indexed by id.  Don't modify it."""
+
+		return self._values
+
+	def clear(self):
+
+		self._values = []
+		self._ids    = {}
+
+	def __len__(self) -> int:
+		return len(self._values)
+
+def mob_id_key(mob_id:avb.mobid.MobID) -> bytes:
+	"""Packed form of a `MobID`, as stored and as used for lookups"""
+
+	return bytes(mob_id.bytes_le)
+
+class BSBinItemStore:
+	"""Parsed bin items, stored a column at a time"""
+
+	def __init__(self):
+
+		self._strings     = BSInternTable()
+		"""Names, track labels, tapes, drives, file names, and user attribute keys and values"""
+
+		self._rates       = BSInternTable()
+		"""Distinct `(rate, mode)` pairs used by timecodes, indexed by rate code"""
+
+		self._mob_ids     = bytearray()
+
+		self._columns:dict[BSBinItemColumn, array.array] = {}
+		self._user_columns:dict[int, array.array]        = {}
+		"""String id of each user attribute key, to the string id of its value for each row (or `NO_VALUE`)"""
+
+		self._markers:dict[int, avbutils.markers.MarkerInfo] = {}
+		"""Markers by row.  Few items have them, so these are kept sparse."""
+
+		self._clip_colors:dict[int, avbutils.compositions.ClipColor] = {}
+		"""One `ClipColor` per packed RGB value, to hand back in records"""
+
+		self._qcolors:dict[int, QtGui.QColor] = {}
+
+		self.clear()
+
+	def clear(self):
+		"""Remove every row"""
+
+		self._strings.clear()
+		self._rates.clear()
+		self._mob_ids = bytearray()
+
+		self._columns = {
+			BSBinItemColumn.NAME:             array.array("i"),
+			BSBinItemColumn.ITEM_TYPE:        array.array("I"),
+			BSBinItemColumn.CLIP_COLOR:       array.array("q"),
+			BSBinItemColumn.FRAME_X:          array.array("d"),
+			BSBinItemColumn.FRAME_Y:          array.array("d"),
+			BSBinItemColumn.KEYFRAME_OFFSET:  array.array("q"),
+			BSBinItemColumn.TRACK_LABELS:     array.array("i"),
+			BSBinItemColumn.TC_START:         array.array("q"),
+			BSBinItemColumn.TC_DURATION:      array.array("q"),
+			BSBinItemColumn.TC_RATE:          array.array("h"),
+			BSBinItemColumn.MARK_IN:          array.array("q"),
+			BSBinItemColumn.MARK_IN_RATE:     array.array("h"),
+			BSBinItemColumn.MARK_OUT:         array.array("q"),
+			BSBinItemColumn.MARK_OUT_RATE:    array.array("h"),
+			BSBinItemColumn.LAST_MODIFIED:    array.array("d"),
+			BSBinItemColumn.CREATION_TIME:    array.array("d"),
+			BSBinItemColumn.TAPE_NAME:        array.array("i"),
+			BSBinItemColumn.SOURCE_DRIVE:     array.array("i"),
+			BSBinItemColumn.SOURCE_FILE_NAME: array.array("i"),
+			BSBinItemColumn.BIN_INDEX:        array.array("i"),
+		}
+
+		self._user_columns = {}
+		self._markers      = {}
+		self._clip_colors  = {}
+		self._qcolors      = {}
+
+	def __len__(self) -> int:
+		return len(self._mob_ids) // MOB_ID_SIZE
+
+	# Columns
+
+	def column(self, column:BSBinItemColumn) -> array.array:
+		"""A whole column, for working over every row at once.  Don't modify it."""
+
+		return self._columns[column]
+
+	def userColumn(self, attribute_name:str) -> array.array|None:
+		"""String ids of a user attribute's value for each row, or `None` if no item has the attribute"""
+
+		key_id = self._strings.lookup(attribute_name)
+		return self._user_columns.get(key_id) if key_id is not None else None
+
+	def strings(self) -> BSInternTable:
+		"""The intern table string ids refer to"""
+
+		return self._strings
+
+	def rates(self) -> BSInternTable:
+		"""The `(rate, mode)` pairs rate codes refer to"""
+
+		return self._rates
+
+	def byteCount(self) -> int:
+		"""Rough memory used by the columns and intern tables"""
+
+		byte_count  = len(self._mob_ids)
+		byte_count += sum(column.buffer_info()[1] * column.itemsize for column in self._columns.values())
+		byte_count += sum(column.buffer_info()[1] * column.itemsize for column in self._user_columns.values())
+		byte_count += sum(sys.getsizeof(value) for value in self._strings.values())
+
+		return byte_count
+
+	# Adding and removing rows
+
+	def extend(self, records:typing.Iterable[binitemtypes.BSBinItemRecord]):
+		"""Append records as new rows"""
+
+		for record in records:
+			self.append(record)
+
+	def append(self, record:binitemtypes.BSBinItemRecord):
+		"""Append a record as a new row"""
+
+		row = len(self)
+		self._mob_ids += mob_id_key(record.mob_id)
+
+		for column, value in self._encode(record).items():
+			self._columns[column].append(value)
+
+		for user_column in self._user_columns.values():
+			user_column.append(NO_VALUE)
+
+		self._setUserAttributes(row, record.user_attributes)
+		self._setMarker(row, record.marker)
+
+	def insert(self, row:int, records:typing.Sequence[binitemtypes.BSBinItemRecord]):
+		"""Insert records as new rows, the first of them at `row`"""
+
+		if row >= len(self):
+			self.extend(records)
+			return
+
+		inserted_count = len(records)
+		encoded        = [self._encode(record) for record in records]
+
+		self._mob_ids[row * MOB_ID_SIZE:row * MOB_ID_SIZE] = b"".join(mob_id_key(record.mob_id) for record in records)
+
+		for column, values in self._columns.items():
+			values[row:row] = array.array(values.typecode, [encoded_values[column] for encoded_values in encoded])
+
+		for user_column in self._user_columns.values():
+			user_column[row:row] = array.array("i", [NO_VALUE]) * inserted_count
+
+		self._markers = {
+			existing_row + inserted_count if existing_row >= row else existing_row: marker
+			for existing_row, marker in self._markers.items()
+		}
+
+		for inserted_row, record in enumerate(records, start=row):
+			self._setUserAttributes(inserted_row, record.user_attributes)
+			self._setMarker(inserted_row, record.marker)
+
+	def replace(self, row:int, record:binitemtypes.BSBinItemRecord):
+		"""Overwrite a row with a new record"""
+
+		self._mob_ids[row * MOB_ID_SIZE:(row + 1) * MOB_ID_SIZE] = mob_id_key(record.mob_id)
+
+		for column, value in self._encode(record).items():
+			self._columns[column][row] = value
+
+		for user_column in self._user_columns.values():
+			user_column[row] = NO_VALUE
+
+		self._setUserAttributes(row, record.user_attributes)
+		self._setMarker(row, record.marker)
+
+	def removeRows(self, first:int, last:int):
+		"""Remove rows `first` through `last`, inclusive"""
+
+		del self._mob_ids[first * MOB_ID_SIZE:(last + 1) * MOB_ID_SIZE]
+
+		for column in self._columns.values():
+			del column[first:last + 1]
+
+		for user_column in self._user_columns.values():
+			del user_column[first:last + 1]
+
+		removed_count = last - first + 1
+		self._markers = {
+			row if row < first else row - removed_count: marker
+			for row, marker in self._markers.items() if not first <= row <= last
+		}
+
+	def _encode(self, record:binitemtypes.BSBinItemRecord) -> dict[BSBinItemColumn, int|float]:
+		"""Column values for a record (user attributes and markers aside)"""
+
+		timecode_range = record.timecode_range
+
+		return {
+			BSBinItemColumn.NAME:             self._strings.intern(record.name),
+			BSBinItemColumn.ITEM_TYPE:        record.item_type.value,
+			BSBinItemColumn.CLIP_COLOR:       self._encodeClipColor(record.clip_color),
+			BSBinItemColumn.FRAME_X:          record.frame_coordinates[0],
+			BSBinItemColumn.FRAME_Y:          record.frame_coordinates[1],
+			BSBinItemColumn.KEYFRAME_OFFSET:  record.keyframe_offset,
+			BSBinItemColumn.TRACK_LABELS:     self._strings.intern(record.track_labels),
+			BSBinItemColumn.TC_START:         timecode_range.start.frame_number if timecode_range else 0,
+			BSBinItemColumn.TC_DURATION:      timecode_range.duration.frame_number if timecode_range else 0,
+			BSBinItemColumn.TC_RATE:          self._rates.intern((timecode_range.rate, timecode_range.mode)) if timecode_range else NO_VALUE,
+			BSBinItemColumn.MARK_IN:          record.mark_in.frame_number if record.mark_in else 0,
+			BSBinItemColumn.MARK_IN_RATE:     self._rates.intern((record.mark_in.rate, record.mark_in.mode)) if record.mark_in else NO_VALUE,
+			BSBinItemColumn.MARK_OUT:         record.mark_out.frame_number if record.mark_out else 0,
+			BSBinItemColumn.MARK_OUT_RATE:    self._rates.intern((record.mark_out.rate, record.mark_out.mode)) if record.mark_out else NO_VALUE,
+			BSBinItemColumn.LAST_MODIFIED:    record.last_modified.timestamp() if record.last_modified else math.nan,
+			BSBinItemColumn.CREATION_TIME:    record.creation_time.timestamp() if record.creation_time else math.nan,
+			BSBinItemColumn.TAPE_NAME:        self._strings.intern(record.tape_name),
+			BSBinItemColumn.SOURCE_DRIVE:     self._strings.intern(record.source_drive),
+			BSBinItemColumn.SOURCE_FILE_NAME: self._strings.intern(record.source_file_name),
+			BSBinItemColumn.BIN_INDEX:        record.bin_index if record.bin_index is not None else NO_VALUE,
+		}
+
+	def _encodeClipColor(self, clip_color:avbutils.compositions.ClipColor|None) -> int:
+
+		if clip_color is None:
+			return NO_VALUE
+
+		red, green, blue = clip_color.as_rgb16()
+		packed_color     = (red << 32) | (green << 16) | blue
+
+		self._clip_colors.setdefault(packed_color, clip_color)
+		return packed_color
+
+	def _setUserAttributes(self, row:int, user_attributes:dict[str,str]):
+
+		for attribute_name, attribute_value in user_attributes.items():
+
+			key_id = self._strings.intern(attribute_name)
+
+			if key_id not in self._user_columns:
+				self._user_columns[key_id] = array.array("i", [NO_VALUE]) * len(self)
+
+			self._user_columns[key_id][row] = self._strings.intern(attribute_value)
+
+	def _setMarker(self, row:int, marker:avbutils.markers.MarkerInfo|None):
+
+		if marker is None:
+			self._markers.pop(row, None)
+		else:
+			self._markers[row] = marker
+
+	# Reading rows
+
+	def mobIdKey(self, row:int) -> bytes:
+		"""Packed `MobID` for a row (see `mob_id_key()`)"""
+
+		return bytes(self._mob_ids[row * MOB_ID_SIZE:(row + 1) * MOB_ID_SIZE])
+
+	def mobId(self, row:int) -> avb.mobid.MobID:
+		return avb.mobid.MobID(bytes_le=self.mobIdKey(row))
+
+	def name(self, row:int) -> str:
+		return self._strings.value(self._columns[BSBinItemColumn.NAME][row])
+
+	def itemType(self, row:int) -> avbutils.bins.BinDisplayItemTypes:
+		return avbutils.bins.BinDisplayItemTypes(self._columns[BSBinItemColumn.ITEM_TYPE][row])
+
+	def clipColor(self, row:int) -> QtGui.QColor:
+		"""Clip color for a row (an invalid `QColor` if it has none)"""
+
+		packed_color = self._columns[BSBinItemColumn.CLIP_COLOR][row]
+
+		if packed_color == NO_VALUE:
+			return QtGui.QColor()
+
+		if packed_color not in self._qcolors:
+			self._qcolors[packed_color] = QtGui.QColor.fromRgba64((packed_color >> 32) & 0xFFFF, (packed_color >> 16) & 0xFFFF, packed_color & 0xFFFF)
+
+		return QtGui.QColor(self._qcolors[packed_color])
+
+	def frameCoordinates(self, row:int) -> tuple[float,float]:
+		return (self._columns[BSBinItemColumn.FRAME_X][row], self._columns[BSBinItemColumn.FRAME_Y][row])
+
+	def keyframeOffset(self, row:int) -> int:
+		return self._columns[BSBinItemColumn.KEYFRAME_OFFSET][row]
+
+	def timecodeRange(self, row:int) -> TimecodeRange|None:
+
+		start = self._timecode(BSBinItemColumn.TC_START, BSBinItemColumn.TC_RATE, row)
+
+		if start is None:
+			return None
+
+		return TimecodeRange(start=start, duration=self._columns[BSBinItemColumn.TC_DURATION][row])
+
+	def binIndex(self, row:int) -> int|None:
+		bin_index = self._columns[BSBinItemColumn.BIN_INDEX][row]
+		return bin_index if bin_index != NO_VALUE else None
+
+	def userAttributes(self, row:int) -> dict[str,str]:
+
+		return {
+			self._strings.value(key_id): self._strings.value(user_column[row])
+			for key_id, user_column in self._user_columns.items() if user_column[row] != NO_VALUE
+		}
+
+	def _timecode(self, frames_column:BSBinItemColumn, rate_column:BSBinItemColumn, row:int) -> Timecode|None:
+
+		rate_code = self._columns[rate_column][row]
+
+		if rate_code == NO_VALUE:
+			return None
+
+		rate, mode = self._rates.value(rate_code)
+		return Timecode(self._columns[frames_column][row], rate=rate, mode=mode)
+
+	@staticmethod
+	def _datetime(timestamp:float) -> datetime.datetime|None:
+		return datetime.datetime.fromtimestamp(timestamp) if not math.isnan(timestamp) else None
+
+	def record(self, row:int) -> binitemtypes.BSBinItemRecord:
+		"""Rebuild the record for a row"""
+
+		packed_color = self._columns[BSBinItemColumn.CLIP_COLOR][row]
+
+		return binitemtypes.BSBinItemRecord(
+			mob_id            = self.mobId(row),
+			item_type         = self.itemType(row),
+			name              = self.name(row),
+			clip_color        = self._clip_colors.get(packed_color) if packed_color != NO_VALUE else None,
+			frame_coordinates = self.frameCoordinates(row),
+			keyframe_offset   = self.keyframeOffset(row),
+			track_labels      = self._strings.value(self._columns[BSBinItemColumn.TRACK_LABELS][row]),
+			timecode_range    = self.timecodeRange(row),
+			mark_in           = self._timecode(BSBinItemColumn.MARK_IN, BSBinItemColumn.MARK_IN_RATE, row),
+			mark_out          = self._timecode(BSBinItemColumn.MARK_OUT, BSBinItemColumn.MARK_OUT_RATE, row),
+			last_modified     = self._datetime(self._columns[BSBinItemColumn.LAST_MODIFIED][row]),
+			creation_time     = self._datetime(self._columns[BSBinItemColumn.CREATION_TIME][row]),
+			marker            = self._markers.get(row),
+			tape_name         = self._strings.value(self._columns[BSBinItemColumn.TAPE_NAME][row]),
+			source_drive      = self._strings.value(self._columns[BSBinItemColumn.SOURCE_DRIVE][row]),
+			source_file_name  = self._strings.value(self._columns[BSBinItemColumn.SOURCE_FILE_NAME][row]),
+			user_attributes   = self.userAttributes(row),
+			bin_index         = self.binIndex(row),
+		)
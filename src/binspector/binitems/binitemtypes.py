@@ -1,25 +1,100 @@
 from __future__ import annotations
-import typing, enum, datetime, os, dataclasses
+import typing, enum, datetime, os, dataclasses, threading, weakref
+from collections import abc
 import avbutils, avb
 from timecode import Timecode, TimecodeRange
 from PySide6 import QtCore, QtGui, QtWidgets
-from functools import singledispatch
+from functools import cache, singledispatch
 
 #from binspector.binitems import binitemtypes
 
+@dataclasses.dataclass(frozen=True)
+class BSBinItemRecord:
+	"""Plain parsed data for a given mob, before any view items are built (picklable between processes)"""
+
+	mob_id            :avb.mobid.MobID
+	item_type         :avbutils.bins.BinDisplayItemTypes
+	name              :str
+	clip_color        :avbutils.compositions.ClipColor|None
+	frame_coordinates :tuple[float,float]
+	keyframe_offset   :int
+	track_labels      :str|None
+	timecode_range    :TimecodeRange|None
+	mark_in           :Timecode|None
+	mark_out          :Timecode|None
+	last_modified     :datetime.datetime
+	creation_time     :datetime.datetime
+	marker            :avbutils.markers.MarkerInfo|None
+	tape_name         :str|None
+	source_drive      :str|None
+	source_file_name  :str|None
+	user_attributes   :dict[str,str]
+	bin_index         :int|None = dataclasses.field(default=None, compare=False) # Position in the bin, if known (not compared)
+
 @dataclasses.dataclass(frozen=True)
 class BSBinItemInfo:
 	"""Bin item info for a given mob"""
 
 	mob_id            :avb.mobid.MobID
 	item_type         :avbutils.bins.BinDisplayItemTypes
-	tracks            :set[avb.trackgroups.Track]
+	track_labels      :str|None
 	primary_timecode  :TimecodeRange|None
 	clip_color        :avbutils.compositions.ClipColor|None
 	name              :str
-	frame_coordinates :tuple[int,int]
+	frame_coordinates :tuple[float,float]
 	keyframe_offset   :int
-	view_items        :dict[int,BSAbstractViewItem|dict[str,BSAbstractViewItem]] # Field ID -> ViewItem or 40 -> dict[term,def]
+	view_items        :BSLazyViewItems # Field ID -> ViewItem or 40 -> dict[term,def]
+
+class BSLazyViewItems(abc.Mapping):
+	"""Read-only mapping of keys to view items, holding raw values and building each view item on first access"""
+
+	__slots__ = ("_raw_values", "_factories", "_default_factory", "_view_items")
+
+	def __init__(self, raw_values:dict[typing.Any, typing.Any], factories:dict[typing.Any, typing.Callable[[typing.Any], BSAbstractViewItem|BSLazyViewItems]]|None=None, default_factory:typing.Callable[[typing.Any], BSAbstractViewItem]|None=None):
+
+		self._raw_values      = raw_values
+		self._factories       = factories or {}
+		self._default_factory = default_factory or get_viewitem_for_item
+		self._view_items      = None
+
+	def __getitem__(self, key) -> BSAbstractViewItem|BSLazyViewItems:
+
+		if self._view_items is not None and key in self._view_items:
+			return self._view_items[key]
+
+		raw_value = self._raw_values[key]
+		view_item = self._factories.get(key, self._default_factory)(raw_value)
+
+		if self._view_items is None:
+			self._view_items = {}
+
+		self._view_items[key] = view_item
+		return view_item
+
+	def __contains__(self, key) -> bool:
+		return key in self._raw_values
+
+	def __iter__(self) -> typing.Iterator:
+		return iter(self._raw_values)
+
+	def __len__(self) -> int:
+		return len(self._raw_values)
+	
+	def __eq__(self, other) -> bool:
+		
+		# Compare raw values rather than building view items to compare
+		if not isinstance(other, BSLazyViewItems):
+			return NotImplemented
+		
+		return self._raw_values == other._raw_values and self._factories == other._factories and self._default_factory == other._default_factory
+
+	def raw_value(self, key) -> typing.Any:
+		"""The raw value for a key, without building its view item"""
+		return self._raw_values[key]
+
+	def materialized_count(self) -> int:
+		"""Number of view items built so far"""
+		return len(self._view_items) if self._view_items is not None else 0
 
 class BSBinItemDataRoles(enum.IntEnum):
 	"""Item Data Roles for Bin Items (extends `QtCore.Qt.ItemDataRole`)"""
@@ -95,46 +170,166 @@ class BSBinItemDataRoles(enum.IntEnum):
 
 	
 
+ALIGN_RIGHT = QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter
+"""Alignment for numbers and dates"""
+
+_UNSET = object()
+
+class BSSortKeyKind(enum.IntEnum):
+	"""Leads off every sort key, so keys of different kinds are never compared head to head (and blanks sort first)"""
+
+	EMPTY  = 0
+	NUMBER = 1
+	COLOR  = 2
+	TEXT   = 3
+
+EMPTY_SORT_KEY:tuple = (BSSortKeyKind.EMPTY,)
+"""Sort key for blank values"""
+
+_collators = threading.local()
+
+def sort_collator() -> QtCore.QCollator:
+	"""Collator for text sort keys: numeric, case-insensitive.  One per thread, since collators aren't thread-safe."""
+
+	collator = getattr(_collators, "collator", None)
+
+	if collator is None:
+		collator = QtCore.QCollator()
+		collator.setNumericMode(True)
+		collator.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+		_collators.collator = collator
+	
+	return collator
+
+def text_sort_key(text:str) -> tuple:
+	return (BSSortKeyKind.TEXT, sort_collator().sortKey(text)) if text else EMPTY_SORT_KEY
+
+def number_sort_key(number:int|float|None) -> tuple:
+	return (BSSortKeyKind.NUMBER, number) if number is not None else EMPTY_SORT_KEY
+
+def color_sort_key(color:QtGui.QColor) -> tuple:
+	return (BSSortKeyKind.COLOR, color.getRgb()[:3]) if color.isValid() else EMPTY_SORT_KEY
+
+def sort_keys_equal(sort_key:typing.Any, other:typing.Any) -> bool:
+	"""Whether two sort keys (or tuples of them) sort the same.  Collator sort keys are never `==` unless they're the same object, so those go by `compare()`."""
+
+	if sort_key == other:
+		return True
+
+	if isinstance(sort_key, tuple) and isinstance(other, tuple):
+		return len(sort_key) == len(other) and all(map(sort_keys_equal, sort_key, other))
+
+	if isinstance(sort_key, QtCore.QCollatorSortKey) and isinstance(other, QtCore.QCollatorSortKey):
+		return sort_key.compare(other) == 0
+
+	return False
+
+@cache
+def fixed_font_family() -> str:
+	"""The system's fixed-width font family, looked up once (needs a `QGuiApplication`)"""
+	return QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont).family()
+
+@cache
+def file_icon_provider() -> QtWidgets.QFileIconProvider:
+	"""Icon provider shared by every path item (needs a `QApplication`)"""
+	return QtWidgets.QFileIconProvider()
+
 class BSAbstractViewItem:
-	"""An abstract view item for bin item models"""
+	"""
+	An abstract view item for bin item models
+
+	Items hold their raw data and work out each role as it's asked for, from the class's `ROLE_METHODS` and
+	`SHARED_ROLES`.  Only the display text and sort key are kept, since they're asked for on every paint and every sort.
+	"""
+
+	__slots__ = ("_data", "_icon", "_tooltip", "_display", "_sort_key", "_role_overrides", "__weakref__")
+
+	ROLE_METHODS:typing.ClassVar[dict[QtCore.Qt.ItemDataRole, str]] = {
+		QtCore.Qt.ItemDataRole.DisplayRole:          "displayData",
+		QtCore.Qt.ItemDataRole.ToolTipRole:          "toolTipData",
+		QtCore.Qt.ItemDataRole.DecorationRole:       "decorationData",
+		QtCore.Qt.ItemDataRole.InitialSortOrderRole: "sortKey",
+		QtCore.Qt.ItemDataRole.UserRole:             "userData",
+	}
+	"""Roles worked out per item, and the name of the method that works each one out"""
+
+	SHARED_ROLES:typing.ClassVar[dict[QtCore.Qt.ItemDataRole, typing.Any]] = {}
+	"""Roles with the same data for every item of the class"""
 
 	def __init__(self, raw_data:typing.Any, icon:QtGui.QIcon|None=None, tooltip:QtWidgets.QToolTip|str|None=None):
 
-		self._data = raw_data
-		self._icon = icon
+		self._data    = raw_data
+		self._icon    = icon
 		self._tooltip = tooltip
 
-		self._data_roles = {}
-		self._prepare_data()
-	
-	def _prepare_data(self):
-		"""Precalculate them datas for all them roles"""
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self.to_string(self._data),
-			QtCore.Qt.ItemDataRole.ToolTipRole:          self._tooltip if self._tooltip is not None else repr(self._data),
-			QtCore.Qt.ItemDataRole.DecorationRole:       self._icon,
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data),	# QCollator just compares strings
-			QtCore.Qt.ItemDataRole.UserRole:             self,
-		})
+		self._display        = _UNSET
+		self._sort_key       = _UNSET
+		self._role_overrides = None
+	
+	def displayData(self) -> typing.Any:
+		return self.to_string(self._data)
+	
+	def toolTipData(self) -> typing.Any:
+		return self._tooltip if self._tooltip is not None else repr(self._data)
+	
+	def decorationData(self) -> typing.Any:
+		return self._icon
+	
+	def sortData(self) -> tuple:
+		"""Native sort key (see `BSSortKeyKind`), compared as-is rather than as a string"""
+		return text_sort_key(self.to_string(self._data))
+	
+	def sortKey(self) -> tuple:
+		"""Sort key for `InitialSortOrderRole`, worked out once"""
+
+		if self._sort_key is _UNSET:
+			self._sort_key = self.sortData()
+		
+		return self._sort_key
+	
+	def userData(self) -> typing.Any:
+		return self
+
 	def raw_data(self) -> typing.Any:
 		"""Get the original data for this item in its original format"""
 		return self._data
 
 	def data(self, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 		"""Get item data for a given role.  By default, returns the raw data as a string."""
-		return self._data_roles.get(role, None)
+
+		if self._role_overrides is not None and role in self._role_overrides:
+			return self._role_overrides[role]
+		
+		if role in self.SHARED_ROLES:
+			return self.SHARED_ROLES[role]
+		
+		if role == QtCore.Qt.ItemDataRole.DisplayRole and QtCore.Qt.ItemDataRole.DisplayRole in self.ROLE_METHODS:
+
+			if self._display is _UNSET:
+				self._display = self.displayData()
+			
+			return self._display
+		
+		method_name = self.ROLE_METHODS.get(role)
+		return getattr(self, method_name)() if method_name is not None else None
 	
 	def setData(self, role:QtCore.Qt.ItemDataRole, data:typing.Any):
 		"""Override data for a particular role"""
-		self._data_roles[role] = data
+
+		if self._role_overrides is None:
+			self._role_overrides = {}
+		
+		self._role_overrides[role] = data
 	
 	def itemData(self) -> dict[QtCore.Qt.ItemDataRole, typing.Any]:
 		"""Get all item data roles"""
-		return self._data_roles
+
+		roles = {**self.ROLE_METHODS, **self.SHARED_ROLES, **(self._role_overrides or {})}
+		return {role: self.data(role) for role in roles}
 	
-	def to_json(self) -> str:
-		"""Format as JSON object"""
-		return self.data(QtCore.Qt.ItemDataRole.DisplayRole)
+	def to_json(self) -> typing.Any:
+		"""Format as JSON object (from the raw data, so no data roles need to be worked out)"""
+		return self.to_string(self._data)
 	
 	@classmethod
 	def to_string(cls, data:typing.Any) -> str:
@@ -143,12 +338,10 @@ class BSAbstractViewItem:
 class BSStringViewItem(BSAbstractViewItem):
 	"""A standard string"""
 
-	def _prepare_data(self):
-		super()._prepare_data()
+	__slots__ = ()
 
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: self.format_single_line(self.to_string(self._data)),
-		})
+	def displayData(self) -> str:
+		return self.format_single_line(self.to_string(self._data))
 
 	def format_single_line(self, input_string:str):
 		
@@ -164,39 +357,51 @@ class BSStringViewItem(BSAbstractViewItem):
 class BSEnumViewItem(BSAbstractViewItem):
 	"""Represents an Enum"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:enum.Enum, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
-
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DecorationRole:       self._data,
-			QtCore.Qt.ItemDataRole.DisplayRole:          self._data.name.replace("_", " ").title(),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data.value),
-		})
+	def displayData(self) -> str:
+		return self._data.name.replace("_", " ").title()
+	
+	def decorationData(self) -> enum.Enum:
+		return self._data
+	
+	def sortData(self) -> tuple:
+		value = self._data.value
+		return number_sort_key(value) if isinstance(value, (int, float)) else text_sort_key(self.to_string(value))
+	
+	def to_json(self) -> str:
+		return self._data.name.replace("_", " ").title()
 	
 class BSNumericViewItem(BSAbstractViewItem):
 	"""A numeric value"""
 
+	__slots__ = ()
+
 	STRING_PADDING:int = 0
 	"""Left-side padding for string formatting"""
 
+	ROLE_METHODS = BSAbstractViewItem.ROLE_METHODS | {
+		QtCore.Qt.ItemDataRole.FontRole: "fontData",
+	}
+
+	SHARED_ROLES = {
+		QtCore.Qt.ItemDataRole.TextAlignmentRole: ALIGN_RIGHT,
+	}
+
 	def __init__(self, raw_data:int, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
-
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self.to_string(self._data),
-			#QtCore.Qt.ItemDataRole.InitialSortOrderRole: self._data,
-			QtCore.Qt.ItemDataRole.FontRole:             QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.SystemFont.FixedFont).family(),
-			QtCore.Qt.ItemDataRole.TextAlignmentRole:    QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter,
-		})
+	def fontData(self) -> str:
+		return fixed_font_family()
 	
-	def to_json(self) -> int:
-		return self.data(QtCore.Qt.ItemDataRole.UserRole) # NOTE to self: need to change this to access item's _data
+	def sortData(self) -> tuple:
+		return number_sort_key(self._data) if isinstance(self._data, (int, float)) else super().sortData()
+	
+	def to_json(self) -> int|float:
+		return self._data
 	
 	@classmethod
 	def to_string(cls, data):
@@ -205,25 +410,35 @@ class BSNumericViewItem(BSAbstractViewItem):
 class BSPathViewItem(BSAbstractViewItem):
 	"""A file path"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:str|QtCore.QFileInfo):
 		super().__init__(QtCore.QFileInfo(raw_data))
 	
-	def _prepare_data(self):
-		super()._prepare_data()
-
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self._data.fileName(),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self._data.fileName(),
-			QtCore.Qt.ItemDataRole.DecorationRole:       QtWidgets.QFileIconProvider().icon(self._data),
-			QtCore.Qt.ItemDataRole.ToolTipRole:          QtCore.QDir.toNativeSeparators(self._data.absoluteFilePath()),
-		})
+	def displayData(self) -> str:
+		return self._data.fileName()
+	
+	def sortData(self) -> tuple:
+		return text_sort_key(self._data.fileName())
+	
+	def decorationData(self) -> QtGui.QIcon:
+		return file_icon_provider().icon(self._data)
+	
+	def toolTipData(self) -> str:
+		return QtCore.QDir.toNativeSeparators(self._data.absoluteFilePath())
 	
 	def to_json(self) -> str:
-		return QtCore.QDir.toNativeSeparators(self.data(QtCore.Qt.ItemDataRole.UserRole).absoluteFilePath())
+		return QtCore.QDir.toNativeSeparators(self._data.absoluteFilePath())
 
 class BSDateTimeViewItem(BSAbstractViewItem):
 	"""A datetime entry"""
 
+	__slots__ = ("_format_string",)
+
+	SHARED_ROLES = {
+		QtCore.Qt.ItemDataRole.TextAlignmentRole: ALIGN_RIGHT,
+	}
+
 	def __init__(self, raw_data:datetime.datetime, format_string:QtCore.Qt.DateFormat|str=QtCore.Qt.DateFormat.TextDate):
 		
 		self._format_string = format_string
@@ -233,59 +448,51 @@ class BSDateTimeViewItem(BSAbstractViewItem):
 	def setFormatString(self, format_string:str):
 		"""Set the datetime formatting string used by strftime"""
 		self._format_string = format_string
-		self._data_roles.update()
+		self._display       = _UNSET # Re-format on next access
 	
 	def formatString(self) -> str:
 		"""The datetime formatting string used by strftime"""
 		return self._format_string
 
-	def _prepare_data(self):
-		super()._prepare_data()
+	def displayData(self) -> str:
+		return self._data.toString(self._format_string)
 	
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:          self._data.toString(self._format_string),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: str(self._data.toMSecsSinceEpoch()),
-			QtCore.Qt.ItemDataRole.TextAlignmentRole:    QtCore.Qt.AlignmentFlag.AlignRight|QtCore.Qt.AlignmentFlag.AlignVCenter,
-		})
+	def sortData(self) -> tuple:
+		return number_sort_key(self._data.toMSecsSinceEpoch()) if self._data.isValid() else EMPTY_SORT_KEY
 	
 	def to_json(self) -> dict:
 		return {
 			"type": "datetime",
-			"timestamp": self.data(QtCore.Qt.ItemDataRole.UserRole).timestamp(),
-			"formatted": self.data(QtCore.Qt.ItemDataRole.DisplayRole)
+			"timestamp": self._data.toSecsSinceEpoch(),
+			"formatted": self._data.toString(self._format_string)
 		}
 
 class BSTimecodeViewItem(BSNumericViewItem):
 	"""A timecode"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:Timecode, *args, **kwargs):
 		if not isinstance(raw_data, Timecode):
 			raise TypeError("Data must be an instance of `Timecode`")
 		super().__init__(raw_data, *args, **kwargs)
 	
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: str(self._data.frame_number),
-		})
+	def sortData(self) -> tuple:
+		return number_sort_key(self._data.frame_number)
 	
 	def to_json(self) -> dict:
-		tc = self.data(QtCore.Qt.ItemDataRole.UserRole)
+		tc = self._data
 		return {
 			"type": "timecode",
 			"frames": tc.frame_number,
 			"rate": tc.rate,
-			"formatted": self.data(QtCore.Qt.ItemDataRole.DisplayRole).strip()
+			"formatted": self.to_string(tc).strip()
 		}
 
 class BSDurationViewItem(BSTimecodeViewItem):
 	"""A duration (hh:mm:ss:ff), a subset of timecode"""
 
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: self.to_string(self._data),
-		})
+	__slots__ = ()
 	
 	@classmethod
 	def to_string(cls, data):
@@ -305,22 +512,21 @@ class BSDurationViewItem(BSTimecodeViewItem):
 class BSFeetFramesViewItem(BSNumericViewItem):
 	"""A frame offset described in feet & frames (f+ff)"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:int, *args, **kwargs):
 
 		if not isinstance(raw_data, int):
 			raise TypeError(f"Data must be an integer (not {type(raw_data)})")
 		super().__init__(raw_data, *args, **kwargs)
-
-	def _prepare_data(self):
-		super()._prepare_data()
 	
 	def to_json(self) -> dict:
 		return {
 			"type":      "feet_frames",
 			"format":    "35mm",
 			"perfs":     4,
-			"frames":    self.data(QtCore.Qt.ItemDataRole.UserRole),
-			"formatted": self.data(QtCore.Qt.ItemDataRole.DisplayRole).strip()
+			"frames":    self._data,
+			"formatted": self.to_string(self._data).strip()
 		}
 	
 	@classmethod
@@ -330,6 +536,17 @@ class BSFeetFramesViewItem(BSNumericViewItem):
 class BSClipColorViewItem(BSAbstractViewItem):
 	"""A clip color"""
 
+	__slots__ = ()
+
+	# Not using the usual roles, would be weird
+	ROLE_METHODS = {
+		#QtCore.Qt.ItemDataRole.UserRole: "rawData",
+		#QtCore.Qt.ItemDataRole.BackgroundRole: "rawData",
+		QtCore.Qt.ItemDataRole.DecorationRole:       "decorationData",
+		QtCore.Qt.ItemDataRole.ToolTipRole:          "toolTipData",
+		QtCore.Qt.ItemDataRole.InitialSortOrderRole: "sortKey",
+	}
+
 	def __init__(self, raw_data:avbutils.ClipColor|QtGui.QRgba64|None, *args, **kwargs):
 
 		if isinstance(raw_data, avbutils.ClipColor):
@@ -343,16 +560,14 @@ class BSClipColorViewItem(BSAbstractViewItem):
 		
 		super().__init__(raw_data, *args, **kwargs)
 	
-	def _prepare_data(self):
-		# Not calling super, would be weird
-
-		self._data_roles.update({
-			#QtCore.Qt.ItemDataRole.UserRole: self._data,
-			#QtCore.Qt.ItemDataRole.BackgroundRole: self._data,
-			QtCore.Qt.ItemDataRole.DecorationRole:self._data,
-			QtCore.Qt.ItemDataRole.ToolTipRole: f"R: {self._data.red()} G: {self._data.green()} B: {self._data.blue()}" if self._data.isValid() else QtCore.QCoreApplication.instance().tr("No Color"),
-			QtCore.Qt.ItemDataRole.InitialSortOrderRole: self.to_string(self._data.getRgb())
-		})
+	def decorationData(self) -> QtGui.QColor:
+		return self._data
+	
+	def toolTipData(self) -> str:
+		return f"R: {self._data.red()} G: {self._data.green()} B: {self._data.blue()}" if self._data.isValid() else QtCore.QCoreApplication.instance().tr("No Color")
+	
+	def sortData(self) -> tuple:
+		return color_sort_key(self._data)
 	
 	def to_json(self) -> dict|None:
 
@@ -367,26 +582,32 @@ class BSClipColorViewItem(BSAbstractViewItem):
 			"type": "color",
 			"rgb16": [color_64.red(), color_64.green(), color_64.blue()],
 			"rgb8": [color.red(), color.green(), color.blue()],
-			"hex": self.data(QtCore.Qt.ItemDataRole.UserRole).name()
+			"hex": color.name()
 		}
 
 class BSMarkerViewItem(BSAbstractViewItem):
 	"""Marker column"""
 
+	__slots__ = ()
+
 	def __init__(self, raw_data:avbutils.MarkerInfo, *args, **kwargs):
 
 		super().__init__(raw_data, *args, **kwargs)
-		self._prepare_data()
 	
-	def _prepare_data(self):
-		
-		super()._prepare_data()
-		
-		marker_color = QtGui.QColor(self._data.color.name) if self._data is not None else QtGui.QColor()
+	def displayData(self) -> None:
+		return None
+	
+	def sortData(self) -> tuple:
+		return text_sort_key(self.to_string(self._data)) if self._data else EMPTY_SORT_KEY
+	
+	def decorationData(self) -> QtGui.QColor:
+		return QtGui.QColor(self._data.color.name) if self._data is not None else QtGui.QColor()
+	
+	def toolTipData(self) -> str:
 		
 		marker_info:avbutils.markers.MarkerInfo = self._data
 		
-		tooltip = QtCore.QCoreApplication.instance().tr(
+		return QtCore.QCoreApplication.instance().tr(
 			"""
 			<table>
 				<tr>
@@ -412,29 +633,122 @@ class BSMarkerViewItem(BSAbstractViewItem):
 				track=marker_info.track_label,
 				offset=marker_info.frm_offset
 			) if self._data else QtCore.QCoreApplication.instance().tr("No Marker")
+	
+	def to_json(self) -> dict|None:
+
+		marker_info:avbutils.markers.MarkerInfo = self._data
+
+		if not marker_info:
+			return None
 		
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole: None,
-			QtCore.Qt.ItemDataRole.DecorationRole: marker_color,
-			QtCore.Qt.ItemDataRole.ToolTipRole: tooltip,
-		})
+		return {
+			"type":         "marker",
+			"color":        marker_info.color.name,
+			"comment":      marker_info.comment,
+			"user":         marker_info.user,
+			"track":        marker_info.track_label,
+			"frame_offset": marker_info.frm_offset,
+			"formatted":    marker_info.comment,
+		}
 
 class BSBinLockViewItem(BSAbstractViewItem):
 	"""Bin lock info"""
 
+	__slots__ = ()
+
 	# Note: For now I think we'll do a string, but want to expand this later probably
 	def __init__(self, raw_data:avbutils.LockInfo, *args, **kwargs):
 		super().__init__(raw_data, *args, **kwargs)
 
-	def _prepare_data(self):
-		super()._prepare_data()
-		self._data_roles.update({
-			QtCore.Qt.ItemDataRole.DisplayRole:    self._data.name if self._data else "",
-			QtCore.Qt.ItemDataRole.DecorationRole: QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.SystemLockScreen if self._data else None)
-		})
+	def displayData(self) -> str:
+		return self._data.name if self._data else ""
+	
+	def sortData(self) -> tuple:
+		return text_sort_key(self._data.name) if self._data else EMPTY_SORT_KEY
+	
+	def decorationData(self) -> QtGui.QIcon:
+		return QtGui.QIcon.fromTheme(QtGui.QIcon.ThemeIcon.SystemLockScreen if self._data else None)
 	
 	def to_json(self) -> str|None:
-		return self.data(QtCore.Qt.ItemDataRole.DisplayRole) or None
+		return self._data.name if self._data else None
+
+class BSViewItemInterner:
+	"""
+	Shares one view item between equal raw values (flyweight), so a bin full of empty tapes has one empty tape item
+
+	Only for view items of immutable values that nobody calls `setData()` on.  Items are held weakly, so they go
+	away with the last row that uses them.
+	"""
+
+	def __init__(self):
+
+		self._view_items:weakref.WeakValueDictionary[tuple, BSAbstractViewItem] = weakref.WeakValueDictionary()
+		self._lock   = threading.Lock()
+		self._hits   = 0
+		self._misses = 0
+
+	def viewItem(self, factory:typing.Callable[[typing.Any], BSAbstractViewItem], raw_data:typing.Hashable) -> BSAbstractViewItem:
+		"""The shared view item for a value, made with `factory` if there isn't one yet"""
+
+		# Type is part of the key, since `1 == 1.0 == True`
+		key = (factory, type(raw_data), raw_data)
+
+		try:
+			hash(key)
+		except TypeError:
+			return factory(raw_data)
+
+		with self._lock:
+
+			view_item = self._view_items.get(key)
+
+			if view_item is not None:
+				self._hits += 1
+				return view_item
+
+			self._misses += 1
+			view_item = factory(raw_data)
+			self._view_items[key] = view_item
+
+		return view_item
+
+	def hitCount(self) -> int:
+		return self._hits
+
+	def missCount(self) -> int:
+		return self._misses
+
+	def hitRate(self) -> float|None:
+		"""Share of lookups served by an existing item"""
+
+		lookups = self._hits + self._misses
+		return self._hits / lookups if lookups else None
+
+	def stats(self) -> dict[str, typing.Any]:
+
+		return {
+			"hits":       self._hits,
+			"misses":     self._misses,
+			"hit_rate":   self.hitRate(),
+			"live_items": len(self._view_items),
+		}
+
+	def resetStats(self):
+
+		with self._lock:
+			self._hits   = 0
+			self._misses = 0
+
+VIEWITEM_INTERNER = BSViewItemInterner()
+"""Shared by everything building view items for bin items"""
+
+def interned_viewitem(factory:typing.Callable[[typing.Any], BSAbstractViewItem], raw_data:typing.Hashable) -> BSAbstractViewItem:
+	"""A view item for a value, shared with any other equal value"""
+
+	return VIEWITEM_INTERNER.viewItem(factory, raw_data)
+
+def interned_string_viewitem(raw_data:str) -> BSStringViewItem:
+	return VIEWITEM_INTERNER.viewItem(BSStringViewItem, raw_data)
 
 @singledispatch
 def get_viewitem_for_item(item:typing.Any) -> BSAbstractViewItem:
@@ -447,15 +761,15 @@ def _(item:BSAbstractViewItem):
 
 @get_viewitem_for_item.register
 def _(item:str):
-	return BSStringViewItem(item)
+	return interned_viewitem(BSStringViewItem, item)
 
 @get_viewitem_for_item.register
 def _(item:int|float):
-	return BSNumericViewItem(item)
+	return interned_viewitem(BSNumericViewItem, item)
 
 @get_viewitem_for_item.register
 def _(item:enum.Enum):
-	return BSEnumViewItem(item)
+	return interned_viewitem(BSEnumViewItem, item)
 
 @get_viewitem_for_item.register
 def _(item:os.PathLike):
@@ -463,7 +777,7 @@ def _(item:os.PathLike):
 
 @get_viewitem_for_item.register
 def _(item:str):
-	return BSStringViewItem(item)
+	return interned_viewitem(BSStringViewItem, item)
 
 @get_viewitem_for_item.register
 def _(item:datetime.datetime):
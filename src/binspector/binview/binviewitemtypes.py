@@ -86,7 +86,7 @@ class BSBinViewColumnInfo:
 
 	def _build_tooltip(self):
 		
-		return QtCore.QCoreApplication.instance().tr(
+		return QtCore.QCoreApplication.translate("BSBinViewColumnInfo",
 			"""
 			<table>
 				<tr>
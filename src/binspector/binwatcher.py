@@ -0,0 +1,315 @@
+"""
+Watch an open bin (and its Avid lock file) for changes on disk
+"""
+
+from __future__ import annotations
+
+import dataclasses, logging, os
+from os import PathLike
+from PySide6 import QtCore
+
+from .core import binio, config
+
+@dataclasses.dataclass(frozen=True)
+class BSFileIdentity:
+	"""A cheap snapshot of a file on disk, for telling when it has changed"""
+
+	exists   :bool
+	size     :int = 0
+	mtime_ns :int = 0
+
+	@classmethod
+	def from_path(cls, file_path:PathLike|None) -> BSFileIdentity:
+
+		try:
+			stat = os.stat(file_path)
+		except (OSError, TypeError, ValueError):
+			return cls(exists=False)
+
+		return cls(exists=True, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+@dataclasses.dataclass(frozen=True)
+class BSBinLockInfo:
+	"""Avid lock file for a bin"""
+
+	lock_path :str
+	"""Path to the `.lck` file"""
+
+	name      :str
+	"""Name of the system holding the lock"""
+
+	@classmethod
+	def from_lock_file(cls, lock_path:PathLike) -> BSBinLockInfo:
+		"""Read a lock file.  Avid stores the name of the locking system, padded with nulls."""
+
+		with open(lock_path, "rb") as lock_file:
+			raw_name = lock_file.read(512)
+
+		# Wide or narrow depending on who wrote it
+		encoding = "utf-16-le" if raw_name[1:2] == b"\x00" else "utf-8"
+
+		return cls(
+			lock_path = os.fspath(lock_path),
+			name      = raw_name.decode(encoding, errors="replace").split("\x00", 1)[0].strip(),
+		)
+
+class BSBinLockWatcher(QtCore.QObject):
+	"""Watch a bin and its lock file, reporting changes once the bin has finished being written"""
+
+	sig_bin_changed     = QtCore.Signal(str)
+	"""The bin was modified and has since been stable: a good time to reload it"""
+
+	sig_bin_removed     = QtCore.Signal(str)
+	"""The bin no longer exists"""
+
+	sig_lock_changed    = QtCore.Signal(object)
+	"""The bin was locked (`BSBinLockInfo`) or unlocked (`None`)"""
+
+	sig_polling_changed = QtCore.Signal(bool)
+	"""Switched between native file events and stat polling"""
+
+	def __init__(self,
+		bin_path:PathLike|None = None,
+		*args,
+		debounce_msec:int      = config.BSBinWatcherConfig.DEFAULT_DEBOUNCE_MSEC,
+		stable_msec:int        = config.BSBinWatcherConfig.DEFAULT_STABLE_MSEC,
+		poll_interval_msec:int = config.BSBinWatcherConfig.DEFAULT_POLL_INTERVAL_MSEC,
+		force_polling:bool     = False,
+		**kwargs
+	):
+
+		super().__init__(*args, **kwargs)
+
+		self._bin_path:str|None                  = None
+		self._bin_identity:BSFileIdentity        = BSFileIdentity(exists=False)
+		self._candidate_identity:BSFileIdentity|None = None
+		self._lock_identity:BSFileIdentity       = BSFileIdentity(exists=False)
+		self._lock_info:BSBinLockInfo|None       = None
+
+		self._force_polling = bool(force_polling)
+		self._is_polling    = False
+		self._is_paused     = False
+
+		self._fs_watcher = QtCore.QFileSystemWatcher(parent=self)
+
+		# Coalesces bursts of file events from a save
+		self._debounce_timer = QtCore.QTimer(parent=self)
+		self._debounce_timer.setSingleShot(True)
+		self._debounce_timer.setInterval(debounce_msec)
+
+		# The bin must hold still this long before we trust it
+		self._stable_timer = QtCore.QTimer(parent=self)
+		self._stable_timer.setSingleShot(True)
+		self._stable_timer.setInterval(stable_msec)
+
+		# Fallback for file systems that don't do file events well
+		self._poll_timer = QtCore.QTimer(parent=self)
+		self._poll_timer.setInterval(poll_interval_msec)
+
+		self._fs_watcher.fileChanged     .connect(self._debounce_timer.start)
+		self._fs_watcher.directoryChanged.connect(self._debounce_timer.start)
+		self._debounce_timer.timeout     .connect(self.checkForChanges)
+		self._poll_timer.timeout         .connect(self.checkForChanges)
+		self._stable_timer.timeout       .connect(self._confirmStable)
+
+		if bin_path:
+			self.setBinPath(bin_path)
+
+	@QtCore.Slot(object)
+	def setBinPath(self, bin_path:PathLike|None):
+		"""Watch a new bin, taking its current state as the baseline"""
+
+		self._stopWatching()
+
+		self._bin_path           = os.path.abspath(os.fspath(bin_path)) if bin_path else None
+		self._bin_identity       = BSFileIdentity.from_path(self._bin_path)
+		self._candidate_identity = None
+
+		if not self._bin_path:
+			self._setLockInfo(None)
+			return
+
+		self._updateLockInfo()
+		self._startWatching()
+
+		logging.getLogger(__name__).debug("Watching bin %s (polling=%s)", self._bin_path, self._is_polling)
+
+	def binPath(self) -> str|None:
+		"""The bin being watched"""
+
+		return self._bin_path
+
+	def lockPath(self) -> str|None:
+		"""The lock file being watched for"""
+
+		return binio.lock_path_for_bin(self._bin_path) if self._bin_path else None
+
+	def lockInfo(self) -> BSBinLockInfo|None:
+		"""The current lock on the bin, if any"""
+
+		return self._lock_info
+
+	def isPolling(self) -> bool:
+		"""Using stat polling instead of native file events"""
+
+		return self._is_polling
+
+	@QtCore.Slot(bool)
+	def setForcePolling(self, force_polling:bool):
+		"""Always use stat polling, even where native file events are available"""
+
+		if self._force_polling == bool(force_polling):
+			return
+
+		self._force_polling = bool(force_polling)
+		self.setBinPath(self._bin_path)
+
+	@QtCore.Slot(bool)
+	def setPaused(self, is_paused:bool):
+		"""Hold off reporting changes (for instance, while the bin is being loaded)"""
+
+		self._is_paused = bool(is_paused)
+
+		if not self._is_paused and self._candidate_identity is not None:
+			self._stable_timer.start()
+
+	def isPaused(self) -> bool:
+		return self._is_paused
+
+	@QtCore.Slot()
+	def rebaseline(self):
+		"""Accept the bin as it is on disk right now as unchanged"""
+
+		self._bin_identity       = BSFileIdentity.from_path(self._bin_path)
+		self._candidate_identity = None
+		self._stable_timer.stop()
+
+	@QtCore.Slot()
+	def checkForChanges(self):
+		"""Stat the bin and its lock file, and start waiting for the bin to settle if it has changed"""
+
+		if not self._bin_path:
+			return
+
+		self._updateLockInfo()
+
+		current_identity = BSFileIdentity.from_path(self._bin_path)
+
+		# Atomic saves replace the file, which drops it from the native watcher
+		if not self._is_polling and current_identity.exists and self._bin_path not in self._fs_watcher.files():
+			self._fs_watcher.addPath(self._bin_path)
+
+		if current_identity == self._bin_identity:
+			self._candidate_identity = None
+			self._stable_timer.stop()
+			return
+
+		# Still changing; (re)start the settle time
+		if current_identity != self._candidate_identity:
+			self._candidate_identity = current_identity
+			self._stable_timer.start()
+
+	@QtCore.Slot()
+	def _confirmStable(self):
+
+		if not self._bin_path or self._candidate_identity is None:
+			return
+
+		current_identity = BSFileIdentity.from_path(self._bin_path)
+
+		if current_identity != self._candidate_identity:
+			self._candidate_identity = current_identity
+			self._stable_timer.start()
+			return
+
+		if current_identity == self._bin_identity:
+			self._candidate_identity = None
+			return
+
+		if self._is_paused:
+			return
+
+		self._bin_identity       = current_identity
+		self._candidate_identity = None
+
+		if current_identity.exists:
+			logging.getLogger(__name__).debug("Bin changed on disk: %s", self._bin_path)
+			self.sig_bin_changed.emit(self._bin_path)
+		else:
+			logging.getLogger(__name__).debug("Bin removed from disk: %s", self._bin_path)
+			self.sig_bin_removed.emit(self._bin_path)
+
+	def _updateLockInfo(self):
+
+		lock_path     = self.lockPath()
+		lock_identity = BSFileIdentity.from_path(lock_path)
+
+		if lock_identity == self._lock_identity:
+			return
+
+		self._lock_identity = lock_identity
+
+		if not lock_identity.exists:
+			self._setLockInfo(None)
+			return
+
+		try:
+			self._setLockInfo(BSBinLockInfo.from_lock_file(lock_path))
+		except OSError as e:
+			logging.getLogger(__name__).debug("Could not read lock file %s: %s", lock_path, e)
+
+	def _setLockInfo(self, lock_info:BSBinLockInfo|None):
+
+		if self._lock_info == lock_info:
+			return
+
+		self._lock_info = lock_info
+
+		if lock_info:
+			logging.getLogger(__name__).debug("Bin locked by %s", lock_info.name)
+		else:
+			logging.getLogger(__name__).debug("Bin unlocked")
+
+		self.sig_lock_changed.emit(lock_info)
+
+	def _usePolling(self) -> bool:
+
+		if self._force_polling:
+			return True
+
+		file_system_type = bytes(QtCore.QStorageInfo(os.path.dirname(self._bin_path)).fileSystemType().data()).decode(errors="replace").lower()
+
+		return file_system_type in config.BSBinWatcherConfig.POLLING_FILESYSTEM_TYPES
+
+	def _startWatching(self):
+
+		is_polling = self._usePolling()
+
+		# Watch the folder too, for lock files coming and going and for saves that replace the bin
+		if not is_polling:
+
+			watch_paths  = [p for p in (self._bin_path, os.path.dirname(self._bin_path)) if os.path.exists(p)]
+			failed_paths = self._fs_watcher.addPaths(watch_paths) if watch_paths else []
+
+			if failed_paths or not watch_paths:
+				logging.getLogger(__name__).debug("Native file watching unavailable for %s, polling instead", failed_paths or self._bin_path)
+				self._stopWatching()
+				is_polling = True
+
+		if is_polling:
+			self._poll_timer.start()
+
+		if is_polling != self._is_polling:
+			self._is_polling = is_polling
+			self.sig_polling_changed.emit(is_polling)
+
+	def _stopWatching(self):
+
+		self._debounce_timer.stop()
+		self._stable_timer.stop()
+		self._poll_timer.stop()
+
+		watched_paths = self._fs_watcher.files() + self._fs_watcher.directories()
+
+		if watched_paths:
+			self._fs_watcher.removePaths(watched_paths)
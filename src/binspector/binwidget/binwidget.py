@@ -2,7 +2,7 @@
 The big fella
 """
 
-import logging, typing
+import logging, math, typing
 import avb, avbutils
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -18,7 +18,7 @@ from ..scriptview import scriptview, scriptproxy
 from ..binview import binviewitemtypes, binviewmodel
 from ..binitems import binitemtypes, binitemsmodel
 
-from ..binfilters import bindisplayproxymodel, binviewproxymodel
+from ..binfilters import bindisplayproxymodel, binviewproxymodel, binsortproxymodel
 from ..binfilters.siftfilter import siftproxymodel, sifters, siftmatchtypes
 
 from ..siftwidget import scopesmodel
@@ -72,10 +72,13 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 			parent=self
 		)
 
-		# The composite model gets filtered by Sift and Find In Bin
+		# The composite model gets sorted, then filtered by Sift and Find In Bin
+
+		self._bin_sort_proxy = binsortproxymodel.BSBinSortProxyModel(parent=self)
+		self._bin_sort_proxy.setSourceModel(self._bin_composite_model)
 
 		self._bin_sift_filter = siftproxymodel.BSBinSiftFilterProxyModel(parent=self)	# TODO
-		self._bin_sift_filter.setSourceModel(self._bin_composite_model)
+		self._bin_sift_filter.setSourceModel(self._bin_sort_proxy)
 
 		self._bin_find_filter = siftproxymodel.BSBinSiftFilterProxyModel(parent=self, sift_criteria=[[sifters.BSAnyColumnSifter()]])
 		self._bin_find_filter.setSourceModel(self._bin_sift_filter)
@@ -171,6 +174,7 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 
 		# Signals
 		self._viewmode_text.sig_hide_column_requested.connect(self.hideBinColumn)
+		self._bin_sort_proxy.sig_sort_changed        .connect(self.setTextViewSortIndicator)
 
 	def _setupFrameViewMode(self):
 
@@ -360,6 +364,19 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 
 		return avbutils.BinDisplayModes(self._section_main.currentIndex())
 	
+	def visibleItemCounts(self) -> dict[avbutils.BinDisplayModes, int]:
+		"""Roughly how many bin items fit on screen in each view mode, erring on the generous side"""
+
+		row_height = max(self._viewmode_text.fontMetrics().height(), 1)
+		frame_rect = self._viewmode_frame.visibleSceneRect()
+		frame_unit = BSFrameViewModeConfig.GRID_UNIT_SIZE
+
+		return {
+			avbutils.BinDisplayModes.LIST:   math.ceil(self._viewmode_text.viewport().height() / row_height),
+			avbutils.BinDisplayModes.FRAME:  math.ceil(frame_rect.width() / frame_unit.width()) * math.ceil(frame_rect.height() / frame_unit.height()),
+			avbutils.BinDisplayModes.SCRIPT: math.ceil(self._viewmode_script.viewport().height() / row_height),
+		}
+	
 
 	###
 	# Bin Views and Filters
@@ -412,7 +429,8 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 			match_type = siftmatchtypes.BSSiftMatchTypes.Contains,
 		)
 		
-		self._bin_find_filter.setSiftCriteria([[sift_criterion]])
+		# Sifted between keystrokes, and only among rows already found if the search text just got longer
+		self._bin_find_filter.requestSiftCriteria([[sift_criterion]])
 
 	@QtCore.Slot(dict)
 	def setTextColumnWidthsFromBin(self, column_widths:dict[str,int]|None=None):
@@ -444,6 +462,22 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 			self.textView().header().resizeSections(QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
 
 
+	@QtCore.Slot(object)
+	def setSortColumnsFromBin(self, sort_settings:list[list[int,str]]):
+		"""Sort by the avid bin's sort columns `list[direction:int, column_name:str]`"""
+
+		logging.getLogger(__name__).debug("Setting sort columns from: %s", sort_settings)
+		self._bin_sort_proxy.setSortColumnsFromBin(sort_settings)
+
+	@QtCore.Slot(object)
+	def setTextViewSortIndicator(self, sort_columns:list[tuple[int, QtCore.Qt.SortOrder]]):
+		"""Show the most significant sort column in the text view header, without sorting all over again"""
+
+		column, sort_order = sort_columns[0] if sort_columns else (-1, QtCore.Qt.SortOrder.AscendingOrder)
+
+		with QtCore.QSignalBlocker(self.textView().header()):
+			self.textView().header().setSortIndicator(column, sort_order)
+
 	###
 	# The filters
 	###
@@ -452,6 +486,11 @@ class BSBinContentsWidget(QtWidgets.QWidget):
 		"""Bin sift filter"""
 
 		return self._bin_sift_filter
+
+	def sortProxy(self) -> binsortproxymodel.BSBinSortProxyModel:
+		"""Sorts bin items ahead of the sift filters"""
+
+		return self._bin_sort_proxy
 	
 	def itemDisplayFilter(self) -> bindisplayproxymodel.BSBinDisplayFilterProxyModel:
 		"""Bin display items filter"""
@@ -0,0 +1,170 @@
+"""
+Headless command line tools
+
+Usage: `python -m binspector export --format csv|jsonl|ale [--workers N] [--output-dir DIR] bins/*.avb`
+       `python -m binspector bench [--mob-counts 1000 10000 100000] [--repeat N] [--output results.json]`
+       `python -m binspector probe [--workers N] bins/*.avb`
+"""
+
+import argparse, json, logging, os, sys
+from concurrent import futures
+
+from .core import binbench, binexport, binio, binprobe
+
+def build_parser() -> argparse.ArgumentParser:
+
+	parser = argparse.ArgumentParser(prog="binspector", description="Binspector command line tools")
+	commands = parser.add_subparsers(dest="command", required=True)
+
+	export_parser = commands.add_parser("export", help="Export bin contents without opening any windows")
+	export_parser.add_argument("bin_paths", nargs="+", metavar="BIN", help="Avid bins (.avb) to export")
+	export_parser.add_argument("-f", "--format", dest="export_format", choices=[f.value for f in binexport.BSExportFormat], default=binexport.BSExportFormat.CSV.value, help="Output format (default: %(default)s)")
+	export_parser.add_argument("-o", "--output-dir", default=".", help="Folder for exported files, named after each bin (default: current folder)")
+	export_parser.add_argument("--stdout", action="store_true", help="Stream all bins to standard output instead of files (runs serially)")
+	export_parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1, help="Bins to export concurrently (default: %(default)s)")
+	export_parser.add_argument("--include-hidden", action="store_true", help="Include columns hidden in the bin view")
+	export_parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to standard error")
+
+	bench_parser = commands.add_parser("bench", help="Benchmark loading synthetic bins, reporting timings as JSON")
+	bench_parser.add_argument("--mob-counts", type=int, nargs="+", default=list(binbench.DEFAULT_MOB_COUNTS), metavar="N", help="Synthetic bin sizes to benchmark (default: %(default)s)")
+	bench_parser.add_argument("-r", "--repeat", type=int, default=1, help="Load each bin this many times, keeping the fastest time for each phase (default: %(default)s)")
+	bench_parser.add_argument("--seed", type=int, default=binbench.DEFAULT_SEED, help="Random seed for synthetic bins (default: %(default)s)")
+	bench_parser.add_argument("--work-dir", default=None, help="Folder to generate synthetic bins in, and reuse them from (default: a folder in the system temp folder)")
+	bench_parser.add_argument("-o", "--output", default=None, help="Write the JSON report to this file instead of standard output")
+	bench_parser.add_argument("--trace-memory", action="store_true", help="Also trace peak Python memory per phase (slows everything down)")
+	bench_parser.add_argument("--no-model", action="store_true", help="Skip timing insertion into the bin item model")
+	bench_parser.add_argument("--read-mode", choices=[m.value for m in binio.BSBinReadMode], default=binio.BSBinReadMode.AUTO.value, help="How to read each bin file (default: %(default)s)")
+	bench_parser.add_argument("--no-isolate", action="store_true", help="Load in this process instead of a fresh one per run (peak memory then covers the whole session)")
+	bench_parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to standard error")
+
+	probe_parser = commands.add_parser("probe", help="Print each bin's settings and item count as JSON Lines, without parsing its items")
+	probe_parser.add_argument("bin_paths", nargs="+", metavar="BIN", help="Avid bins (.avb) to probe")
+	probe_parser.add_argument("-w", "--workers", type=int, default=binprobe.DEFAULT_PROBE_WORKERS, help="Bins to probe concurrently (default: %(default)s)")
+	probe_parser.add_argument("-v", "--verbose", action="store_true", help="Log progress to standard error")
+
+	return parser
+
+def output_path_for_bin(bin_path:str, output_dir:str, export_format:binexport.BSExportFormat) -> str:
+
+	return os.path.join(output_dir, os.path.splitext(os.path.basename(bin_path))[0] + export_format.fileExtension())
+
+def run_export(args:argparse.Namespace) -> int:
+	"""Export each bin, returning the process exit code"""
+
+	export_format = binexport.BSExportFormat(args.export_format)
+	failed_count  = 0
+
+	if args.stdout:
+
+		for bin_path in args.bin_paths:
+
+			try:
+				item_count = binexport.export_bin_to_stream(bin_path, sys.stdout, export_format, args.include_hidden)
+			except Exception as e:
+				logging.getLogger(__name__).error("Could not export %s: %s", bin_path, e)
+				failed_count += 1
+			else:
+				logging.getLogger(__name__).info("Exported %s items from %s", item_count, bin_path)
+
+		return 1 if failed_count else 0
+
+	os.makedirs(args.output_dir, exist_ok=True)
+
+	jobs = [(bin_path, output_path_for_bin(bin_path, args.output_dir, export_format)) for bin_path in args.bin_paths]
+
+	if len(set(output_path for _, output_path in jobs)) != len(jobs):
+		logging.getLogger(__name__).error("Some bins share a name and would overwrite each other's exports")
+		return 2
+
+	def report(result:binexport.BSExportResult):
+
+		nonlocal failed_count
+
+		if result.error:
+			logging.getLogger(__name__).error("Could not export %s: %s", result.bin_path, result.error)
+			failed_count += 1
+		else:
+			logging.getLogger(__name__).info("Exported %s items from %s to %s", result.item_count, result.bin_path, result.output_path)
+
+	worker_count = max(1, min(args.workers, len(jobs)))
+
+	if worker_count == 1:
+
+		for bin_path, output_path in jobs:
+			report(binexport.export_bin_to_path(bin_path, output_path, export_format, args.include_hidden))
+
+	else:
+
+		import multiprocessing
+
+		with futures.ProcessPoolExecutor(max_workers=worker_count, mp_context=multiprocessing.get_context("spawn")) as executor:
+
+			export_futures = [executor.submit(binexport.export_bin_to_path, bin_path, output_path, export_format, args.include_hidden) for bin_path, output_path in jobs]
+
+			for export_future in futures.as_completed(export_futures):
+				report(export_future.result())
+
+	logging.getLogger(__name__).info("Exported %s of %s bins", len(jobs) - failed_count, len(jobs))
+
+	return 1 if failed_count else 0
+
+def run_bench(args:argparse.Namespace) -> int:
+	"""Benchmark synthetic bins and write out the report, returning the process exit code"""
+
+	report = binbench.run_benchmarks(
+		mob_counts    = args.mob_counts,
+		work_dir      = args.work_dir,
+		repeat        = args.repeat,
+		seed          = args.seed,
+		trace_memory  = args.trace_memory,
+		include_model = not args.no_model,
+		isolate       = not args.no_isolate,
+		read_mode     = args.read_mode,
+	)
+
+	if args.output:
+
+		with open(args.output, "w", encoding="utf-8") as output_file:
+			json.dump(report, output_file, indent=2)
+			output_file.write("\n")
+
+	else:
+		json.dump(report, sys.stdout, indent=2)
+		sys.stdout.write("\n")
+
+	return 1 if any(result["error_count"] for result in report["results"]) else 0
+
+def run_probe(args:argparse.Namespace) -> int:
+	"""Probe each bin, returning the process exit code"""
+
+	failed_count = 0
+
+	for result in binprobe.probe_bins(args.bin_paths, max_workers=args.workers):
+
+		if result.error:
+			logging.getLogger(__name__).error("Could not probe %s: %s", result.bin_path, result.error)
+			failed_count += 1
+		else:
+			logging.getLogger(__name__).info("Probed %s items in %s in %.3fs", result.itemCount(), result.bin_path, result.seconds)
+
+		sys.stdout.write(json.dumps(result.to_json(), ensure_ascii=False, default=str))
+		sys.stdout.write("\n")
+
+	return 1 if failed_count else 0
+
+def main(argv:list[str]) -> int:
+
+	args = build_parser().parse_args(argv)
+
+	logging.basicConfig(level=logging.INFO if getattr(args, "verbose", False) else logging.WARNING, format="%(levelname)s\t%(message)s", stream=sys.stderr)
+
+	if args.command == "export":
+		return run_export(args)
+
+	if args.command == "bench":
+		return run_bench(args)
+
+	if args.command == "probe":
+		return run_probe(args)
+
+	return 2
@@ -10,7 +10,7 @@ from ..storage import storagemodel
 
 from ..binviewprovider import binviewsources
 
-from . import settings, config
+from . import settings, config, bincache, binprofile, binscheduler
 from ..managers import windows, software_updates
 from ..widgets  import mainwindow, settingswindow
 from ..logs   import logmodels, logwidget
@@ -19,6 +19,8 @@ from ..binview  import binviewitemtypes
 from ..storage import storagemodel
 
 BIN_VIEW_PATH = "binviews"
+BIN_CACHE_PATH = "bincache"
+LOAD_PROFILE_PATH = "profiles"
 
 class BSMainApplication(QtWidgets.QApplication):
 	"""Main application"""
@@ -73,6 +75,12 @@ class BSMainApplication(QtWidgets.QApplication):
 		self._bin_view_storage_model = storagemodel.BSFileSystemModel(parent=self)
 
 		self._setupBinViewStorage()
+
+		self._bin_cache = self._setupBinCache() if self._man_settings.useBinCache() else None
+
+		# One scheduler for every window, so opening a pile of bins at once doesn't swamp everything
+		self._load_scheduler = binscheduler.BSBinLoadScheduler(max_concurrent_loads=self._man_settings.maxConcurrentLoads(), parent=self)
+		self._man_binwindows.windowGeometryWatcher().sig_window_has_focus.connect(self._load_scheduler.setPriorityOwner)
 		
 	def _setupSignals(self):
 
@@ -130,6 +138,21 @@ class BSMainApplication(QtWidgets.QApplication):
 		)
 
 
+	def _setupBinCache(self) -> bincache.BSBinCache|None:
+		"""Setup on-disk cache of parsed bins"""
+
+		path_bincache = QtCore.QDir(self._path_local_storage).filePath(BIN_CACHE_PATH)
+		logging.getLogger(__name__).debug("Setting up bin cache at %s", QtCore.QDir.toNativeSeparators(path_bincache))
+
+		try:
+			return bincache.BSBinCache(
+				cache_path  = path_bincache,
+				size_budget = self._man_settings.binCacheSizeBudget() * 1024 * 1024,
+			)
+		except OSError as e:
+			logging.getLogger(__name__).error("Could not set up bin cache at %s: %s", path_bincache, e)
+			return None
+
 	def _getLocalStorage(self, local_path:PathLike|None=None):
 		"""Setup local storage for user data"""
 
@@ -283,6 +306,14 @@ class BSMainApplication(QtWidgets.QApplication):
 		window.binContentsWidget().frameView()._background_painter.sig_enabled_changed.connect(self._man_settings.setShowFrameGrid)
 
 		window.setMobQueueSize(self._man_settings.mobQueueSize())
+		window.setBatchBudget(self._man_settings.batchBudget())
+		window.setParallelLoadProcesses(self._man_settings.parallelLoadProcesses())
+		window.setBinCache(self._bin_cache)
+		window.setLoadScheduler(self._load_scheduler)
+		window.setBinReadMode(self._man_settings.binReadMode())
+		window.setSlowMobReportCount(self._man_settings.slowMobReportCount())
+		window.setVisibleFirstLoading(self._man_settings.visibleFirstLoading())
+		window.setAutoReloadEnabled(self._man_settings.autoReloadEnabled())
 		window.setUseAnimation(self._man_settings.useFancyProgressBar())
 		window.setUseSavedColumnWidths(self._man_settings.useSavedColumnWidths())
 		
@@ -291,6 +322,7 @@ class BSMainApplication(QtWidgets.QApplication):
 
 		window.binLoadingSignalManger().sig_begin_loading.connect(self.setUpdateCheckDisabled)
 		window.binLoadingSignalManger().sig_done_loading.connect(self.setUpdateCheckEnabled)
+		window.binLoadingSignalManger().sig_got_load_profile.connect(self.binLoadProfiled)
 
 		window.binViewProviderModel().setStorageModel(self._bin_view_storage_model)
 
@@ -400,6 +432,30 @@ class BSMainApplication(QtWidgets.QApplication):
 
 		self.setUpdateCheckEnabled(not bool(is_disabled))
 	
+	@QtCore.Slot(object)
+	def binLoadProfiled(self, profile:binprofile.BSBinLoadProfile):
+		"""Show a bin load profile in the log viewer, and save it if requested"""
+
+		self._qt_log_model.addLoadProfile(profile)
+
+		if not self._man_settings.writeLoadProfiles():
+			return
+		
+		path_profiles = QtCore.QDir(self._path_local_storage).filePath(LOAD_PROFILE_PATH)
+
+		if not QtCore.QDir().mkpath(path_profiles):
+			logging.getLogger(__name__).error("Could not create directory for load profiles at %s", path_profiles)
+			return
+		
+		profile_path = QtCore.QDir(path_profiles).filePath(binprofile.profile_file_name(profile))
+
+		try:
+			binprofile.write_profile_json(profile, profile_path)
+		except OSError as e:
+			logging.getLogger(__name__).error("Could not write load profile to %s: %s", profile_path, e)
+		else:
+			logging.getLogger(__name__).debug("Wrote load profile to %s", QtCore.QDir.toNativeSeparators(profile_path))
+	
 	@QtCore.Slot()
 	def showLogWindow(self):
 
@@ -514,6 +570,7 @@ class BSMainApplication(QtWidgets.QApplication):
 	def closeProgram(self):
 		"""Binspect no more"""
 
+		self._load_scheduler.cancelAll()
 		self.closeAllWindows()
 
 		#logging.getLogger(__name__).debug("Thank you for everything.  I love you.")
\ No newline at end of file
@@ -0,0 +1,602 @@
+"""
+Synthetic bin generation and load benchmarks
+
+Everything here runs without a `QApplication`, so results can be collected on a CI box with no display
+and compared between commits
+"""
+
+import contextlib, dataclasses, datetime, logging, multiprocessing, os, platform, random, sys, tempfile, time, tracemalloc, typing
+from concurrent import futures
+from os import PathLike
+
+import avb
+
+BENCH_FORMAT_VERSION:int = 1
+"""Bump this whenever the shape of the JSON report changes"""
+
+DEFAULT_MOB_COUNTS:tuple[int,...] = (1_000, 10_000, 100_000)
+"""Bin sizes to benchmark when none are given"""
+
+DEFAULT_SEED:int = 0
+"""Random seed for synthetic bins, so the same bin is generated every time"""
+
+MODEL_BATCH_SIZE:int = 500
+"""Items per `addBinItems()` call when timing model insertion (matches the loader's default queue size)"""
+
+EDIT_RATE:int = 24
+"""Edit rate of everything in a synthetic bin"""
+
+@dataclasses.dataclass(frozen=True)
+class BSSyntheticBinMix:
+	"""Proportions of mobs in a synthetic bin"""
+
+	master_clips:float = 0.70
+	"""Share of user-placed mobs that are master clips.  Each also brings a file mob and a physical source mob into the bin."""
+
+	subclips:float = 0.20
+	"""Share of user-placed mobs that are subclips of an earlier master clip"""
+
+	sequences:float = 0.10
+	"""Share of user-placed mobs that are sequences"""
+
+	source_file_ratio:float = 0.67
+	"""Share of master clips whose physical source is a source file, rather than a tape"""
+
+	clips_per_sequence:int = 12
+	"""Source clips in each sequence's video track"""
+
+	max_markers_per_sequence:int = 5
+	"""Each sequence gets between zero and this many markers"""
+
+USER_ATTRIBUTE_VALUES:dict[str, typing.Callable[[random.Random, int], str]] = {
+	"Scene":      lambda rng, i: f"{rng.randint(1, 120)}{rng.choice(('', 'A', 'B', 'C'))}",
+	"Take":       lambda rng, i: str(rng.randint(1, 12)),
+	"Camroll":    lambda rng, i: f"A{(i // 40) + 1:03}",
+	"Soundroll":  lambda rng, i: f"S{(i // 80) + 1:03}",
+	"Shoot Date": lambda rng, i: f"2024-{rng.randint(1, 12):02}-{rng.randint(1, 28):02}",
+	"Comments":   lambda rng, i: rng.choice(("", "NG", "Circle take", "Soft focus at head", "Boom in frame")),
+}
+"""User attributes given to master clips and their sources, as we tend to see them from dailies"""
+
+MARKER_COLORS:tuple[tuple[str, tuple[int,int,int]],...] = (
+	("Red",    (65535,     0,     0)),
+	("Green",  (    0, 65535,     0)),
+	("Blue",   (    0,     0, 65535)),
+	("Yellow", (65535, 65535,     0)),
+)
+"""Marker color names with their RGB"""
+
+def _timecode_track(bin_handle:avb.file.AVBFile, index:int, start:int, length:int) -> avb.trackgroups.Track:
+
+	track = bin_handle.create.Track()
+	track.index = index
+
+	component = bin_handle.create.Timecode(edit_rate=EDIT_RATE, media_kind="timecode")
+	component.fps    = EDIT_RATE
+	component.start  = start
+	component.length = length
+
+	track.component = component
+	return track
+
+def _source_clip_track(bin_handle:avb.file.AVBFile, index:int, media_kind:str, mob:avb.trackgroups.Composition|None, track_id:int, start:int, length:int) -> avb.trackgroups.Track:
+
+	track = bin_handle.create.Track()
+	track.index = index
+
+	component = bin_handle.create.SourceClip(edit_rate=EDIT_RATE, media_kind=media_kind)
+	component.mob_id     = mob.mob_id if mob is not None else avb.mobid.MobID()
+	component.track_id   = track_id
+	component.start_time = start
+	component.length     = length
+
+	track.component = component
+	return track
+
+def _media_tracks(bin_handle:avb.file.AVBFile, mob:avb.trackgroups.Composition|None, start:int, length:int) -> list[avb.trackgroups.Track]:
+	"""V1, A1 and A2 referencing the same tracks on `mob`"""
+
+	return [
+		_source_clip_track(bin_handle, 1, "picture", mob, 1, start, length),
+		_source_clip_track(bin_handle, 1, "sound",   mob, 2, start, length),
+		_source_clip_track(bin_handle, 2, "sound",   mob, 3, start, length),
+	]
+
+def _user_attributes(bin_handle:avb.file.AVBFile, rng:random.Random, clip_index:int) -> avb.attributes.Attributes:
+
+	user_attributes = bin_handle.create.Attributes()
+
+	for attribute_name, attribute_value in USER_ATTRIBUTE_VALUES.items():
+		user_attributes[attribute_name] = attribute_value(rng, clip_index)
+
+	return user_attributes
+
+class BSSyntheticBinBuilder:
+	"""Builds a bin with a realistic mix of master clips, subclips and sequences"""
+
+	def __init__(self, bin_handle:avb.file.AVBFile, seed:int=DEFAULT_SEED, mix:BSSyntheticBinMix|None=None):
+
+		self._bin_handle   = bin_handle
+		self._rng          = random.Random(seed)
+		self._mix          = mix or BSSyntheticBinMix()
+		self._master_clips:list[avb.trackgroups.Composition] = []
+		self._mob_counts:dict[str, int] = {}
+
+	def mobCounts(self) -> dict[str, int]:
+		"""Number of mobs added so far, by kind"""
+
+		return dict(self._mob_counts)
+
+	def build(self, mob_count:int):
+		"""Add mobs until the bin holds `mob_count` of them"""
+
+		kinds   = ("master_clip", "subclip", "sequence")
+		weights = (self._mix.master_clips, self._mix.subclips, self._mix.sequences)
+
+		while (remaining := mob_count - len(self._bin_handle.content.items)) > 0:
+
+			# Master clips take three slots, and everything else needs a master clip to point to
+			if not self._master_clips and remaining >= 3:
+				kind = "master_clip"
+			else:
+				kind = self._rng.choices(kinds, weights)[0]
+
+			if kind == "master_clip" and remaining < 3:
+				kind = "subclip" if self._master_clips else "sequence"
+
+			if kind == "master_clip":
+				self.addMasterClip()
+			elif kind == "subclip":
+				self.addSubclip()
+			else:
+				self.addSequence()
+
+	def addMasterClip(self) -> avb.trackgroups.Composition:
+		"""Add a master clip, along with its file mob and physical source mob"""
+
+		rng        = self._rng
+		clip_index = len(self._master_clips)
+		length     = rng.randint(EDIT_RATE * 5, EDIT_RATE * 120)
+		tc_start   = rng.randint(6, 20) * 60 * 60 * EDIT_RATE + rng.randint(0, 59 * 60 * EDIT_RATE)
+		user_attrs = _user_attributes(self._bin_handle, rng, clip_index)
+		camroll    = user_attrs["Camroll"]
+
+		# Physical source: the original camera file, or a tape
+		physical_mob = self._bin_handle.create.Composition(mob_type="SourceMob")
+		physical_mob.length = length
+
+		if rng.random() < self._mix.source_file_ratio:
+			physical_mob.name       = f"{camroll}C{clip_index % 1000:03}_{rng.randint(0, 999999):06}_R{rng.randint(0, 0xFFF):03X}.mov"
+			physical_mob.descriptor = self._bin_handle.create.MediaFileDescriptor()
+			physical_mob.descriptor.mob_kind  = 2
+			physical_mob.descriptor.edit_rate = EDIT_RATE
+			physical_mob.descriptor.length    = length
+		else:
+			physical_mob.name       = camroll
+			physical_mob.descriptor = self._bin_handle.create.TapeDescriptor()
+			physical_mob.descriptor.mob_kind  = 3
+
+		physical_mob.tracks.extend(_media_tracks(self._bin_handle, None, 0, length))
+		physical_mob.tracks.append(_timecode_track(self._bin_handle, 1, tc_start, length))
+		physical_mob.attributes["_USER"] = _user_attributes(self._bin_handle, rng, clip_index)
+
+		# File mob: the media on an Avid drive
+		file_mob = self._bin_handle.create.Composition(mob_type="SourceMob")
+		file_mob.name   = physical_mob.name
+		file_mob.length = length
+
+		locator = self._bin_handle.create.MSMLocator()
+		locator.last_known_volume = rng.choice(("Avid MediaFiles 1", "RAID_A", "RAID_B", "Transcodes"))
+		locator.mob_id = file_mob.mob_id
+
+		file_mob.descriptor = self._bin_handle.create.MediaFileDescriptor()
+		file_mob.descriptor.mob_kind  = 1
+		file_mob.descriptor.edit_rate = EDIT_RATE
+		file_mob.descriptor.length    = length
+		file_mob.descriptor.locator   = locator
+		file_mob.tracks.extend(_media_tracks(self._bin_handle, physical_mob, 0, length))
+
+		# Master clip
+		master_mob = self._bin_handle.create.Composition(mob_type="MasterMob")
+		master_mob.name   = f"{user_attrs['Scene']}-{user_attrs['Take']}"
+		master_mob.length = length
+		master_mob.tracks.extend(_media_tracks(self._bin_handle, file_mob, 0, length))
+		master_mob.attributes["_USER"] = user_attrs
+
+		if rng.random() < 0.5:
+			master_mob.attributes["_IN"]  = rng.randint(0, length // 2)
+			master_mob.attributes["_OUT"] = rng.randint(length // 2 + 1, length)
+
+		self._addMob(physical_mob, "source_mob",  user_placed=False)
+		self._addMob(file_mob,     "file_mob",    user_placed=False)
+		self._addMob(master_mob,   "master_clip", user_placed=True)
+
+		self._master_clips.append(master_mob)
+
+		return master_mob
+
+	def addSubclip(self) -> avb.trackgroups.Composition:
+		"""Add a subclip of an earlier master clip"""
+
+		rng         = self._rng
+		master_mob  = rng.choice(self._master_clips)
+		start       = rng.randint(0, master_mob.length // 2)
+		length      = rng.randint(1, master_mob.length - start)
+
+		subclip_mob = self._bin_handle.create.Composition(mob_type="MasterMob")
+		subclip_mob.name       = f"{master_mob.name}.sub.{len(self._bin_handle.content.items):02}"
+		subclip_mob.usage_code = 2
+		subclip_mob.length     = length
+		subclip_mob.tracks.extend(_media_tracks(self._bin_handle, master_mob, start, length))
+		subclip_mob.attributes["_USER"] = self._bin_handle.create.Attributes()
+		subclip_mob.attributes["_USER"]["Comments"] = rng.choice(("Selects", "Alt line", "Reaction", "B-roll"))
+
+		self._addMob(subclip_mob, "subclip", user_placed=True)
+
+		return subclip_mob
+
+	def addSequence(self) -> avb.trackgroups.Composition:
+		"""Add a sequence cut from earlier master clips, with markers"""
+
+		rng        = self._rng
+		sequence   = self._bin_handle.create.Composition(mob_type="CompositionMob")
+		sequence.name = f"Reel {self._mob_counts.get('sequence', 0) + 1} v{rng.randint(1, 30):02}"
+
+		video_sequence = self._bin_handle.create.Sequence(edit_rate=EDIT_RATE, media_kind="picture")
+
+		for master_mob in (rng.choice(self._master_clips) for _ in range(self._mix.clips_per_sequence)) if self._master_clips else ():
+
+			source_clip = self._bin_handle.create.SourceClip(edit_rate=EDIT_RATE, media_kind="picture")
+			source_clip.mob_id     = master_mob.mob_id
+			source_clip.track_id   = 1
+			source_clip.start_time = rng.randint(0, master_mob.length // 2)
+			source_clip.length     = rng.randint(1, master_mob.length - source_clip.start_time)
+			video_sequence.components.append(source_clip)
+
+		length = sum(c.length for c in video_sequence.components)
+
+		markers = self._bin_handle.create.TimeCrumbList()
+
+		for _ in range(rng.randint(0, self._mix.max_markers_per_sequence) if length else 0):
+
+			color_name, color_rgb = rng.choice(MARKER_COLORS)
+			position = rng.randint(0, length - 1)
+
+			marker = self._bin_handle.create.Marker()
+			marker.mob_id        = sequence.mob_id
+			marker.position      = position
+			marker.comp_offset   = position
+			marker.color         = list(color_rgb)
+			marker.handled_codes = True
+			marker.attributes    = self._bin_handle.create.Attributes()
+			marker.attributes["_ATN_CRM_COM"]   = rng.choice(("Fix audio", "VFX", "Music in", "Check sync", "Note from director"))
+			marker.attributes["_ATN_CRM_USER"]  = rng.choice(("editor", "assistant", "director"))
+			marker.attributes["_ATN_CRM_COLOR"] = color_name
+			markers.append(marker)
+
+		if markers:
+			video_sequence.attributes["_ATN_CRM_LIST"] = markers
+
+		video_track = self._bin_handle.create.Track()
+		video_track.index     = 1
+		video_track.component = video_sequence
+
+		sequence.length = length
+		sequence.tracks.append(video_track)
+		sequence.tracks.append(_timecode_track(self._bin_handle, 1, 60 * 60 * EDIT_RATE, length))
+		sequence.attributes["_USER"] = self._bin_handle.create.Attributes()
+		sequence.attributes["_USER"]["Comments"] = rng.choice(("Director's cut", "Producer notes", "Locked", ""))
+
+		self._addMob(sequence, "sequence", user_placed=True)
+
+		return sequence
+
+	def _addMob(self, mob:avb.trackgroups.Composition, kind:str, user_placed:bool):
+
+		item_index = len(self._bin_handle.content.items)
+
+		bin_item = self._bin_handle.content.add_mob(mob)
+		bin_item.user_placed = user_placed
+		# Lay out on a grid in Frame view, wrapping before the coordinates overflow
+		bin_item.x = 16 + (item_index % 20) * 120
+		bin_item.y = 16 + (item_index // 20 % 350) * 90
+
+		self._mob_counts[kind] = self._mob_counts.get(kind, 0) + 1
+
+def generate_synthetic_bin(bin_path:PathLike, mob_count:int, seed:int=DEFAULT_SEED, mix:BSSyntheticBinMix|None=None) -> dict[str, int]:
+	"""Write a synthetic bin with exactly `mob_count` mobs.  Returns the number of mobs of each kind."""
+
+	with avb.open() as bin_handle:
+
+		builder = BSSyntheticBinBuilder(bin_handle, seed=seed, mix=mix)
+		builder.build(mob_count)
+
+		bin_handle.write(os.fspath(bin_path))
+
+	return builder.mobCounts()
+
+class BSPhaseTimer:
+	"""Times named phases, optionally tracing the peak Python memory allocated in each"""
+
+	def __init__(self, trace_memory:bool=False):
+
+		self._trace_memory = bool(trace_memory)
+		self._phases:dict[str, dict[str, float|int]] = {}
+
+	def phase(self, phase_name:str) -> typing.ContextManager:
+		"""Time the body of a `with` block as `phase_name`"""
+
+		@contextlib.contextmanager
+		def timed_phase():
+
+			if self._trace_memory:
+				tracemalloc.reset_peak()
+
+			time_start = time.perf_counter()
+
+			try:
+				yield
+			finally:
+
+				phase_info = {"seconds": time.perf_counter() - time_start}
+
+				if self._trace_memory:
+					phase_info["peak_traced_bytes"] = tracemalloc.get_traced_memory()[1]
+
+				self._phases[phase_name] = phase_info
+
+		return timed_phase()
+
+	def phases(self) -> dict[str, dict[str, float|int]]:
+		return dict(self._phases)
+
+ITEM_PHASES:frozenset[str] = frozenset({"item_records", "item_infos", "view_items", "model_insertion", "cache_store", "cache_load"})
+"""Phases that handle every mob, and so get a throughput"""
+
+def peak_rss_bytes() -> int|None:
+	"""Peak resident memory of this process, or `None` where that isn't available"""
+
+	try:
+		import resource
+	except ImportError:
+		return None
+
+	peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+	# Bytes on macOS, kilobytes everywhere else
+	return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+def benchmark_bin_load(bin_path:PathLike, trace_memory:bool=False, include_model:bool=True, read_mode:str="auto") -> dict[str, typing.Any]:
+	"""Load a bin the way `BSBinViewLoader` does, timing each phase"""
+
+	# Parsing pulls in the rest of the app, so hold off until we're (probably) in a worker process
+	from ..binitems import binitemsmodel, binitemtypes
+	from . import bincache, binio, binparser
+
+	timer      = BSPhaseTimer(trace_memory=trace_memory)
+	properties = binparser.BSBinPropertiesRecord()
+	records    = []
+	bin_items  = []
+	errors     = []
+
+	if trace_memory:
+		tracemalloc.start()
+
+	time_start = time.perf_counter()
+
+	with timer.phase("open"):
+		bin_handle, io_stats = binio.open_bin(bin_path, read_mode)
+
+	with bin_handle:
+
+		bin_content = bin_handle.content
+
+		with timer.phase("display_flags"):
+			properties.display_flags = binparser.bin_display_flags_from_bin(bin_content)
+
+		with timer.phase("view_settings"):
+			properties.view_setting  = binparser.bin_view_setting_from_bin(bin_content)
+			properties.column_widths = binparser.bin_column_widths_from_bin(bin_content)
+			properties.frame_scale   = binparser.bin_frame_view_scale_from_bin(bin_content)
+			properties.script_scale  = binparser.bin_scipt_view_scale_from_bin(bin_content)
+
+		with timer.phase("display_mode"):
+			properties.display_mode = binparser.display_mode_from_bin(bin_content)
+
+		with timer.phase("sift_settings"):
+			properties.sift_settings = binparser.sift_settings_from_bin(bin_content, view_setting=properties.view_setting)
+
+		with timer.phase("sort_settings"):
+			properties.sort_settings = binparser.sort_settings_from_bin(bin_content)
+
+		with timer.phase("appearance_settings"):
+			properties.appearance_settings = binparser.appearance_settings_from_bin(bin_content)
+
+		properties.mob_count = len(bin_content.items)
+
+		with timer.phase("item_records"):
+
+			parse_context = binparser.BSBinParseContext(bin_content)
+
+			for bin_item in bin_content.items:
+
+				try:
+					records.append(binparser.item_record_from_bin(bin_item, parse_context))
+				except Exception as e:
+					errors.append(f"{type(e).__name__}: {e}")
+
+	with timer.phase("item_infos"):
+
+		for record in records:
+
+			try:
+				bin_items.append(binparser.item_info_from_record(record))
+			except Exception as e:
+				errors.append(f"{type(e).__name__}: {e}")
+
+	binitemtypes.VIEWITEM_INTERNER.resetStats()
+
+	with timer.phase("view_items"):
+
+		# Build every view item, as a full sort or sift would
+		view_items = [[info.view_items[field] for field in info.view_items] for info in bin_items]
+
+	viewitem_interning = binitemtypes.VIEWITEM_INTERNER.stats()
+	del view_items
+
+	model_bytes = None
+
+	if include_model:
+
+		model = binitemsmodel.BSBinItemModel()
+
+		with timer.phase("model_insertion"):
+			for batch_start in range(0, len(records), MODEL_BATCH_SIZE):
+				model.addBinItems(records[batch_start:batch_start + MODEL_BATCH_SIZE])
+
+		model_bytes = model.itemStore().byteCount()
+
+	time_load = time.perf_counter() - time_start
+
+	with tempfile.TemporaryDirectory(prefix="bs_bench_cache_") as cache_path:
+
+		cache     = bincache.BSBinCache(cache_path, size_budget=0)
+		cache_key = bincache.BSBinCacheKey.from_path(bin_path)
+
+		with timer.phase("cache_store"):
+			cache.store(cache_key, bincache.BSBinCacheEntry(properties=properties, records=records))
+
+		with timer.phase("cache_load"):
+			cache.load(cache_key)
+
+	if trace_memory:
+		tracemalloc.stop()
+
+	mob_count = properties.mob_count or 0
+	phases    = timer.phases()
+
+	for phase_name, phase_info in phases.items():
+		if phase_name in ITEM_PHASES:
+			phase_info["mobs_per_sec"] = mob_count / phase_info["seconds"] if phase_info["seconds"] else None
+
+	return {
+		"mob_count":      mob_count,
+		"parsed_count":   len(records),
+		"error_count":    len(errors),
+		"errors":         errors[:10],
+		"load_seconds":   time_load,
+		"mobs_per_sec":   mob_count / time_load if time_load else None,
+		"phases":         phases,
+		"io": {
+			"read_mode":  str(io_stats.read_mode),
+			"seconds":    io_stats.seconds,
+			"byte_count": io_stats.byte_count,
+			"read_count": io_stats.read_count,
+		},
+		"model_bytes":    model_bytes,
+		"viewitem_interning": viewitem_interning,
+		"peak_rss_bytes": peak_rss_bytes(),
+	}
+
+def _best_run(runs:list[dict[str, typing.Any]]) -> dict[str, typing.Any]:
+	"""Combine repeated runs, keeping the fastest time for each phase (the one with the least noise from the rest of the machine)"""
+
+	best = dict(min(runs, key=lambda r: r["load_seconds"]))
+	best["phases"] = {}
+
+	for phase_name in runs[0]["phases"]:
+
+		phase_runs = [r["phases"][phase_name] for r in runs if phase_name in r["phases"]]
+		best["phases"][phase_name] = dict(min(phase_runs, key=lambda p: p["seconds"]))
+
+	best["peak_rss_bytes"] = max((r["peak_rss_bytes"] for r in runs if r["peak_rss_bytes"] is not None), default=None)
+	best["load_seconds_all_runs"] = [r["load_seconds"] for r in runs]
+
+	return best
+
+def synthetic_bin_path(work_dir:PathLike, mob_count:int, seed:int=DEFAULT_SEED) -> str:
+	"""Where a synthetic bin of a given size is kept, so it only needs to be generated once"""
+
+	return os.path.join(os.fspath(work_dir), f"bs_synthetic_{mob_count}_seed{seed}.avb")
+
+def run_benchmarks(
+	mob_counts:typing.Iterable[int] = DEFAULT_MOB_COUNTS,
+	work_dir:PathLike|None          = None,
+	repeat:int                      = 1,
+	seed:int                        = DEFAULT_SEED,
+	trace_memory:bool               = False,
+	include_model:bool              = True,
+	isolate:bool                    = True,
+	read_mode:str                   = "auto",
+) -> dict[str, typing.Any]:
+	"""
+	Generate synthetic bins (reusing any already in `work_dir`) and benchmark loading each one
+
+	With `isolate`, each run happens in a fresh worker process so peak memory is measured per bin, not per session
+	"""
+
+	work_dir = os.fspath(work_dir) if work_dir else os.path.join(tempfile.gettempdir(), "bs_bench")
+	os.makedirs(work_dir, exist_ok=True)
+
+	results = []
+
+	for mob_count in mob_counts:
+
+		bin_path   = synthetic_bin_path(work_dir, mob_count, seed)
+		mob_kinds  = None
+		time_start = time.perf_counter()
+
+		if not os.path.isfile(bin_path):
+
+			logging.getLogger(__name__).info("Generating synthetic bin with %s mobs at %s", mob_count, bin_path)
+
+			temp_path = f"{bin_path}.{os.getpid()}.tmp"
+			mob_kinds = generate_synthetic_bin(temp_path, mob_count, seed=seed)
+			os.replace(temp_path, bin_path)
+
+		time_generate = time.perf_counter() - time_start
+
+		runs = []
+
+		for run_index in range(max(int(repeat), 1)):
+
+			logging.getLogger(__name__).info("Loading %s mobs (run %s of %s)", mob_count, run_index + 1, repeat)
+
+			if isolate:
+				with futures.ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as executor:
+					runs.append(executor.submit(benchmark_bin_load, bin_path, trace_memory, include_model, read_mode).result())
+			else:
+				runs.append(benchmark_bin_load(bin_path, trace_memory=trace_memory, include_model=include_model, read_mode=read_mode))
+
+		result = _best_run(runs)
+		result.update({
+			"bin_path":         bin_path,
+			"bin_size_bytes":   os.path.getsize(bin_path),
+			"generate_seconds": time_generate if mob_kinds is not None else None,
+			"mob_kinds":        mob_kinds,
+		})
+
+		logging.getLogger(__name__).info("Loaded %s mobs in %.3fs (%.0f mobs/sec)", mob_count, result["load_seconds"], result["mobs_per_sec"] or 0)
+
+		results.append(result)
+
+	return {
+		"format_version": BENCH_FORMAT_VERSION,
+		"created":        datetime.datetime.now(datetime.timezone.utc).isoformat(),
+		"environment": {
+			"python":      platform.python_version(),
+			"platform":    platform.platform(),
+			"machine":     platform.machine(),
+			"cpu_count":   os.cpu_count(),
+			"avb_version": getattr(avb, "__version__", None),
+		},
+		"settings": {
+			"repeat":        max(int(repeat), 1),
+			"seed":          seed,
+			"trace_memory":  trace_memory,
+			"include_model": include_model,
+			"isolate":       isolate,
+			"read_mode":     str(read_mode),
+		},
+		"results": results,
+	}
@@ -0,0 +1,239 @@
+"""
+On-disk cache of parsed bins, so an unchanged bin doesn't need to be re-parsed
+"""
+
+import dataclasses, hashlib, logging, os, pickle, struct, threading, zlib
+from os import PathLike
+
+from ..binitems import binitemtypes
+from . import binparser
+
+CACHE_FORMAT_VERSION:int = 2
+"""Bump this whenever the shape of cached records or properties changes"""
+
+CACHE_MAGIC:bytes = b"BSBC"
+"""File signature for cache entries"""
+
+CACHE_FILE_EXTENSION:str = ".bsbc"
+"""File extension for cache entries"""
+
+DEFAULT_SIZE_BUDGET:int = 256 * 1024 * 1024
+"""Default size budget for the cache, in bytes"""
+
+_CACHE_HEADER = struct.Struct("<4sH")
+"""Magic, format version"""
+
+@dataclasses.dataclass(frozen=True)
+class BSBinCacheKey:
+	"""Identifies a bin file on disk at a given point in time"""
+
+	bin_path:str
+	"""Normalized absolute path to the bin"""
+
+	size:int
+	"""File size in bytes"""
+
+	mtime_ns:int
+	"""Last modified time in nanoseconds"""
+
+	@classmethod
+	def from_path(cls, bin_path:PathLike) -> "BSBinCacheKey":
+		"""Stat a bin on disk for its current identity"""
+
+		bin_path = os.path.normcase(os.path.abspath(bin_path))
+		stat     = os.stat(bin_path)
+
+		return cls(
+			bin_path = bin_path,
+			size     = stat.st_size,
+			mtime_ns = stat.st_mtime_ns,
+		)
+
+	def cacheName(self) -> str:
+		"""File name of the cache entry for this bin (independent of size and mtime)"""
+
+		return hashlib.sha1(self.bin_path.encode("utf-8")).hexdigest() + CACHE_FILE_EXTENSION
+
+@dataclasses.dataclass
+class BSBinCacheEntry:
+	"""Everything needed to replay a bin load"""
+
+	properties:binparser.BSBinPropertiesRecord
+	"""Bin view, sift, sort and appearance settings"""
+
+	records:list[binitemtypes.BSBinItemRecord]
+	"""Parsed bin items, in bin order"""
+
+class BSBinCache:
+	"""Versioned on-disk cache of parsed bins, trimmed LRU to a size budget"""
+
+	def __init__(self, cache_path:PathLike, size_budget:int=DEFAULT_SIZE_BUDGET):
+
+		self._cache_path  = os.fspath(cache_path)
+		self._size_budget = max(int(size_budget), 0)
+		self._lock        = threading.Lock()
+
+		os.makedirs(self._cache_path, exist_ok=True)
+
+		logging.getLogger(__name__).debug("Initialized bin cache at %s (budget=%s bytes)", self._cache_path, self._size_budget)
+
+	def cachePath(self) -> str:
+		"""Directory containing the cache entries"""
+
+		return self._cache_path
+
+	def setSizeBudget(self, size_budget:int):
+		"""Set the maximum total size of the cache, in bytes"""
+
+		self._size_budget = max(int(size_budget), 0)
+		self.trim()
+
+	def sizeBudget(self) -> int:
+		"""Maximum total size of the cache, in bytes"""
+
+		return self._size_budget
+
+	def _entryPath(self, cache_key:BSBinCacheKey) -> str:
+
+		return os.path.join(self._cache_path, cache_key.cacheName())
+
+	def load(self, cache_key:BSBinCacheKey) -> BSBinCacheEntry|None:
+		"""Return the cached entry for a bin, or `None` if it is missing or stale"""
+
+		entry_path = self._entryPath(cache_key)
+
+		try:
+			with open(entry_path, "rb") as cache_file:
+				magic, version = _CACHE_HEADER.unpack(cache_file.read(_CACHE_HEADER.size))
+				payload        = cache_file.read()
+
+		except FileNotFoundError:
+			return None
+
+		except (OSError, struct.error) as e:
+			logging.getLogger(__name__).warning("Could not read cache entry %s: %s", entry_path, e)
+			return None
+
+		if magic != CACHE_MAGIC or version != CACHE_FORMAT_VERSION:
+			logging.getLogger(__name__).debug("Discarding cache entry %s with unsupported version %s", entry_path, version)
+			self._remove(entry_path)
+			return None
+
+		try:
+			stored_key, entry = pickle.loads(zlib.decompress(payload))
+		except Exception as e:
+			logging.getLogger(__name__).warning("Discarding unreadable cache entry %s: %s", entry_path, e)
+			self._remove(entry_path)
+			return None
+
+		if stored_key != cache_key:
+			logging.getLogger(__name__).debug("Cache entry for %s is stale", cache_key.bin_path)
+			self._remove(entry_path)
+			return None
+
+		# Touch for LRU
+		try:
+			os.utime(entry_path)
+		except OSError:
+			pass
+
+		return entry
+
+	def store(self, cache_key:BSBinCacheKey, entry:BSBinCacheEntry) -> bool:
+		"""Write a parsed bin to the cache.  Returns `True` if the entry was written."""
+
+		entry_path = self._entryPath(cache_key)
+		temp_path  = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+		try:
+			payload = zlib.compress(pickle.dumps((cache_key, entry), protocol=pickle.HIGHEST_PROTOCOL), level=1)
+		except Exception as e:
+			logging.getLogger(__name__).warning("Could not serialize %s for the cache: %s", cache_key.bin_path, e)
+			return False
+
+		if self._size_budget and len(payload) > self._size_budget:
+			logging.getLogger(__name__).debug("Not caching %s: %s bytes exceeds the cache budget", cache_key.bin_path, len(payload))
+			return False
+
+		try:
+			with open(temp_path, "wb") as cache_file:
+				cache_file.write(_CACHE_HEADER.pack(CACHE_MAGIC, CACHE_FORMAT_VERSION))
+				cache_file.write(payload)
+
+			# Atomic swap so other windows never see a partial entry
+			os.replace(temp_path, entry_path)
+
+		except OSError as e:
+			logging.getLogger(__name__).warning("Could not write cache entry for %s: %s", cache_key.bin_path, e)
+			self._remove(temp_path)
+			return False
+
+		logging.getLogger(__name__).debug("Cached %s items for %s (%s bytes)", len(entry.records), cache_key.bin_path, len(payload))
+
+		self.trim()
+		return True
+
+	def invalidate(self, bin_path:PathLike):
+		"""Remove any cached entry for a bin"""
+
+		bin_path = os.path.normcase(os.path.abspath(bin_path))
+		self._remove(self._entryPath(BSBinCacheKey(bin_path=bin_path, size=0, mtime_ns=0)))
+
+	def totalSize(self) -> int:
+		"""Total size of all cache entries, in bytes"""
+
+		return sum(stat.st_size for _, stat in self._entries())
+
+	def trim(self):
+		"""Remove least-recently-used entries until the cache fits within its size budget"""
+
+		if not self._size_budget:
+			return
+
+		with self._lock:
+
+			entries    = sorted(self._entries(), key=lambda e: e[1].st_mtime_ns)
+			total_size = sum(stat.st_size for _, stat in entries)
+
+			while entries and total_size > self._size_budget:
+
+				entry_path, stat = entries.pop(0)
+
+				if self._remove(entry_path):
+					logging.getLogger(__name__).debug("Trimmed cache entry %s (%s bytes)", entry_path, stat.st_size)
+					total_size -= stat.st_size
+
+	def clear(self):
+		"""Remove all cache entries"""
+
+		with self._lock:
+			for entry_path, _ in self._entries():
+				self._remove(entry_path)
+
+	def _entries(self) -> list[tuple[str, os.stat_result]]:
+
+		entries = []
+
+		try:
+			with os.scandir(self._cache_path) as dir_entries:
+				for dir_entry in dir_entries:
+					if dir_entry.is_file() and dir_entry.name.endswith(CACHE_FILE_EXTENSION):
+						entries.append((dir_entry.path, dir_entry.stat()))
+
+		except OSError as e:
+			logging.getLogger(__name__).warning("Could not list cache entries in %s: %s", self._cache_path, e)
+
+		return entries
+
+	@staticmethod
+	def _remove(entry_path:str) -> bool:
+
+		try:
+			os.remove(entry_path)
+		except FileNotFoundError:
+			return False
+		except OSError as e:
+			logging.getLogger(__name__).warning("Could not remove cache entry %s: %s", entry_path, e)
+			return False
+
+		return True
@@ -0,0 +1,264 @@
+"""
+Headless export of bin contents to CSV, JSON Lines, or ALE
+
+Everything here runs without a `QApplication`, so it's safe to use on machines with no display
+"""
+
+import abc, csv, dataclasses, enum, json, logging, os, typing
+from os import PathLike
+
+import avb, avbutils
+
+from ..binitems import binitemtypes
+from ..binview  import binviewitemtypes
+from . import binio, binparser
+
+class BSExportFormat(enum.StrEnum):
+	"""Supported export formats"""
+
+	CSV   = "csv"
+	JSONL = "jsonl"
+	ALE   = "ale"
+
+	def fileExtension(self) -> str:
+		return "." + self.value
+
+@dataclasses.dataclass(frozen=True)
+class BSExportColumn:
+	"""A column to be exported"""
+
+	field_id     :avbutils.bins.BinColumnFieldIDs
+	display_name :str
+
+	@classmethod
+	def from_column_info(cls, column_info:binviewitemtypes.BSBinViewColumnInfo) -> typing.Self:
+		return cls(field_id=column_info.field_id, display_name=column_info.display_name)
+
+@dataclasses.dataclass(frozen=True)
+class BSExportResult:
+	"""Outcome of exporting one bin"""
+
+	bin_path    :str
+	output_path :str|None
+	item_count  :int
+	error       :str|None = None
+
+def export_columns_from_bin(bin_content:avb.bin.Bin, include_hidden:bool=False) -> list[BSExportColumn]:
+	"""Columns to export, in bin view order"""
+
+	view_setting = binparser.bin_view_setting_from_bin(bin_content)
+	columns      = [BSExportColumn.from_column_info(c) for c in view_setting.columns if include_hidden or not c.is_hidden]
+
+	# A bin view with nothing showing still has names, at least
+	return columns or [BSExportColumn(field_id=avbutils.bins.BinColumnFieldIDs.Name, display_name="Name")]
+
+def export_value(bin_item:binitemtypes.BSBinItemInfo, column:BSExportColumn) -> typing.Any:
+	"""JSON-ready value of a bin item for a given column, or `None`"""
+
+	view_items = bin_item.view_items
+
+	if column.field_id not in view_items:
+		return None
+
+	if column.field_id == avbutils.bins.BinColumnFieldIDs.User:
+		user_items = view_items[column.field_id]
+		return user_items[column.display_name].to_json() if column.display_name in user_items else None
+
+	return view_items[column.field_id].to_json()
+
+def export_value_to_text(value:typing.Any) -> str:
+	"""Flatten a JSON-ready value for text-based formats"""
+
+	if value is None:
+		return ""
+
+	if isinstance(value, dict):
+
+		for key in ("formatted", "hex"):
+			if value.get(key) is not None:
+				return str(value[key])
+
+		return json.dumps(value, ensure_ascii=False)
+
+	if isinstance(value, (list, tuple)):
+		return ", ".join(export_value_to_text(v) for v in value)
+
+	return str(value)
+
+class BSAbstractExportWriter(abc.ABC):
+	"""Writes bin items to a stream, one at a time"""
+
+	def __init__(self, stream:typing.TextIO, columns:list[BSExportColumn], bin_path:PathLike):
+
+		self._stream   = stream
+		self._columns  = columns
+		self._bin_path = os.fspath(bin_path)
+
+	def begin(self):
+		"""Write anything that comes before the first item"""
+
+	@abc.abstractmethod
+	def writeItem(self, bin_item:binitemtypes.BSBinItemInfo):
+		"""Write a single bin item"""
+
+	def end(self):
+		"""Write anything that comes after the last item"""
+
+class BSCsvExportWriter(BSAbstractExportWriter):
+	"""Comma-separated values with a header row"""
+
+	def begin(self):
+
+		self._writer = csv.writer(self._stream)
+		self._writer.writerow(c.display_name for c in self._columns)
+
+	def writeItem(self, bin_item:binitemtypes.BSBinItemInfo):
+
+		self._writer.writerow(export_value_to_text(export_value(bin_item, c)) for c in self._columns)
+
+class BSJsonlExportWriter(BSAbstractExportWriter):
+	"""One JSON object per line, per bin item"""
+
+	def writeItem(self, bin_item:binitemtypes.BSBinItemInfo):
+
+		item_dict = {
+			"bin":    self._bin_path,
+			"mob_id": str(bin_item.mob_id),
+			"columns": {c.display_name: export_value(bin_item, c) for c in self._columns},
+		}
+
+		self._stream.write(json.dumps(item_dict, ensure_ascii=False, default=str))
+		self._stream.write("\n")
+
+class BSAleExportWriter(BSAbstractExportWriter):
+	"""Avid Log Exchange"""
+
+	DEFAULT_FPS = "23.976"
+	"""Used when no item in the bin has timecode to go by"""
+
+	def __init__(self, *args, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		# ALE declares its frame rate up top, so hold items until one with timecode turns up
+		self._pending_items:list[binitemtypes.BSBinItemInfo] = []
+		self._fps:str|None = None
+
+	def writeItem(self, bin_item:binitemtypes.BSBinItemInfo):
+
+		if self._fps is None:
+
+			if bin_item.primary_timecode is None:
+				self._pending_items.append(bin_item)
+				return
+
+			self._writeHeading(self._formatRate(bin_item.primary_timecode.rate))
+
+		self._writeRow(bin_item)
+
+	def end(self):
+
+		if self._fps is None:
+			self._writeHeading(self.DEFAULT_FPS)
+
+	def _writeHeading(self, fps:str):
+
+		self._fps = fps
+
+		self._stream.write("Heading\n")
+		self._stream.write("FIELD_DELIM\tTABS\n")
+		self._stream.write(f"FPS\t{fps}\n")
+		self._stream.write("\n")
+		self._stream.write("Column\n")
+		self._stream.write("\t".join(self._sanitize(c.display_name) for c in self._columns) + "\n")
+		self._stream.write("\n")
+		self._stream.write("Data\n")
+
+		for bin_item in self._pending_items:
+			self._writeRow(bin_item)
+
+		self._pending_items = []
+
+	def _writeRow(self, bin_item:binitemtypes.BSBinItemInfo):
+
+		self._stream.write("\t".join(self._sanitize(export_value_to_text(export_value(bin_item, c))) for c in self._columns) + "\n")
+
+	@staticmethod
+	def _formatRate(rate:typing.Any) -> str:
+
+		rate = float(rate)
+
+		return str(int(rate)) if rate.is_integer() else f"{rate:.3f}".rstrip("0")
+
+	@staticmethod
+	def _sanitize(text:str) -> str:
+		"""Tabs and line breaks would break the format"""
+
+		return " ".join(str(text).split()) if any(c in text for c in "\t\r\n") else text
+
+EXPORT_WRITERS:dict[BSExportFormat, type[BSAbstractExportWriter]] = {
+	BSExportFormat.CSV:   BSCsvExportWriter,
+	BSExportFormat.JSONL: BSJsonlExportWriter,
+	BSExportFormat.ALE:   BSAleExportWriter,
+}
+
+def export_bin_to_stream(bin_path:PathLike, stream:typing.TextIO, export_format:BSExportFormat, include_hidden:bool=False) -> int:
+	"""Parse a bin and stream each item to the output as it's parsed.  Returns the number of items written."""
+
+	item_count = 0
+
+	bin_handle, _ = binio.open_bin(bin_path)
+
+	with bin_handle:
+
+		writer = EXPORT_WRITERS[BSExportFormat(export_format)](
+			stream   = stream,
+			columns  = export_columns_from_bin(bin_handle.content, include_hidden=include_hidden),
+			bin_path = bin_path,
+		)
+
+		writer.begin()
+
+		parse_context = binparser.BSBinParseContext(bin_handle.content)
+
+		for bin_item in bin_handle.content.items:
+
+			try:
+				writer.writeItem(binparser.load_item_from_bin(bin_item, parse_context))
+			except Exception as e:
+				logging.getLogger(__name__).error("Skipping item in %s: %s", bin_path, e)
+				continue
+
+			item_count += 1
+
+		writer.end()
+
+	return item_count
+
+def export_bin_to_path(bin_path:PathLike, output_path:PathLike, export_format:BSExportFormat, include_hidden:bool=False) -> BSExportResult:
+	"""Export a bin to a file, written via a temp file so a failed export never leaves a partial file behind"""
+
+	bin_path    = os.fspath(bin_path)
+	output_path = os.fspath(output_path)
+	temp_path   = f"{output_path}.{os.getpid()}.tmp"
+
+	try:
+
+		# ALE is traditionally CRLF; the csv module manages its own line endings
+		newline = "\r\n" if export_format == BSExportFormat.ALE else "" if export_format == BSExportFormat.CSV else "\n"
+
+		with open(temp_path, "w", encoding="utf-8", newline=newline) as output_file:
+			item_count = export_bin_to_stream(bin_path, output_file, export_format, include_hidden)
+
+		os.replace(temp_path, output_path)
+
+	except Exception as e:
+
+		try:
+			os.remove(temp_path)
+		except OSError:
+			pass
+
+		return BSExportResult(bin_path=bin_path, output_path=None, item_count=0, error=f"{type(e).__name__}: {e}")
+
+	return BSExportResult(bin_path=bin_path, output_path=output_path, item_count=item_count)
@@ -0,0 +1,216 @@
+"""
+Getting bin files off disk (or off the network) ahead of parsing them
+
+Bins are parsed with lots of small seeks and reads, which is fine on a local disk but costs a round trip
+each on a NAS.  So, by default, bins are read into memory in one go.  Memory-mapping is there on request,
+but a bin saved over while it's mapped takes the whole app down with it.  Either way, time spent on I/O is
+counted separately from time spent parsing.
+"""
+
+import dataclasses, enum, io, logging, mmap, os, time, typing
+from os import PathLike
+
+import avb
+
+READ_AHEAD_MAX_BYTES:int = 1024 ** 3
+"""Bins larger than this are read as they're parsed rather than held in memory all at once"""
+
+LOCK_FILE_EXTENSION:str = ".lck"
+"""Avid writes a lock file alongside a bin while a system has it open for writing"""
+
+class BSBinReadMode(enum.StrEnum):
+	"""How a bin file is read"""
+
+	AUTO       = "auto"
+	"""Read bins ahead, or as they're parsed if they're too big to hold in memory"""
+
+	BUFFERED   = "buffered"
+	"""Read as the parser goes, in small buffered reads"""
+
+	READ_AHEAD = "read_ahead"
+	"""Read the whole bin into memory with one large sequential read"""
+
+	MMAP       = "mmap"
+	"""Memory-map the bin, leaving the paging to the OS"""
+
+@dataclasses.dataclass
+class BSBinIOStats:
+	"""Time and bytes spent reading a bin"""
+
+	read_mode:BSBinReadMode
+	"""Read mode actually used (never `AUTO`)"""
+
+	seconds:float = 0.0
+	"""Time spent waiting on reads.  Page faults on memory-mapped bins can't be counted, so this is just the time to map them."""
+
+	byte_count:int = 0
+	"""Bytes read (or mapped)"""
+
+	read_count:int = 0
+	"""Number of reads it took"""
+
+class BSTimedRawFile(io.RawIOBase):
+	"""Unbuffered file that counts the time and bytes spent reading it"""
+
+	def __init__(self, raw_file:io.RawIOBase, io_stats:BSBinIOStats):
+
+		super().__init__()
+
+		self._raw_file = raw_file
+		self._io_stats = io_stats
+
+	def readable(self) -> bool:
+		return True
+
+	def seekable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int|None:
+
+		time_start = time.perf_counter()
+		byte_count = self._raw_file.readinto(buffer)
+
+		self._io_stats.seconds    += time.perf_counter() - time_start
+		self._io_stats.byte_count += byte_count or 0
+		self._io_stats.read_count += 1
+
+		return byte_count
+
+	def seek(self, offset:int, whence:int=io.SEEK_SET) -> int:
+		return self._raw_file.seek(offset, whence)
+
+	def tell(self) -> int:
+		return self._raw_file.tell()
+
+	def close(self):
+
+		if not self.closed:
+			self._raw_file.close()
+
+		super().close()
+
+class BSMappedFile(io.RawIOBase):
+	"""Read-only file over a memory-mapped bin"""
+
+	def __init__(self, file_handle:typing.BinaryIO, mapping:mmap.mmap):
+
+		super().__init__()
+
+		self._file_handle = file_handle
+		self._mapping     = mapping
+		self._view        = memoryview(mapping)
+		self._position    = 0
+
+	def readable(self) -> bool:
+		return True
+
+	def seekable(self) -> bool:
+		return True
+
+	def readinto(self, buffer) -> int:
+
+		byte_count = max(min(len(buffer), len(self._view) - self._position), 0)
+
+		with memoryview(buffer) as buffer_view:
+			buffer_view.cast("B")[:byte_count] = self._view[self._position:self._position + byte_count]
+
+		self._position += byte_count
+		return byte_count
+
+	def seek(self, offset:int, whence:int=io.SEEK_SET) -> int:
+
+		if whence == io.SEEK_CUR:
+			offset += self._position
+		elif whence == io.SEEK_END:
+			offset += len(self._view)
+
+		self._position = max(offset, 0)
+		return self._position
+
+	def tell(self) -> int:
+		return self._position
+
+	def close(self):
+
+		if not self.closed:
+
+			# The view has to go before the mapping will close
+			self._view.release()
+			self._mapping.close()
+			self._file_handle.close()
+
+		super().close()
+
+def lock_path_for_bin(bin_path:PathLike) -> str:
+	"""The lock file path Avid would use for a given bin"""
+
+	return os.path.splitext(os.fspath(bin_path))[0] + LOCK_FILE_EXTENSION
+
+def resolve_read_mode(bin_path:PathLike, read_mode:BSBinReadMode=BSBinReadMode.AUTO) -> BSBinReadMode:
+	"""The read mode to actually use for a bin"""
+
+	read_mode = BSBinReadMode(read_mode)
+
+	# Never map unless asked to: a bin truncated or rewritten while mapped kills the app (SIGBUS) the next time it's read
+	if read_mode == BSBinReadMode.AUTO:
+		read_mode = BSBinReadMode.READ_AHEAD
+
+	if read_mode == BSBinReadMode.READ_AHEAD and os.path.getsize(bin_path) > READ_AHEAD_MAX_BYTES:
+		read_mode = BSBinReadMode.BUFFERED
+
+	return read_mode
+
+def open_bin_file(bin_path:PathLike, read_mode:BSBinReadMode=BSBinReadMode.AUTO, buffer_size:int=io.DEFAULT_BUFFER_SIZE) -> tuple[typing.BinaryIO, BSBinIOStats]:
+	"""
+	Open a bin file for `avb.open()`, along with stats that keep counting I/O for as long as the file is read
+
+	`buffer_size` only applies to buffered reads
+	"""
+
+	read_mode = resolve_read_mode(bin_path, read_mode)
+	io_stats  = BSBinIOStats(read_mode=read_mode)
+
+	if read_mode == BSBinReadMode.MMAP:
+
+		file_handle = open(bin_path, "rb", buffering=0)
+
+		try:
+			time_start = time.perf_counter()
+			mapping    = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+		except (OSError, ValueError) as e:
+			# Empty files and some file systems can't be mapped
+			file_handle.close()
+			logging.getLogger(__name__).debug("Could not map %s, reading as usual instead: %s", bin_path, e)
+			return open_bin_file(bin_path, BSBinReadMode.BUFFERED, buffer_size)
+
+		io_stats.seconds    = time.perf_counter() - time_start
+		io_stats.byte_count = len(mapping)
+
+		return BSMappedFile(file_handle, mapping), io_stats
+
+	if read_mode == BSBinReadMode.READ_AHEAD:
+
+		time_start = time.perf_counter()
+
+		with open(bin_path, "rb", buffering=0) as file_handle:
+			bin_data = file_handle.readall()
+
+		io_stats.seconds    = time.perf_counter() - time_start
+		io_stats.byte_count = len(bin_data)
+		io_stats.read_count = 1
+
+		# `BytesIO` shares the `bytes` rather than copying them
+		return io.BytesIO(bin_data), io_stats
+
+	return io.BufferedReader(BSTimedRawFile(io.FileIO(bin_path, "rb"), io_stats), buffer_size=buffer_size), io_stats
+
+def open_bin(bin_path:PathLike, read_mode:BSBinReadMode=BSBinReadMode.AUTO, buffer_size:int=io.DEFAULT_BUFFER_SIZE) -> tuple[avb.file.AVBFile, BSBinIOStats]:
+	"""Open a bin for parsing with `avb`"""
+
+	bin_file, io_stats = open_bin_file(bin_path, read_mode, buffer_size)
+
+	try:
+		return avb.open(bin_file), io_stats
+	except Exception:
+		bin_file.close()
+		raise
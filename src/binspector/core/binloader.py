@@ -3,11 +3,114 @@
 Logic is implemented via `.binparser`
 """
 
-import logging
+import itertools, logging, math, multiprocessing, threading, time, typing
+from concurrent import futures
 from os import PathLike
 from PySide6 import QtCore
 import avb
-from . import binparser
+from . import binparser, bincache, binio, binprofile
+from ..binitems import binitemtypes
+
+PARALLEL_MIN_ITEM_COUNT:int = 2_000
+"""Bins with fewer items than this are parsed serially, since spinning up worker processes would cost more than it saves"""
+
+PARALLEL_SHARDS_PER_PROCESS:int = 4
+"""Split the bin items into roughly this many shards per worker process"""
+
+ADAPTIVE_INITIAL_BATCH_SIZE:int = 64
+"""First batch size for adaptive batching, kept small so the first measurement comes back quickly"""
+
+ADAPTIVE_MIN_BATCH_SIZE:int = 16
+"""Adaptive batches never get smaller than this, so per-batch overhead doesn't take over"""
+
+ADAPTIVE_MAX_BATCH_SIZE:int = 10_000
+"""Adaptive batches never get larger than this"""
+
+ADAPTIVE_MAX_GROWTH:float = 2.0
+"""Grow a batch by at most this factor over the last one, so one quick batch can't cause a big stall"""
+
+ADAPTIVE_SMOOTHING:float = 0.5
+"""Weight of the newest measurement in the running per-mob cost"""
+
+CANCEL_POLL_INTERVAL_SEC:float = 0.1
+"""How often a load waiting on worker processes checks whether it's been cancelled"""
+
+def load_records_from_bin_path(bin_path:PathLike, start:int, stop:int, slow_mob_count:int=binprofile.DEFAULT_SLOW_MOB_COUNT, read_mode:binio.BSBinReadMode=binio.BSBinReadMode.BUFFERED) -> tuple[list[binitemtypes.BSBinItemRecord], list[str], list[binprofile.BSSlowMobInfo]]:
+	"""Parse a range of bin items in a worker process, returning records, any error messages, and the slowest mobs to parse"""
+
+	records  = []
+	errors   = []
+	profiler = binprofile.BSLoadProfiler(slow_mob_count=slow_mob_count)
+
+	bin_handle, _ = binio.open_bin(bin_path, read_mode)
+
+	with bin_handle:
+
+		parse_context = binparser.BSBinParseContext(bin_handle.content)
+
+		for bin_index, bin_item in enumerate(bin_handle.content.items[start:stop], start=start):
+
+			time_start = time.perf_counter()
+
+			try:
+				record = binparser.item_record_from_bin(bin_item, parse_context, bin_index)
+			except Exception as e:
+				errors.append(f"{type(e).__name__}: {e}")
+				continue
+
+			profiler.recordMob(record.name, record.item_type, time.perf_counter() - time_start)
+			records.append(record)
+	
+	return records, errors, profiler.slowMobs()
+
+class BSLoadCancelToken:
+	"""Thread-safe flag for cancelling a bin load, whether it's still queued or already running"""
+
+	def __init__(self):
+		self._event = threading.Event()
+
+	def cancel(self):
+		self._event.set()
+
+	def isCancelled(self) -> bool:
+		return self._event.is_set()
+
+class BSAdaptiveBatchSizer:
+	"""
+	Sizes each batch of mobs so that handling it on the main thread stays within a time budget, going by how long the batches before it took
+
+	Without a budget, batches are a fixed size
+	"""
+
+	def __init__(self, batch_size:int, budget_msec:float|None=None):
+
+		self._fixed_size  = max(int(batch_size), 1)
+		self._budget_sec  = budget_msec / 1000 if budget_msec else None
+		self._batch_size  = min(ADAPTIVE_INITIAL_BATCH_SIZE, self._fixed_size) if self._budget_sec else self._fixed_size
+		self._mob_cost    = None # Smoothed main-thread seconds per mob
+
+	def isAdaptive(self) -> bool:
+		return self._budget_sec is not None
+
+	def batchSize(self) -> int:
+		"""Number of mobs to send in the next batch"""
+
+		return self._batch_size
+
+	def addSample(self, mob_count:int, seconds:float):
+		"""Main-thread time taken by the last batch"""
+
+		if not self._budget_sec or mob_count <= 0:
+			return
+
+		mob_cost       = max(seconds, 1e-6) / mob_count
+		self._mob_cost = mob_cost if self._mob_cost is None else ADAPTIVE_SMOOTHING * mob_cost + (1 - ADAPTIVE_SMOOTHING) * self._mob_cost
+
+		# Shrink right away when over budget; grow cautiously
+		target_size = int(self._budget_sec / self._mob_cost)
+		target_size = min(target_size, int(self._batch_size * ADAPTIVE_MAX_GROWTH))
+
+		self._batch_size = max(ADAPTIVE_MIN_BATCH_SIZE, min(target_size, ADAPTIVE_MAX_BATCH_SIZE))
 
 class BSBinViewLoader(QtCore.QRunnable):
 	"""Load a given bin in a threadpool"""
@@ -35,6 +138,9 @@ class BSBinViewLoader(QtCore.QRunnable):
 		sig_got_bin_display_settings    = QtCore.Signal(object)
 		sig_got_bin_appearance_settings = QtCore.Signal(object, object, object, object, object, object, object)
 
+		sig_got_load_profile            = QtCore.Signal(object)
+		"""Timings for the load (`binprofile.BSBinLoadProfile`), emitted just before `sig_done_loading`"""
+
 		# Runnable control
 		_sig_user_request_stop = QtCore.Signal()
 
@@ -42,15 +148,31 @@ class BSBinViewLoader(QtCore.QRunnable):
 		def requestStop(self):
 			self._sig_user_request_stop.emit()
 
-	def __init__(self, bin_path:PathLike, signals:Signals, queue_size:int=500, *args, **kwargs):
+	def __init__(self, bin_path:PathLike, signals:Signals, queue_size:int=500, process_count:int=0, cache:bincache.BSBinCache|None=None, slow_mob_count:int=binprofile.DEFAULT_SLOW_MOB_COUNT, batch_budget_msec:float|None=None, visible_item_counts:dict[int,int]|None=None, cancel_token:BSLoadCancelToken|None=None, read_mode:binio.BSBinReadMode=binio.BSBinReadMode.AUTO, *args, **kwargs):
 		
 		super().__init__(*args, **kwargs)
 		
 		self._bin_path = bin_path
 		self._signals  = signals
 		self._mob_queue_size = queue_size
-
-		self._stop_requested = False
+		self._batch_sizer    = BSAdaptiveBatchSizer(queue_size, batch_budget_msec)
+		self._process_count  = max(int(process_count), 0)
+		self._visible_item_counts = dict(visible_item_counts or {}) # Items that fit on screen, per display mode
+		self._read_mode      = binio.BSBinReadMode(read_mode)
+		self._io_stats       = None
+
+		self._cache               = cache
+		self._cache_key           = None
+		self._pending_cache_entry = None
+		self._had_errors          = False
+		self._was_aborted         = False
+
+		self._slow_mob_count      = max(int(slow_mob_count), 0)
+		self._profiler            = binprofile.BSLoadProfiler(slow_mob_count=self._slow_mob_count)
+		self._loaded_count        = 0
+		self._used_processes      = 0
+
+		self._cancel_token = cancel_token or BSLoadCancelToken()
 		self._signals._sig_user_request_stop.connect(self.requestStop)
 
 	def signals(self) -> Signals:
@@ -58,13 +180,27 @@ class BSBinViewLoader(QtCore.QRunnable):
 
 		return self._signals
 	
+	def binPath(self) -> PathLike:
+		return self._bin_path
+	
+	def cancelToken(self) -> BSLoadCancelToken:
+		"""The token that stops this load, which may be cancelled from any thread"""
+
+		return self._cancel_token
+	
 	def requestStop(self):
 		"""Request graceful stop"""
 
-		if not self._stop_requested:
+		if not self._cancel_token.isCancelled():
 			logging.getLogger(__name__).warning("User requested abort")
 
-		self._stop_requested = True
+		self._cancel_token.cancel()
+
+	def emitAborted(self, message:str|None=None):
+		"""Report that the bin wasn't loaded in full, so rows not sent yet may well still be in the bin"""
+
+		self._was_aborted = True
+		self._signals.sig_aborted_loading.emit(message)
 
 	def loadDataFromBin(self, bin_handle:avb.file.AVBFile):
 		"""Load and emit the data"""
@@ -74,107 +210,399 @@ class BSBinViewLoader(QtCore.QRunnable):
 		# out of even a corrupt bin.  So, lots of `try`s here but not bailing unless the file can't be
 		# opened or understood as an `avb` file or something
 
-		# Load bin properties (view, sorting, etc)
+		# NOTE: Mitigates signal freakouts during early close -- but need to do this better and more thoroughly
+		if self._cancel_token.isCancelled():
+			self.emitAborted()
+			return
+
+		properties = self.loadPropertiesFromBin(bin_handle)
+		self.emitProperties(properties)
+
+		if self._cancel_token.isCancelled():
+			self.emitAborted()
+			return
+
+		priority_indexes = self.priorityItemIndexes(bin_handle, properties)
+
+		if self._process_count and len(bin_handle.content.items) >= PARALLEL_MIN_ITEM_COUNT:
+			self._used_processes = self._process_count
+			records = self.loadItemsInProcesses(bin_handle, priority_indexes)
+		else:
+			records = self.loadItems(bin_handle, priority_indexes)
+
+		# Written out in `run()` once the file is closed and loading is reported done
+		if self._cache is not None and self._cache_key is not None and records is not None and not self._had_errors:
+			self._pending_cache_entry = bincache.BSBinCacheEntry(properties=properties, records=records)
+
+	def loadPropertiesFromBin(self, bin_handle:avb.file.AVBFile) -> binparser.BSBinPropertiesRecord:
+		"""Parse bin properties (view, sorting, etc).  Anything that can't be parsed is left as `None`."""
+
+		properties = binparser.BSBinPropertiesRecord()
+
 		try:
+			binparser.bin_properties_from_bin(bin_handle.content, properties, phase_span=self._profiler.span)
+		except Exception as e:
+			logging.getLogger(__name__).error("Encountered error while loading bin properties: %s", e)
+			self.emitException(e)
+		
+		return properties
 
-			# NOTE: Mitigates signal freakouts during early close -- but need to do this better and more thoroughly
-			if self._stop_requested:
-				#self._signals.sig_aborted_loading.emit(None)
-				return
+	def priorityItemIndexes(self, bin_handle:avb.file.AVBFile, properties:binparser.BSBinPropertiesRecord) -> list[int]:
+		"""Bin items to parse ahead of the rest, so that whatever lands on screen first is loaded first"""
+
+		if properties.display_mode is None or not self._visible_item_counts.get(properties.display_mode):
+			return []
+
+		with self._profiler.span(binprofile.BSLoadPhase.VISIBLE_FIRST):
 
-			logging.getLogger(__name__).debug("Begin display flags")
 			try:
-				opts = binparser.bin_display_flags_from_bin(bin_handle.content)
-			except ValueError as e:
-				logging.getLogger(__name__).error("Could not parse Bin Display Settings: %s.  Using defaults instead.", e)
-				import avbutils
-				opts = avbutils.BinDisplayItemTypes.default_items()
-			finally:
-				self._signals.sig_got_bin_display_settings.emit(opts)
-			logging.getLogger(__name__).debug("End display flags")
-			
-			logging.getLogger(__name__).debug("Begin view settings")
+				priority_indexes = binparser.priority_item_indexes(
+					bin_handle.content,
+					display_mode  = properties.display_mode,
+					view_setting  = properties.view_setting,
+					sort_settings = properties.sort_settings,
+					count         = self._visible_item_counts[properties.display_mode],
+				)
+			except Exception as e:
+				logging.getLogger(__name__).warning("Could not work out which items are visible first, loading in bin order instead: %s", e)
+				return []
+		
+		logging.getLogger(__name__).debug("Loading %s visible items first", len(priority_indexes))
+		return priority_indexes
 
-			view_setting = binparser.bin_view_setting_from_bin(bin_handle.content)
-			self._signals.sig_got_view_settings     .emit(view_setting)
-			self._signals.sig_got_text_column_widths.emit(binparser.bin_column_widths_from_bin(bin_handle.content))
-			self._signals.sig_got_frame_mode_scale  .emit(binparser.bin_frame_view_scale_from_bin(bin_handle.content))
-			self._signals.sig_got_script_mode_scale .emit(binparser.bin_scipt_view_scale_from_bin(bin_handle.content))
+	def emitProperties(self, properties:binparser.BSBinPropertiesRecord):
+		"""Emit whichever bin properties were parsed"""
 
-			logging.getLogger(__name__).debug("End view settings")
+		# Item count first, so the progress bar is sized before anything else happens
+		if properties.mob_count is not None:
+			self._signals.sig_got_mob_count.emit(properties.mob_count)
 
-			logging.getLogger(__name__).debug("Begin display mode")
-			self._signals.sig_got_display_mode.emit(binparser.display_mode_from_bin(bin_handle.content))
-			logging.getLogger(__name__).debug("End display mode")
+		if properties.display_flags is not None:
+			self._signals.sig_got_bin_display_settings.emit(properties.display_flags)
 
-			logging.getLogger(__name__).debug("Begin sift settings")
-			self._signals.sig_got_sift_settings.emit(binparser.sift_settings_from_bin(bin_handle.content, view_setting=view_setting))
-			logging.getLogger(__name__).debug("End sift settings")
+		if properties.view_setting is not None:
+			self._signals.sig_got_view_settings.emit(properties.view_setting)
 
-			logging.getLogger(__name__).debug("Begin sort settings")
-			self._signals.sig_got_sort_settings.emit(binparser.sort_settings_from_bin(bin_handle.content))
-			logging.getLogger(__name__).debug("End sort settings")
+		if properties.column_widths is not None:
+			self._signals.sig_got_text_column_widths.emit(properties.column_widths)
 
-			logging.getLogger(__name__).debug("Begin appearance settings")
-			self._signals.sig_got_bin_appearance_settings.emit(*binparser.appearance_settings_from_bin(bin_handle.content))
-			logging.getLogger(__name__).debug("End appearance settings")
+		if properties.frame_scale is not None:
+			self._signals.sig_got_frame_mode_scale.emit(properties.frame_scale)
 
-		except Exception as e:
-			logging.getLogger(__name__).error("Encountered error while loading bin properties: %s", e)
-			self._signals.sig_got_exception.emit(e)
+		if properties.script_scale is not None:
+			self._signals.sig_got_script_mode_scale.emit(properties.script_scale)
+
+		if properties.display_mode is not None:
+			self._signals.sig_got_display_mode.emit(properties.display_mode)
+
+		if properties.sift_settings is not None:
+			self._signals.sig_got_sift_settings.emit(properties.sift_settings)
+
+		if properties.sort_settings is not None:
+			self._signals.sig_got_sort_settings.emit(properties.sort_settings)
+
+		if properties.appearance_settings is not None:
+			self._signals.sig_got_bin_appearance_settings.emit(*properties.appearance_settings)
+
+
+	def emitException(self, exception:Exception):
+		"""Report a non-fatal exception.  Bins with errors are not cached."""
+
+		self._had_errors = True
+		self._signals.sig_got_exception.emit(exception)
+
+	def loadDataFromCache(self, cache_entry:bincache.BSBinCacheEntry):
+		"""Replay a cached bin through the usual signals"""
+
+		logging.getLogger(__name__).debug("Loading %s items from cache", len(cache_entry.records))
+
+		self.emitProperties(cache_entry.properties)
+		self.emitItemsFromRecords(cache_entry.records)
+
+	def emitItemsFromRecords(self, records:typing.Iterable[binitemtypes.BSBinItemRecord]) -> bool:
+		"""Emit parsed records in queue-sized batches.  Returns `False` if stopped early."""
+
+		mob_queue  = list()
+		time_batch = time.perf_counter()
+
+		for record in records:
+
+			if self._cancel_token.isCancelled():
+				self.emitAborted()
+				return False
+
+			mob_queue.append(record)
 			
-		# Get mob count for progress
-		try:
-			logging.getLogger(__name__).debug("Begin bin item count")
-			self._signals.sig_got_mob_count.emit(len(bin_handle.content.items))
-			logging.getLogger(__name__).debug("End bin item count")
-		except Exception as e:
-			self._signals.sig_got_exception.emit(e)
+			if len(mob_queue) >= self._batch_sizer.batchSize():
+				self._profiler.addTime(binprofile.BSLoadPhase.ITEM_ITERATION, time.perf_counter() - time_batch)
+				self.emitMobs(mob_queue)
+				mob_queue  = list()
+				time_batch = time.perf_counter()
+		
+		self._profiler.addTime(binprofile.BSLoadPhase.ITEM_ITERATION, time.perf_counter() - time_batch)
+		
+		if len(mob_queue):
 
-		mob_queue = list()
+			logging.getLogger(__name__).debug("Flushing the final %s mobs", len(mob_queue))
+			self.emitMobs(mob_queue)
 		
-		logging.getLogger(__name__).debug("Begin bin item loading with queue size=%s", self._mob_queue_size)
+		return True
+
+	def emitMobs(self, mob_queue:list[binitemtypes.BSBinItemRecord]):
+		"""Hand a batch of bin items to the window.  The connection blocks until they're in the model, so that's what gets timed here (and what sizes the next batch)."""
+
+		# The window may be on its way out, so don't block on it for nothing
+		if self._cancel_token.isCancelled():
+			return
+
+		time_start = time.perf_counter()
+
+		with self._profiler.span(binprofile.BSLoadPhase.MODEL_INSERTION):
+			self._signals.sig_got_mobs.emit(mob_queue)
+
+		self._batch_sizer.addSample(len(mob_queue), time.perf_counter() - time_start)
+		self._loaded_count += len(mob_queue)
+
+	def emitLoadProfile(self, from_cache:bool, completed:bool):
+		"""Report where the time went"""
+
+		self._signals.sig_got_load_profile.emit(
+			self._profiler.profile(
+				bin_path      = self._bin_path,
+				mob_count     = self._loaded_count,
+				from_cache    = from_cache,
+				completed     = completed,
+				process_count = self._used_processes,
+				io_mode       = self._io_stats.read_mode if self._io_stats else None,
+				io_seconds    = self._io_stats.seconds if self._io_stats else 0.0,
+				io_bytes      = self._io_stats.byte_count if self._io_stats else 0,
+			)
+		)
+
+	def emitDone(self, from_cache:bool, completed:bool):
+		"""Report the load profile, and that loading is done"""
+
+		# However it stopped short, say so, or unmatched rows are dropped as though the bin was read to the end
+		if not completed and not self._was_aborted:
+			self.emitAborted()
+
+		self.emitLoadProfile(from_cache=from_cache, completed=completed)
+		self._signals.sig_done_loading.emit()
+
+	def loadItems(self, bin_handle:avb.file.AVBFile, priority_indexes:list[int]|None=None) -> list[binitemtypes.BSBinItemRecord]|None:
+		"""
+		Parse and emit each bin item in this thread.  Returns the parsed records, or `None` if stopped early.
+
+		Items in `priority_indexes` are parsed first and sent as their own batch, followed by the rest in bin order.
+		"""
+
+		mob_queue  = list()
+		records    = list()
+		time_batch = time.perf_counter()
+
+		# Shared upstream mobs get resolved once for the whole bin
+		parse_context = binparser.BSBinParseContext(bin_handle.content)
+
+		bin_items        = bin_handle.content.items
+		priority_indexes = priority_indexes or []
+		priority_set     = set(priority_indexes)
+		item_indexes     = itertools.chain(priority_indexes, (idx for idx in range(len(bin_items)) if idx not in priority_set))
+		priority_pending = len(priority_indexes)
+		
+		logging.getLogger(__name__).debug("Begin bin item loading with queue size=%s (adaptive=%s)", self._batch_sizer.batchSize(), self._batch_sizer.isAdaptive())
 		# Load each mob
-		for bin_item in bin_handle.content.items:
+		for item_index in item_indexes:
 
-			if self._stop_requested:
+			bin_item = bin_items[item_index]
+			priority_pending -= 1
 
-				self._signals.sig_aborted_loading.emit(None)
+			if self._cancel_token.isCancelled():
+
+				self.emitAborted()
 				break
 
+			time_mob = time.perf_counter()
+
 			try:
-				mob_queue.append(binparser.load_item_from_bin(bin_item))
+				record = binparser.item_record_from_bin(bin_item, parse_context, item_index)
+				self._profiler.recordMob(record.name, record.item_type, time.perf_counter() - time_mob)
+				mob_queue.append(record)
+				records.append(record)
 				#self._signals.sig_got_mob.emit()
 			except Exception as e:
-				self._signals.sig_got_exception.emit(e)
+				self.emitException(e)
 			
-			if len(mob_queue) == self._mob_queue_size:
-				self._signals.sig_got_mobs.emit(mob_queue)
-				mob_queue = list()
+			# Send the visible items off as soon as they're all in, rather than waiting on a full batch
+			if len(mob_queue) >= self._batch_sizer.batchSize() or (mob_queue and priority_pending == 0):
+				self._profiler.addTime(binprofile.BSLoadPhase.ITEM_ITERATION, time.perf_counter() - time_batch)
+				self.emitMobs(mob_queue)
+				mob_queue  = list()
+				time_batch = time.perf_counter()
 		
-		if self._stop_requested:
-			return
+		self._profiler.addTime(binprofile.BSLoadPhase.ITEM_ITERATION, time.perf_counter() - time_batch)
+		logging.getLogger(__name__).debug("Parse context: %s hits, %s misses", parse_context.hitCount(), parse_context.missCount())
+		
+		if self._cancel_token.isCancelled():
+			return None
 		
 		if len(mob_queue):
 			
 			logging.getLogger(__name__).debug("Flushing the final %s mobs", len(mob_queue))
-			self._signals.sig_got_mobs.emit(mob_queue)
+			self.emitMobs(mob_queue)
+		
+		logging.getLogger(__name__).debug("End bin item loading")
+
+		return self.recordsInBinOrder(records, priority_indexes)
+
+	def recordsInBinOrder(self, records:list[binitemtypes.BSBinItemRecord], priority_indexes:list[int]|None) -> list[binitemtypes.BSBinItemRecord]:
+		"""Put visible items, parsed ahead of the rest, back where they are in the bin (for the cache)"""
+
+		if priority_indexes:
+			records.sort(key=lambda record: record.bin_index)
+
+		return records
+
+	def loadPriorityRecords(self, bin_handle:avb.file.AVBFile, priority_indexes:list[int]) -> list[binitemtypes.BSBinItemRecord]:
+		"""Parse just the given bin items in this thread"""
+
+		records       = list()
+		parse_context = binparser.BSBinParseContext(bin_handle.content)
+		time_start    = time.perf_counter()
+
+		for item_index in priority_indexes:
+
+			try:
+				records.append(binparser.item_record_from_bin(bin_handle.content.items[item_index], parse_context, item_index))
+			except Exception as e:
+				# The worker process will report this one too
+				logging.getLogger(__name__).debug("Skipping visible item %s: %s", item_index, e)
+
+		self._profiler.addTime(binprofile.BSLoadPhase.ITEM_ITERATION, time.perf_counter() - time_start)
+
+		return records
+
+	def shardReadMode(self) -> binio.BSBinReadMode:
+		"""How worker processes should read the bin: mapped if that was asked for, otherwise buffered.  Each opens it separately, so they never read the whole thing ahead."""
+
+		if self._io_stats is not None and self._io_stats.read_mode == binio.BSBinReadMode.MMAP:
+			return binio.BSBinReadMode.MMAP
+		
+		return binio.BSBinReadMode.BUFFERED
+
+	def loadItemsInProcesses(self, bin_handle:avb.file.AVBFile, priority_indexes:list[int]|None=None) -> list[binitemtypes.BSBinItemRecord]|None:
+		"""
+		Parse shards of bin items across worker processes, and emit them in bin order.  Returns the parsed records, or `None` if stopped early.
+
+		Items in `priority_indexes` are parsed in this thread while the workers spin up, and sent first.
+		"""
+
+		item_count = len(bin_handle.content.items)
+
+		shard_size = max(self._mob_queue_size, math.ceil(item_count / (self._process_count * PARALLEL_SHARDS_PER_PROCESS)))
+		shards     = [(start, min(start + shard_size, item_count)) for start in range(0, item_count, shard_size)]
+
+		logging.getLogger(__name__).debug("Begin bin item loading with %s processes over %s shards of %s items", self._process_count, len(shards), shard_size)
+
+		# NOTE: Forking a process with Qt threads running is asking for trouble, so always spawn
+		executor = futures.ProcessPoolExecutor(max_workers=self._process_count, mp_context=multiprocessing.get_context("spawn"))
+		records  = list()
+		priority_set = set(priority_indexes or [])
+
+		def records_in_order(shard_futures:list[futures.Future]) -> typing.Iterator[binitemtypes.BSBinItemRecord]:
+			"""Collect shards in order so the items arrive in bin order"""
+
+			for shard_future in shard_futures:
+
+				# Wait in short bursts so a cancelled load doesn't hang around for a whole shard
+				while not futures.wait([shard_future], timeout=CANCEL_POLL_INTERVAL_SEC).done:
+					if self._cancel_token.isCancelled():
+						self.emitAborted()
+						return
+
+				try:
+					shard_records, errors, slow_mobs = shard_future.result()
+				except Exception as e:
+					self.emitException(e)
+					continue
+
+				for error in errors:
+					self.emitException(RuntimeError(error))
+				
+				self._profiler.addSlowMobs(slow_mobs)
+
+				# Visible items were already sent.  Other items may well share their mob IDs, so go by position in the bin.
+				shard_records = [record for record in shard_records if record.bin_index not in priority_set]
+
+				records.extend(shard_records)
+				yield from shard_records
+
+		try:
+			shard_futures = [executor.submit(load_records_from_bin_path, self._bin_path, start, stop, self._slow_mob_count, self.shardReadMode()) for start, stop in shards]
+			completed     = True
+
+			if priority_indexes:
+				priority_records = self.loadPriorityRecords(bin_handle, priority_indexes)
+				records.extend(priority_records)
+				completed        = self.emitItemsFromRecords(priority_records)
+			
+			completed = completed and self.emitItemsFromRecords(records_in_order(shard_futures))
+		finally:
+			executor.shutdown(wait=False, cancel_futures=True)
+		
+		if not completed or self._cancel_token.isCancelled():
+			return None
 		
 		logging.getLogger(__name__).debug("End bin item loading")
 
+		return self.recordsInBinOrder(records, priority_indexes)
+
 	def run(self):
 		"""Who will run the runnable?"""
 
+		self._profiler = binprofile.BSLoadProfiler(slow_mob_count=self._slow_mob_count)
 		self._signals.sig_begin_loading.emit(self._bin_path)
 
+		# Stat before opening, so a bin modified mid-load is never cached under its newer identity
+		if self._cache is not None:
+
+			with self._profiler.span(binprofile.BSLoadPhase.CACHE_LOOKUP):
+
+				try:
+					self._cache_key = bincache.BSBinCacheKey.from_path(self._bin_path)
+				except OSError as e:
+					logging.getLogger(__name__).debug("Not using cache for %s: %s", self._bin_path, e)
+					self._cache_key = None
+
+				cache_entry = self._cache.load(self._cache_key) if self._cache_key is not None else None
+			
+			if cache_entry is not None:
+				
+				self.loadDataFromCache(cache_entry)
+				self.emitDone(from_cache=True, completed=not self._cancel_token.isCancelled())
+				return
+
+		completed = False
+
 		try:
 
-			with avb.open(self._bin_path) as bin_handle:
+			with self._profiler.span(binprofile.BSLoadPhase.OPEN):
+				bin_handle, self._io_stats = binio.open_bin(self._bin_path, self._read_mode)
+			
+			logging.getLogger(__name__).debug("Opened %s with read mode %s", self._bin_path, self._io_stats.read_mode)
+
+			with bin_handle:
 				self.loadDataFromBin(bin_handle)
 
 		except Exception as e:
 
 			self._signals.sig_got_exception.emit(e)
-			self._signals.sig_aborted_loading.emit(str(e))
+			self.emitAborted(str(e))
+		
+		else:
+			completed = not self._cancel_token.isCancelled()
+
+		self.emitDone(from_cache=False, completed=completed)
 
-		self._signals.sig_done_loading.emit()
\ No newline at end of file
+		if self._pending_cache_entry is not None:
+			self._cache.store(self._cache_key, self._pending_cache_entry)
+			self._pending_cache_entry = None
\ No newline at end of file
@@ -3,11 +3,28 @@ Functions for creating and returning data model items from a bin
 Also used by `.binloader`
 """
 
+import contextlib, dataclasses, heapq, logging, sys, typing
 import avb, avbutils, timecode
 from ..binitems import binitemtypes
 from ..binview  import binviewitemtypes
 from ..binfilters.siftfilter import sifters, siftmatchtypes
 from ..siftwidget import rangesmodel
+from . import binprofile
+
+@dataclasses.dataclass
+class BSBinPropertiesRecord:
+	"""Bin-level properties (view, sift, sort, appearance) as emitted by the loader.  `None` for anything that couldn't be parsed."""
+
+	display_flags      :avbutils.BinDisplayItemTypes|None               = None
+	view_setting       :binviewitemtypes.BSBinViewInfo|None             = None
+	column_widths      :dict[str, int]|None                             = None
+	frame_scale        :int|None                                        = None
+	script_scale       :int|None                                        = None
+	display_mode       :avbutils.BinDisplayModes|None                   = None
+	sift_settings      :list[list[sifters.BSAbstractSifter]]|None       = None
+	sort_settings      :list[list[int, str]]|None                       = None
+	appearance_settings:tuple|None                                      = None
+	mob_count          :int|None                                        = None
 
 def bin_display_flags_from_bin(bin_content:avb.bin.Bin) -> avbutils.BinDisplayItemTypes:
 	return avbutils.BinDisplayItemTypes.get_options_from_bin(bin_content)
@@ -49,6 +66,59 @@ def display_mode_from_bin(bin_content:avb.bin.Bin) -> avbutils.BinDisplayModes:
 
 	return avbutils.BinDisplayModes.get_mode_from_bin(bin_content)
 
+PRIORITY_SORT_KEYS:dict[int, typing.Callable[[avb.trackgroups.Composition], typing.Any]] = {
+	avbutils.bins.BinColumnFieldIDs.Name:         lambda comp: (comp.name or "").casefold(),
+	avbutils.bins.BinColumnFieldIDs.CreationDate: lambda comp: comp.creation_time,
+	avbutils.bins.BinColumnFieldIDs.ModifiedDate: lambda comp: comp.last_modified,
+}
+"""Sort keys for columns that can be read right off the mob, without parsing the whole item"""
+
+def priority_item_indexes(bin_content:avb.bin.Bin, display_mode:avbutils.BinDisplayModes, view_setting:binviewitemtypes.BSBinViewInfo|None, sort_settings:list[list[int, str]]|None, count:int) -> list[int]:
+	"""
+	Indexes of the `count` bin items that will show up first in the given display mode: the top-left of the frame view,
+	or the top rows per the bin's stored sort columns.  Empty if there's no better guess than bin order.
+	"""
+
+	bin_items = bin_content.items
+
+	if count <= 0 or len(bin_items) <= count:
+		return []
+
+	if display_mode == avbutils.BinDisplayModes.FRAME:
+		return heapq.nsmallest(count, range(len(bin_items)), key=lambda idx: (bin_items[idx].y, bin_items[idx].x))
+
+	# Use as many of the sort columns as can be keyed cheaply, in order
+	field_ids = {column.display_name: column.field_id for column in view_setting.columns} if view_setting else {}
+	sort_keys = []
+
+	for direction, column_name in sort_settings or []:
+
+		field_id = field_ids.get(column_name, avbutils.bins.BinColumnFieldIDs.Name if column_name == "Name" else None)
+
+		if field_id not in PRIORITY_SORT_KEYS:
+			break
+
+		sort_keys.append((PRIORITY_SORT_KEYS[field_id], bool(direction)))
+
+	if not sort_keys:
+		return []
+
+	def item_key(bin_item:avb.bin.BinItem, key_func:typing.Callable) -> tuple:
+		try:
+			value = key_func(bin_item.mob)
+		except Exception:
+			value = None
+		return (value is None, value)
+
+	item_indexes = list(range(len(bin_items)))
+
+	# Stable sorts from the last sort column to the first
+	for key_func, is_descending in reversed(sort_keys):
+		item_keys = [item_key(bin_item, key_func) for bin_item in bin_items]
+		item_indexes.sort(key=item_keys.__getitem__, reverse=is_descending)
+
+	return item_indexes[:count]
+
 def appearance_settings_from_bin(bin_content:avb.bin.Bin) -> tuple:
 	"""General and misc appearance settings stored around the bin"""
 
@@ -72,12 +142,198 @@ def appearance_settings_from_bin(bin_content:avb.bin.Bin) -> tuple:
 		bin_content.was_iconic,
 	)
 
-def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
-		"""Parse a mob and its bin item properties"""
+def bin_properties_from_bin(bin_content:avb.bin.Bin, properties:BSBinPropertiesRecord|None=None, phase_span:typing.Callable[[str], typing.ContextManager]|None=None) -> BSBinPropertiesRecord:
+	"""
+	Parse the bin-level properties and item count, without resolving a single mob
+
+	Fills in `properties` as it goes, so anything parsed before an exception is still there.  Each step is wrapped
+	in `phase_span` (a `binprofile.BSLoadPhase`), for timing.
+	"""
+
+	properties = properties if properties is not None else BSBinPropertiesRecord()
+	phase_span = phase_span or (lambda phase: contextlib.nullcontext())
+
+	# Bin items only refer to their mobs, so counting them is cheap
+	properties.mob_count = len(bin_content.items)
+
+	with phase_span(binprofile.BSLoadPhase.DISPLAY_FLAGS):
+		try:
+			properties.display_flags = bin_display_flags_from_bin(bin_content)
+		except ValueError as e:
+			logging.getLogger(__name__).error("Could not parse Bin Display Settings: %s.  Using defaults instead.", e)
+			properties.display_flags = avbutils.BinDisplayItemTypes.default_items()
+	
+	with phase_span(binprofile.BSLoadPhase.VIEW_SETTINGS):
+		properties.view_setting  = bin_view_setting_from_bin(bin_content)
+		properties.column_widths = bin_column_widths_from_bin(bin_content)
+		properties.frame_scale   = bin_frame_view_scale_from_bin(bin_content)
+		properties.script_scale  = bin_scipt_view_scale_from_bin(bin_content)
+
+	with phase_span(binprofile.BSLoadPhase.DISPLAY_MODE):
+		properties.display_mode = display_mode_from_bin(bin_content)
+
+	with phase_span(binprofile.BSLoadPhase.SIFT_SETTINGS):
+		properties.sift_settings = sift_settings_from_bin(bin_content, view_setting=properties.view_setting)
+
+	with phase_span(binprofile.BSLoadPhase.SORT_SETTINGS):
+		properties.sort_settings = sort_settings_from_bin(bin_content)
+
+	with phase_span(binprofile.BSLoadPhase.APPEARANCE_SETTINGS):
+		properties.appearance_settings = appearance_settings_from_bin(bin_content)
+
+	return properties
+
+def _intern(value:typing.Any) -> typing.Any:
+	"""Intern a string, passing anything else through"""
+	return sys.intern(value) if type(value) is str else value
+
+def load_item_from_bin(bin_item:avb.bin.BinItem, context:"BSBinParseContext|None"=None) -> binitemtypes.BSBinItemInfo:
+	"""Parse a mob and its bin item properties"""
+
+	return item_info_from_record(item_record_from_bin(bin_item, context))
+
+class BSBinParseContext:
+	"""
+	Memoizes what item parsing works out about a bin, for the length of a single load
+
+	Clips tend to share upstream mobs (subclips of one master clip, master clips from one tape), so results derived
+	from a source mob are cached by `MobID` and only resolved once per bin.  Don't hold on to one of these across
+	loads: it keeps the bin's mobs alive, and goes stale if the bin changes.
+	"""
+
+	def __init__(self, bin_content:avb.bin.Bin):
+
+		# Bin-wide values, used to normalize frame coordinates
+		self.frame_scale_x:int   = bin_frame_view_scale_from_bin(bin_content)
+		self.frame_scale_y:float = 74 + ((self.frame_scale_x - avbutils.bins.THUMB_FRAME_MODE_RANGE.start) * 10)
+
+		self._physical_sources:dict[tuple, tuple[bool, avbutils.SourceMobRole|None, str|None]] = {}
+		self._source_drives:dict[tuple, str|None] = {}
+		self._user_attributes:dict[avb.mobid.MobID, dict[str,str]] = {}
+		self._timecode_tracks:dict[avb.mobid.MobID, avb.trackgroups.Track|None] = {}
+
+		self._hit_count  = 0
+		self._miss_count = 0
+
+	@staticmethod
+	def upstreamKey(comp:avb.trackgroups.Composition) -> tuple|None:
+		"""The mob and track a composition's primary track points to, or `None` if that isn't a plain source clip"""
+
+		# Source mobs are the end of the line, and are described by their own descriptors
+		if comp.mob_type == "SourceMob":
+			return None
+
+		try:
+			component = avbutils.sourcerefs.primary_track_for_composition(comp).component
+		except Exception:
+			return None
+
+		if not isinstance(component, avb.components.SourceClip):
+			return None
+
+		return (component.mob_id, component.track_id)
+
+	def physicalSource(self, comp:avb.trackgroups.Composition) -> tuple[bool, avbutils.SourceMobRole|None, str|None]:
+		"""Whether a composition has a physical source (source file or tape) behind it, and if so, its role and name"""
+
+		cache_key = self.upstreamKey(comp)
+
+		if cache_key is not None and cache_key in self._physical_sources:
+			self._hit_count += 1
+			return self._physical_sources[cache_key]
+
+		self._miss_count += 1
+
+		if avbutils.sourcerefs.composition_has_physical_source(comp):
+			physical_source = (
+				True,
+				avbutils.sourcerefs.physical_source_type_for_composition(comp),
+				avbutils.sourcerefs.physical_source_name_for_composition(comp),
+			)
+		else:
+			physical_source = (False, None, None)
+
+		if cache_key is not None:
+			self._physical_sources[cache_key] = physical_source
+
+		return physical_source
+
+	def sourceDrive(self, comp:avb.trackgroups.Composition) -> str|None:
+		"""Last known volume of the first media file behind a composition"""
+
+		# Media on the composition itself
+		if "descriptor" in comp.property_data and isinstance(comp.descriptor, avb.essence.MediaDescriptor) and isinstance(comp.descriptor.locator, avb.misc.MSMLocator):
+			return comp.descriptor.locator.last_known_volume
+
+		cache_key = self.upstreamKey(comp)
+
+		if cache_key is not None and cache_key in self._source_drives:
+			self._hit_count += 1
+			return self._source_drives[cache_key]
+
+		self._miss_count += 1
+		source_drive = None
+
+		try:
+			file_source_clip, offset = next(avbutils.file_references_for_component(avbutils.primary_track_for_composition(comp).component))
+		except StopIteration:
+			pass
+		else:
+			if isinstance(file_source_clip.mob.descriptor.locator, avb.misc.MSMLocator):
+				source_drive = file_source_clip.mob.descriptor.locator.last_known_volume
+
+		if cache_key is not None:
+			self._source_drives[cache_key] = source_drive
+
+		return source_drive
+
+	def userAttributes(self, mob:avb.trackgroups.Composition) -> dict[str,str]|None:
+		"""User attributes of a source mob, or `None` if it has no attributes at all.  Treat as read-only."""
+
+		if mob.mob_id in self._user_attributes:
+			self._hit_count += 1
+			return self._user_attributes[mob.mob_id]
+
+		self._miss_count += 1
+
+		user_attributes = dict(mob.attributes.get("_USER",{})) if "attributes" in mob.property_data else None
+		self._user_attributes[mob.mob_id] = user_attributes
+
+		return user_attributes
+
+	def timecodeTrack(self, mob:avb.trackgroups.Composition) -> avb.trackgroups.Track|None:
+		"""The first timecode track of a source mob, if it has one"""
+
+		if mob.mob_id in self._timecode_tracks:
+			self._hit_count += 1
+			return self._timecode_tracks[mob.mob_id]
+
+		self._miss_count += 1
+
+		try:
+			tc_track = next(avbutils.get_tracks_from_composition(mob, type=avbutils.TrackTypes.TIMECODE, index=1))
+		except Exception:
+			tc_track = None
+
+		self._timecode_tracks[mob.mob_id] = tc_track
+
+		return tc_track
+
+	def hitCount(self) -> int:
+		return self._hit_count
+
+	def missCount(self) -> int:
+		return self._miss_count
+
+def item_record_from_bin(bin_item:avb.bin.BinItem, context:BSBinParseContext|None=None, bin_index:int|None=None) -> binitemtypes.BSBinItemRecord:
+		"""Parse a mob and its bin item properties into a plain `BSBinItemRecord`.  Pass the same `context` for every item in a bin to avoid repeat work."""
 
 		
 		comp:avb.trackgroups.Composition = bin_item.mob
 
+		if context is None:
+			context = BSBinParseContext(bin_item.root.content)
+
 		# Get frame scale to normalize frame coords below
 
 		# NOTE BOUD DIS:
@@ -91,9 +347,7 @@ def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
 
 		# This is still very TODO
 
-		frame_scale_x = bin_frame_view_scale_from_bin(bin_item.root.content)
-		frame_scale_y = 74 + ((frame_scale_x - avbutils.bins.THUMB_FRAME_MODE_RANGE.start) * 10)
-		mob_coords= ((bin_item.x-16) / frame_scale_x, (bin_item.y-16) / frame_scale_y * 14) 	# Y Unit * 14 height?
+		mob_coords= ((bin_item.x-16) / context.frame_scale_x, (bin_item.y-16) / context.frame_scale_y * 14) 	# Y Unit * 14 height?
 		
 		# Initial data model info
 		mob_id    = comp.mob_id
@@ -113,42 +367,38 @@ def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
 
 		mark_in    = None
 		mark_out   = None
-		mark_range = None
 
 		if avbutils.BinDisplayItemTypes.SEQUENCE in mob_types:
 			timecode_range = avbutils.get_timecode_range_for_composition(comp)
-			user_attributes = comp.attributes.get("_USER",{})
+			user_attributes = dict(comp.attributes.get("_USER",{}))
 
 		else:
 
-			if avbutils.sourcerefs.composition_has_physical_source(comp):
+			has_physical_source, source_role, source_name = context.physicalSource(comp)
+
+			if has_physical_source:
 			
-				if avbutils.sourcerefs.physical_source_type_for_composition(comp) == avbutils.SourceMobRole.SOURCE_FILE:
-					source_file_name = avbutils.sourcerefs.physical_source_name_for_composition(comp)
+				if source_role == avbutils.SourceMobRole.SOURCE_FILE:
+					source_file_name = source_name
 				else:
-					tape_name = avbutils.sourcerefs.physical_source_name_for_composition(comp)
+					tape_name = source_name
 			
 			# Drive info
-			if "descriptor" in comp.property_data and isinstance(comp.descriptor, avb.essence.MediaDescriptor) and isinstance(comp.descriptor.locator, avb.misc.MSMLocator):
-				source_drive = comp.descriptor.locator.last_known_volume
-			else:
-				try:
-				# TODO: Do if comp itself is file source first, otherwise...
-					file_source_clip, offset = next(avbutils.file_references_for_component(avbutils.primary_track_for_composition(comp).component))
-				except StopIteration as e:
-					#print("No file soruce:",comp)
-					pass
-				else:
-					if isinstance(file_source_clip.mob.descriptor.locator, avb.misc.MSMLocator):
-						source_drive = file_source_clip.mob.descriptor.locator.last_known_volume
-						#print(source_drive)
+			source_drive = context.sourceDrive(comp)
 			
 			# Timecode
 			# NOTE: This is all pretty sloppy here.
-			try:
-				timecode_range = avbutils.get_timecode_range_for_composition(comp)
-			except Exception as e:
-				pass
+			# The composition's own timecode range is only needed for marks, or if no source has timecode
+			has_marks = "attributes" in comp.property_data and ("_IN" in comp.attributes or "_OUT" in comp.attributes)
+			
+			def composition_timecode_range() -> timecode.TimecodeRange|None:
+				try:
+					return avbutils.get_timecode_range_for_composition(comp)
+				except Exception as e:
+					return None
+
+			if has_marks:
+				timecode_range = composition_timecode_range()
 
 			# NOTE: UNRELIABLE
 			if timecode_range and "attributes" in comp.property_data:
@@ -156,24 +406,21 @@ def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
 #				print("***", comp.name, mark_in)
 				mark_out = timecode_range.start + timecode.Timecode(comp.attributes.get("_OUT"), rate=timecode_range.rate) if "_OUT" in comp.attributes else None
 #				print("***", mark_out)
-				if mark_in and mark_out and mark_in < mark_out:
-					mark_range = timecode.TimecodeRange(start=mark_in, end=mark_out)
 
 
 
 
 			attributes_reverse = []
+			source_timecode_range = None
 			for source, offset in avbutils.source_references_for_component(avbutils.sourcerefs.primary_track_for_composition(comp).component):
 				
-				if "attributes" in source.mob.property_data:
-					attributes_reverse.append(source.mob.attributes.get("_USER",{}))
+				source_user_attributes = context.userAttributes(source.mob)
+				if source_user_attributes is not None:
+					attributes_reverse.append(source_user_attributes)
 				
 				# Timecode
-				try:
-					tc_track = next(avbutils.get_tracks_from_composition(source.mob, type=avbutils.TrackTypes.TIMECODE, index=1))
-				except:
-					pass
-				else:
+				tc_track = context.timecodeTrack(source.mob)
+				if tc_track is not None:
 					tc_component, offset = avbutils.resolve_base_component_from_component(tc_track.component, offset + source.start_time)
 					
 					if not isinstance(tc_component, avb.components.Timecode):
@@ -181,10 +428,16 @@ def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
 						logging.getLogger(__name__).error("Got weird TC component for %s: %s", mob_name,tc_component)
 						continue
 					
-					timecode_range = timecode.TimecodeRange(
+					source_timecode_range = timecode.TimecodeRange(
 						start = timecode.Timecode(tc_component.start + offset.frame_number, rate=offset.rate),
 						duration=comp.length
 					)
+			
+			if source_timecode_range is not None:
+				timecode_range = source_timecode_range
+			elif not has_marks:
+				timecode_range = composition_timecode_range()
+			
 			for a in reversed(attributes_reverse):
 				user_attributes.update(a)
 			if "attributes" in comp.property_data:
@@ -195,50 +448,101 @@ def load_item_from_bin(bin_item:avb.bin.BinItem) -> binitemtypes.BSBinItemInfo:
 		except StopIteration:
 			marker = None
 
-		item = {
-			avbutils.bins.BinColumnFieldIDs.Name:         binitemtypes.BSStringViewItem(mob_name),
-			avbutils.bins.BinColumnFieldIDs.Color:        binitemtypes.BSClipColorViewItem(mob_color),
-			avbutils.bins.BinColumnFieldIDs.Start:        binitemtypes.get_viewitem_for_item(timecode_range.start if timecode_range else ""),
-			avbutils.bins.BinColumnFieldIDs.End:          binitemtypes.get_viewitem_for_item(timecode_range.end if timecode_range else ""),
-			avbutils.bins.BinColumnFieldIDs.Duration:     binitemtypes.BSDurationViewItem(timecode_range.duration) if timecode_range else binitemtypes.BSStringViewItem(""),
-			avbutils.bins.BinColumnFieldIDs.ModifiedDate: binitemtypes.get_viewitem_for_item(comp.last_modified),
-			avbutils.bins.BinColumnFieldIDs.CreationDate: binitemtypes.get_viewitem_for_item(comp.creation_time),
-			avbutils.bins.BinColumnFieldIDs.BinItemIcon:  binitemtypes.get_viewitem_for_item(mob_types),
-			avbutils.bins.BinColumnFieldIDs.Marker:       binitemtypes.BSMarkerViewItem(marker),
-			avbutils.bins.BinColumnFieldIDs.Tracks:       binitemtypes.BSStringViewItem(avbutils.timeline.format_track_labels(mob_tracks) or None),
-			avbutils.bins.BinColumnFieldIDs.Tape:         binitemtypes.get_viewitem_for_item(tape_name or ""),
-			avbutils.bins.BinColumnFieldIDs.Drive:        binitemtypes.get_viewitem_for_item(source_drive or ""),
-			avbutils.bins.BinColumnFieldIDs.SourceFile:   binitemtypes.get_viewitem_for_item(source_file_name or ""),
-			avbutils.bins.BinColumnFieldIDs.SourcePath:   binitemtypes.get_viewitem_for_item(user_attributes.get("Scene") or ""),
-			avbutils.bins.BinColumnFieldIDs.Take:         binitemtypes.get_viewitem_for_item(user_attributes.get("Take") or ""),
-			avbutils.bins.BinColumnFieldIDs.Labroll:      binitemtypes.get_viewitem_for_item(user_attributes.get("Labroll") or ""),
-			avbutils.bins.BinColumnFieldIDs.Soundroll:    binitemtypes.get_viewitem_for_item(user_attributes.get("Soundroll") or ""),
-			avbutils.bins.BinColumnFieldIDs.Camroll:      binitemtypes.get_viewitem_for_item(user_attributes.get("Camroll") or ""),
-			avbutils.bins.BinColumnFieldIDs.FPS:          binitemtypes.get_viewitem_for_item(user_attributes.get("FPS") or ""),
-			avbutils.bins.BinColumnFieldIDs.SoundTC:      binitemtypes.get_viewitem_for_item(user_attributes.get("Sound TC") or ""),
-			avbutils.bins.BinColumnFieldIDs.ShootDate:    binitemtypes.get_viewitem_for_item(user_attributes.get("Shoot Date") or ""),
-			avbutils.bins.BinColumnFieldIDs.AudioSR:      binitemtypes.get_viewitem_for_item(user_attributes.get("Audio SR") or ""),
-			avbutils.bins.BinColumnFieldIDs.MarkIn:       binitemtypes.get_viewitem_for_item(mark_in or ""),
-			avbutils.bins.BinColumnFieldIDs.MarkOut:      binitemtypes.get_viewitem_for_item(mark_out or ""),
-			avbutils.bins.BinColumnFieldIDs.InOut:        binitemtypes.BSDurationViewItem(mark_range.duration) if mark_range else binitemtypes.BSStringViewItem(""),
-			
-			
-		}
+		# The same tapes, drives and user attributes turn up over and over, so keep one copy of each string
+		user_attributes = {_intern(key): _intern(value) for key, value in user_attributes.items()}
 
-		for k,v in user_attributes.items():
-			user_attributes[k] = binitemtypes.BSStringViewItem(v)
-
-		# New
-		item.update({40: user_attributes})
-		
-		return binitemtypes.BSBinItemInfo(
-			name = mob_name,
-			item_type = mob_types,
-			view_items = item,
+		return binitemtypes.BSBinItemRecord(
+			mob_id            = mob_id,
+			item_type         = mob_types,
+			name              = mob_name,
+			clip_color        = mob_color,
 			frame_coordinates = mob_coords,
 			keyframe_offset   = mob_frame,
-			mob_id = mob_id,
-			tracks=mob_tracks,
-			clip_color=mob_color,
-			primary_timecode=timecode_range
+			track_labels      = avbutils.timeline.format_track_labels(mob_tracks) or None,
+			timecode_range    = timecode_range,
+			mark_in           = mark_in,
+			mark_out          = mark_out,
+			last_modified     = comp.last_modified,
+			creation_time     = comp.creation_time,
+			marker            = marker,
+			tape_name         = _intern(tape_name),
+			source_drive      = _intern(source_drive),
+			source_file_name  = source_file_name,
+			user_attributes   = user_attributes,
+			bin_index         = bin_index,
 		)
+
+def _duration_viewitem(duration:timecode.Timecode|None) -> binitemtypes.BSAbstractViewItem:
+	return binitemtypes.BSDurationViewItem(duration) if duration is not None else binitemtypes.interned_string_viewitem("")
+
+def _user_viewitems(user_attributes:dict[str,str]) -> binitemtypes.BSLazyViewItems:
+	return binitemtypes.BSLazyViewItems(user_attributes, default_factory=binitemtypes.interned_string_viewitem)
+
+VIEWITEM_FACTORIES:dict[int, typing.Callable[[typing.Any], binitemtypes.BSAbstractViewItem|binitemtypes.BSLazyViewItems]] = {
+	avbutils.bins.BinColumnFieldIDs.Name:     binitemtypes.interned_string_viewitem,
+	avbutils.bins.BinColumnFieldIDs.Color:    binitemtypes.BSClipColorViewItem,
+	avbutils.bins.BinColumnFieldIDs.Duration: _duration_viewitem,
+	avbutils.bins.BinColumnFieldIDs.Marker:   binitemtypes.BSMarkerViewItem,
+	avbutils.bins.BinColumnFieldIDs.Tracks:   binitemtypes.interned_string_viewitem,
+	avbutils.bins.BinColumnFieldIDs.InOut:    _duration_viewitem,
+	avbutils.bins.BinColumnFieldIDs.User:     _user_viewitems,
+}
+"""View item types for fields that need something other than `binitemtypes.get_viewitem_for_item`"""
+
+USER_ATTRIBUTE_FIELDS:dict[int, str] = {
+	avbutils.bins.BinColumnFieldIDs.SourcePath:   "Scene",
+	avbutils.bins.BinColumnFieldIDs.Take:         "Take",
+	avbutils.bins.BinColumnFieldIDs.Labroll:      "Labroll",
+	avbutils.bins.BinColumnFieldIDs.Soundroll:    "Soundroll",
+	avbutils.bins.BinColumnFieldIDs.Camroll:      "Camroll",
+	avbutils.bins.BinColumnFieldIDs.FPS:          "FPS",
+	avbutils.bins.BinColumnFieldIDs.SoundTC:      "Sound TC",
+	avbutils.bins.BinColumnFieldIDs.ShootDate:    "Shoot Date",
+	avbutils.bins.BinColumnFieldIDs.AudioSR:      "Audio SR",
+}
+"""Built-in columns that show a user attribute"""
+
+def item_info_from_record(record:binitemtypes.BSBinItemRecord) -> binitemtypes.BSBinItemInfo:
+	"""Wrap a parsed `BSBinItemRecord` with view items, which are built as they are requested"""
+
+	timecode_range  = record.timecode_range
+	user_attributes = record.user_attributes
+
+	mark_range = None
+	if record.mark_in and record.mark_out and record.mark_in < record.mark_out:
+		mark_range = timecode.TimecodeRange(start=record.mark_in, end=record.mark_out)
+
+	item = {
+		avbutils.bins.BinColumnFieldIDs.Name:         record.name,
+		avbutils.bins.BinColumnFieldIDs.Color:        record.clip_color,
+		avbutils.bins.BinColumnFieldIDs.Start:        timecode_range.start if timecode_range else "",
+		avbutils.bins.BinColumnFieldIDs.End:          timecode_range.end if timecode_range else "",
+		avbutils.bins.BinColumnFieldIDs.Duration:     timecode_range.duration if timecode_range else None,
+		avbutils.bins.BinColumnFieldIDs.ModifiedDate: record.last_modified,
+		avbutils.bins.BinColumnFieldIDs.CreationDate: record.creation_time,
+		avbutils.bins.BinColumnFieldIDs.BinItemIcon:  record.item_type,
+		avbutils.bins.BinColumnFieldIDs.Marker:       record.marker,
+		avbutils.bins.BinColumnFieldIDs.Tracks:       record.track_labels,
+		avbutils.bins.BinColumnFieldIDs.Tape:         record.tape_name or "",
+		avbutils.bins.BinColumnFieldIDs.Drive:        record.source_drive or "",
+		avbutils.bins.BinColumnFieldIDs.SourceFile:   record.source_file_name or "",
+		avbutils.bins.BinColumnFieldIDs.MarkIn:       record.mark_in or "",
+		avbutils.bins.BinColumnFieldIDs.MarkOut:      record.mark_out or "",
+		avbutils.bins.BinColumnFieldIDs.InOut:        mark_range.duration if mark_range else None,
+		avbutils.bins.BinColumnFieldIDs.User:         user_attributes,
+	}
+
+	for field_id, attribute_name in USER_ATTRIBUTE_FIELDS.items():
+		item[field_id] = user_attributes.get(attribute_name) or ""
+	
+	return binitemtypes.BSBinItemInfo(
+		name = record.name,
+		item_type = record.item_type,
+		view_items = binitemtypes.BSLazyViewItems(item, VIEWITEM_FACTORIES),
+		frame_coordinates = record.frame_coordinates,
+		keyframe_offset   = record.keyframe_offset,
+		mob_id = record.mob_id,
+		track_labels=record.track_labels,
+		clip_color=record.clip_color,
+		primary_timecode=timecode_range
+	)
@@ -0,0 +1,123 @@
+"""
+A quick look at a bin: its settings and item count, without parsing any of its items
+
+Cheap enough to run over a whole folder of bins, say for previews or to size a progress bar up front
+"""
+
+import dataclasses, datetime, os, time, typing
+from concurrent import futures
+from os import PathLike
+
+from . import binio, binparser
+
+PROBE_BUFFER_SIZE:int = 1024 ** 2
+"""Opening a bin skips through the header of every object in it, so big buffered reads keep that mostly sequential"""
+
+DEFAULT_PROBE_WORKERS:int = 8
+"""Bins to probe at once.  Probing is mostly waiting on I/O, so this can be higher than the CPU count."""
+
+@dataclasses.dataclass(frozen=True)
+class BSBinProbeResult:
+	"""What a probe found out about a bin"""
+
+	bin_path:str
+
+	properties:binparser.BSBinPropertiesRecord|None = None
+	"""Bin-level settings and item count, or `None` if the bin couldn't be opened"""
+
+	file_size:int|None = None
+
+	last_save:datetime.datetime|None = None
+	"""When the bin was last saved, per its header"""
+
+	creator_version:str|None = None
+	"""Version of the software that last saved the bin"""
+
+	seconds:float = 0.0
+	"""Time taken to probe"""
+
+	io_stats:binio.BSBinIOStats|None = None
+
+	error:str|None = None
+	"""What went wrong, if anything did.  Properties parsed before the error are kept."""
+
+	def itemCount(self) -> int|None:
+		"""Number of items in the bin"""
+
+		return self.properties.mob_count if self.properties else None
+
+	def to_json(self) -> dict[str, typing.Any]:
+
+		properties = self.properties or binparser.BSBinPropertiesRecord()
+		view       = properties.view_setting
+
+		return {
+			"bin_path":        self.bin_path,
+			"item_count":      self.itemCount(),
+			"file_size":       self.file_size,
+			"last_save":       self.last_save.isoformat() if self.last_save else None,
+			"creator_version": self.creator_version,
+			"display_mode":    properties.display_mode.name if properties.display_mode is not None else None,
+			"bin_view":        view.name if view else None,
+			"columns":         [column.display_name for column in view.columns if not column.is_hidden] if view else None,
+			"sort_columns":    properties.sort_settings,
+			"frame_scale":     properties.frame_scale,
+			"script_scale":    properties.script_scale,
+			"seconds":         self.seconds,
+			"io_seconds":      self.io_stats.seconds if self.io_stats else None,
+			"error":           self.error,
+		}
+
+def probe_bin(bin_path:PathLike) -> BSBinProbeResult:
+	"""Read a bin's settings and item count, leaving every mob unparsed.  Never raises; problems are reported in the result."""
+
+	bin_path   = os.fspath(bin_path)
+	time_start = time.perf_counter()
+	properties = binparser.BSBinPropertiesRecord()
+	io_stats   = None
+	file_info  = {}
+
+	try:
+
+		file_info["file_size"] = os.path.getsize(bin_path)
+
+		# Reading ahead would pull in the whole bin for what's mostly its header
+		bin_handle, io_stats = binio.open_bin(bin_path, binio.BSBinReadMode.BUFFERED, buffer_size=PROBE_BUFFER_SIZE)
+
+		with bin_handle:
+
+			file_info["last_save"]       = bin_handle.last_save
+			file_info["creator_version"] = bin_handle.creator_version
+
+			binparser.bin_properties_from_bin(bin_handle.content, properties)
+
+	except Exception as e:
+
+		return BSBinProbeResult(
+			bin_path   = bin_path,
+			properties = properties if properties.mob_count is not None else None,
+			seconds    = time.perf_counter() - time_start,
+			io_stats   = io_stats,
+			error      = f"{type(e).__name__}: {e}",
+			**file_info,
+		)
+
+	return BSBinProbeResult(
+		bin_path   = bin_path,
+		properties = properties,
+		seconds    = time.perf_counter() - time_start,
+		io_stats   = io_stats,
+		**file_info,
+	)
+
+def probe_bins(bin_paths:typing.Iterable[PathLike], max_workers:int=DEFAULT_PROBE_WORKERS) -> typing.Iterator[BSBinProbeResult]:
+	"""Probe many bins concurrently, yielding results in the order given"""
+
+	bin_paths = list(bin_paths)
+
+	if max_workers <= 1 or len(bin_paths) <= 1:
+		yield from map(probe_bin, bin_paths)
+		return
+
+	with futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bs_probe") as executor:
+		yield from executor.map(probe_bin, bin_paths)
@@ -0,0 +1,218 @@
+"""
+Timing spans for each phase of a bin load, and a report of the slowest mobs to parse
+"""
+
+import contextlib, dataclasses, datetime, enum, heapq, json, logging, os, time, typing
+from os import PathLike
+
+DEFAULT_SLOW_MOB_COUNT:int = 10
+"""Number of slowest mobs kept for the report"""
+
+class BSLoadPhase(enum.StrEnum):
+	"""Phases of a bin load, in the order they usually happen"""
+
+	CACHE_LOOKUP        = "cache_lookup"
+	OPEN                = "open"
+	DISPLAY_FLAGS       = "display_flags"
+	VIEW_SETTINGS       = "view_settings"
+	DISPLAY_MODE        = "display_mode"
+	SIFT_SETTINGS       = "sift_settings"
+	SORT_SETTINGS       = "sort_settings"
+	APPEARANCE_SETTINGS = "appearance_settings"
+	VISIBLE_FIRST       = "visible_first"
+	ITEM_ITERATION      = "item_iteration"
+	MODEL_INSERTION     = "model_insertion"
+
+@dataclasses.dataclass
+class BSLoadPhaseSpan:
+	"""Total time spent in a phase"""
+
+	phase:str
+	"""Name of the phase (usually a `BSLoadPhase`)"""
+
+	seconds:float = 0.0
+	"""Total time spent in the phase"""
+
+	count:int = 0
+	"""Number of times the phase was entered (for instance, once per batch of mobs)"""
+
+@dataclasses.dataclass(frozen=True, order=True)
+class BSSlowMobInfo:
+	"""A mob and how long it took to parse (picklable between processes)"""
+
+	seconds:float
+	"""Time taken to parse the mob"""
+
+	name:str = dataclasses.field(compare=False)
+	"""Mob name"""
+
+	item_type:str = dataclasses.field(compare=False)
+	"""Mob type(s), as text"""
+
+@dataclasses.dataclass(frozen=True)
+class BSBinLoadProfile:
+	"""Where the time went while loading a bin"""
+
+	bin_path      :str
+	started       :datetime.datetime
+	total_seconds :float
+	mob_count     :int
+	from_cache    :bool
+	completed     :bool
+	process_count :int
+	phases        :list[BSLoadPhaseSpan]
+	slow_mobs     :list[BSSlowMobInfo]
+	"""Slowest mobs to parse, slowest first"""
+
+	io_mode       :str|None = None
+	"""How the bin file was read (`binio.BSBinReadMode`), or `None` if it wasn't (say, loaded from cache)"""
+
+	io_seconds    :float = 0.0
+	"""Time spent waiting on reads, wherever they happened during the load"""
+
+	io_bytes      :int = 0
+
+	def binName(self) -> str:
+		return os.path.basename(self.bin_path)
+
+	def nonIOSeconds(self) -> float:
+		"""Time spent on everything but reading the file (mostly parsing)"""
+
+		return max(self.total_seconds - self.io_seconds, 0.0)
+
+	def summary(self) -> str:
+		"""One line for the log"""
+
+		phases = ", ".join(f"{span.phase} {span.seconds:.3f}s" for span in sorted(self.phases, key=lambda s: s.seconds, reverse=True) if span.seconds >= 0.001)
+		source = "cache" if self.from_cache else f"{self.process_count} processes" if self.process_count else "bin"
+		status = "Loaded" if self.completed else "Partially loaded"
+
+		summary = f"{status} {self.mob_count} mobs from {self.binName()} ({source}) in {self.total_seconds:.2f}s: {phases or 'no phases timed'}"
+
+		if self.io_mode:
+			summary += f"; I/O {self.io_seconds:.3f}s for {self.io_bytes / 1024 ** 2:.1f} MB ({self.io_mode}), everything else {self.nonIOSeconds():.3f}s"
+
+		if self.slow_mobs:
+			summary += f"; slowest mob \"{self.slow_mobs[0].name}\" {self.slow_mobs[0].seconds * 1000:.1f}ms"
+
+		return summary
+
+	def details(self) -> str:
+		"""The full breakdown, one phase or mob per line"""
+
+		lines = [self.summary(), "", "Phases:"]
+		lines.extend(f"  {span.phase:<20} {span.seconds:9.3f}s  x{span.count}" for span in self.phases)
+
+		if self.slow_mobs:
+			lines.extend(["", "Slowest mobs:"])
+			lines.extend(f"  {mob.seconds * 1000:9.1f}ms  {mob.name} ({mob.item_type})" for mob in self.slow_mobs)
+
+		return "\n".join(lines)
+
+	def to_json(self) -> dict[str, typing.Any]:
+
+		return {
+			"bin_path":      self.bin_path,
+			"started":       self.started.isoformat(),
+			"total_seconds": self.total_seconds,
+			"mob_count":     self.mob_count,
+			"mobs_per_sec":  self.mob_count / self.total_seconds if self.total_seconds else None,
+			"from_cache":    self.from_cache,
+			"completed":     self.completed,
+			"process_count": self.process_count,
+			"phases":        [dataclasses.asdict(span) for span in self.phases],
+			"slow_mobs":     [dataclasses.asdict(mob) for mob in self.slow_mobs],
+			"io_mode":       self.io_mode,
+			"io_seconds":    self.io_seconds,
+			"io_bytes":      self.io_bytes,
+			"non_io_seconds":self.nonIOSeconds(),
+		}
+
+class BSLoadProfiler:
+	"""Collects phase timings and the slowest mobs during a single bin load"""
+
+	def __init__(self, slow_mob_count:int=DEFAULT_SLOW_MOB_COUNT):
+
+		self._slow_mob_count = max(int(slow_mob_count), 0)
+		self._slow_mobs:list[BSSlowMobInfo] = [] # Min-heap, so the fastest of the slow is first out
+		self._spans:dict[str, BSLoadPhaseSpan] = {}
+
+		self._started    = datetime.datetime.now()
+		self._time_start = time.perf_counter()
+
+	@contextlib.contextmanager
+	def span(self, phase:str) -> typing.Iterator[None]:
+		"""Time the body of a `with` block towards a phase"""
+
+		logging.getLogger(__name__).debug("Begin %s", phase)
+		time_start = time.perf_counter()
+
+		try:
+			yield
+		finally:
+			seconds = time.perf_counter() - time_start
+			self.addTime(phase, seconds)
+			logging.getLogger(__name__).debug("End %s (%.3fs)", phase, seconds)
+
+	def addTime(self, phase:str, seconds:float):
+		"""Add time spent in a phase"""
+
+		span = self._spans.setdefault(phase, BSLoadPhaseSpan(phase=phase))
+		span.seconds += seconds
+		span.count   += 1
+
+	def recordMob(self, name:str, item_type:typing.Any, seconds:float):
+		"""Time taken to parse a mob.  Only the slowest are kept."""
+
+		if not self._slow_mob_count:
+			return
+
+		if len(self._slow_mobs) < self._slow_mob_count:
+			heapq.heappush(self._slow_mobs, BSSlowMobInfo(seconds=seconds, name=str(name), item_type=str(item_type)))
+		elif seconds > self._slow_mobs[0].seconds:
+			heapq.heapreplace(self._slow_mobs, BSSlowMobInfo(seconds=seconds, name=str(name), item_type=str(item_type)))
+
+	def addSlowMobs(self, slow_mobs:typing.Iterable[BSSlowMobInfo]):
+		"""Merge in the slowest mobs from elsewhere (for instance, a worker process)"""
+
+		for slow_mob in slow_mobs:
+			self.recordMob(slow_mob.name, slow_mob.item_type, slow_mob.seconds)
+
+	def slowMobs(self) -> list[BSSlowMobInfo]:
+		"""Slowest mobs so far, slowest first"""
+
+		return sorted(self._slow_mobs, reverse=True)
+
+	def profile(self, bin_path:PathLike, mob_count:int, from_cache:bool=False, completed:bool=True, process_count:int=0, io_mode:str|None=None, io_seconds:float=0.0, io_bytes:int=0) -> BSBinLoadProfile:
+		"""The profile of the load so far"""
+
+		return BSBinLoadProfile(
+			bin_path      = os.fspath(bin_path),
+			started       = self._started,
+			total_seconds = time.perf_counter() - self._time_start,
+			mob_count     = int(mob_count or 0),
+			from_cache    = bool(from_cache),
+			completed     = bool(completed),
+			process_count = int(process_count),
+			phases        = [dataclasses.replace(span) for span in self._spans.values()],
+			slow_mobs     = self.slowMobs(),
+			io_mode       = str(io_mode) if io_mode else None,
+			io_seconds    = float(io_seconds),
+			io_bytes      = int(io_bytes),
+		)
+
+def write_profile_json(profile:BSBinLoadProfile, output_path:PathLike):
+	"""Write a load profile out as JSON"""
+
+	temp_path = f"{os.fspath(output_path)}.{os.getpid()}.tmp"
+
+	with open(temp_path, "w", encoding="utf-8") as output_file:
+		json.dump(profile.to_json(), output_file, indent=2, ensure_ascii=False)
+		output_file.write("\n")
+
+	os.replace(temp_path, output_path)
+
+def profile_file_name(profile:BSBinLoadProfile) -> str:
+	"""A file name for a profile, unique per bin and load"""
+
+	return f"{profile.started.strftime('%Y%m%d_%H%M%S_%f')}_{os.path.splitext(profile.binName())[0]}.json"
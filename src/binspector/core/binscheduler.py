@@ -0,0 +1,175 @@
+"""
+Schedules bin loads from every window onto a shared, bounded thread pool
+"""
+
+import dataclasses, itertools, logging, os
+from PySide6 import QtCore
+from . import binloader
+
+DEFAULT_MAX_CONCURRENT_LOADS:int = 2
+"""Bins to load at once.  Parsing is mostly Python, so more than a couple at a time mostly fights over the GIL and starves the UI."""
+
+@dataclasses.dataclass(eq=False)
+class BSBinLoadRequest:
+	"""A bin load waiting on, or running in, the scheduler"""
+
+	owner:QtCore.QObject
+	"""Whoever asked for the load (usually a `BSMainWindow`), which only ever has one load going at a time"""
+
+	loader:binloader.BSBinViewLoader
+	request_id:int
+
+	def binPath(self) -> str:
+		return os.path.normcase(os.path.abspath(os.fspath(self.loader.binPath())))
+
+	def cancelToken(self) -> binloader.BSLoadCancelToken:
+		return self.loader.cancelToken()
+
+class BSBinLoadScheduler(QtCore.QObject):
+	"""
+	Runs bin loads a few at a time, favouring the focused window
+
+	- A new request from the same owner supersedes its queued request, and cancels the one it has running
+	- Requests for a bin that's already loading wait for that load to finish (and so come from the bin cache, if enabled)
+	- Cancelling a queued request drops it before it ever starts
+	"""
+
+	sig_queue_changed = QtCore.Signal(int, int)
+	"""Number of queued and running loads"""
+
+	_sig_load_finished = QtCore.Signal(object)
+
+	def __init__(self, *args, max_concurrent_loads:int=DEFAULT_MAX_CONCURRENT_LOADS, **kwargs):
+
+		super().__init__(*args, **kwargs)
+
+		self._thread_pool = QtCore.QThreadPool(self)
+		self._max_loads   = max(int(max_concurrent_loads), 1)
+		self._thread_pool.setMaxThreadCount(self._max_loads)
+
+		self._pending:list[BSBinLoadRequest] = []
+		self._running:list[BSBinLoadRequest] = []
+		self._request_ids = itertools.count()
+
+		self._priority_owner:QtCore.QObject|None = None
+
+		self._sig_load_finished.connect(self._loadFinished, QtCore.Qt.ConnectionType.QueuedConnection)
+
+	@QtCore.Slot(int)
+	def setMaxConcurrentLoads(self, max_loads:int):
+
+		self._max_loads = max(int(max_loads), 1)
+		self._thread_pool.setMaxThreadCount(self._max_loads)
+		self._startPending()
+
+	def maxConcurrentLoads(self) -> int:
+		return self._max_loads
+
+	@QtCore.Slot(object)
+	def setPriorityOwner(self, owner:QtCore.QObject|None):
+		"""Queued loads for this owner (say, the focused window) start ahead of the rest"""
+
+		self._priority_owner = owner
+
+	def priorityOwner(self) -> QtCore.QObject|None:
+		return self._priority_owner
+
+	def requestLoad(self, owner:QtCore.QObject, loader:binloader.BSBinViewLoader) -> binloader.BSLoadCancelToken:
+		"""Queue a bin load.  Returns the token to cancel it with."""
+
+		# An owner shows one bin at a time, so whatever it asked for before is now moot
+		self.cancelLoads(owner)
+
+		request = BSBinLoadRequest(owner=owner, loader=loader, request_id=next(self._request_ids))
+		self._pending.append(request)
+
+		logging.getLogger(__name__).debug("Queued load of %s (%s queued, %s running)", request.binPath(), len(self._pending), len(self._running))
+
+		self._startPending()
+
+		return request.cancelToken()
+
+	@QtCore.Slot(object)
+	def cancelLoads(self, owner:QtCore.QObject):
+		"""Cancel any queued or running loads for an owner"""
+
+		dropped = [request for request in self._pending if request.owner is owner]
+
+		for request in dropped:
+			request.cancelToken().cancel()
+			self._pending.remove(request)
+
+		for request in self._running:
+			if request.owner is owner:
+				request.cancelToken().cancel()
+
+		if dropped:
+			self.sig_queue_changed.emit(len(self._pending), len(self._running))
+
+	@QtCore.Slot()
+	def cancelAll(self):
+		"""Cancel everything, queued or running"""
+
+		for request in self._pending + self._running:
+			request.cancelToken().cancel()
+
+		self._pending.clear()
+		self.sig_queue_changed.emit(len(self._pending), len(self._running))
+
+	def pendingCount(self) -> int:
+		return len(self._pending)
+
+	def runningCount(self) -> int:
+		return len(self._running)
+
+	def _nextRequest(self) -> BSBinLoadRequest|None:
+		"""The next queued load that can start now, if any"""
+
+		busy_owners = [request.owner for request in self._running]
+		busy_paths  = {request.binPath() for request in self._running}
+
+		startable = [
+			request for request in self._pending
+			if not any(request.owner is owner for owner in busy_owners) and request.binPath() not in busy_paths
+		]
+
+		if not startable:
+			return None
+
+		return min(startable, key=lambda request: (request.owner is not self._priority_owner, request.request_id))
+
+	def _startPending(self):
+
+		# Requests cancelled by anyone else (like the window's Stop action) never need to start
+		self._pending = [request for request in self._pending if not request.cancelToken().isCancelled()]
+
+		while len(self._running) < self._max_loads:
+
+			request = self._nextRequest()
+
+			if request is None:
+				break
+
+			self._pending.remove(request)
+			self._running.append(request)
+
+			logging.getLogger(__name__).debug("Starting load of %s", request.binPath())
+			self._thread_pool.start(lambda request=request: self._runRequest(request))
+
+		self.sig_queue_changed.emit(len(self._pending), len(self._running))
+
+	def _runRequest(self, request:BSBinLoadRequest):
+		"""Run a load in the thread pool"""
+
+		try:
+			request.loader.run()
+		finally:
+			self._sig_load_finished.emit(request)
+
+	@QtCore.Slot(object)
+	def _loadFinished(self, request:BSBinLoadRequest):
+
+		if request in self._running:
+			self._running.remove(request)
+
+		self._startPending()
@@ -82,4 +82,21 @@ class BSScriptViewModeConfig:
 	"""Additional scaler to control frame size -- possibly pixel density-dependent"""
 
 	DEFAULT_COLUMN_RESIZE_MODE = QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-	"""Default mode for Script view column resizing"""
\ No newline at end of file
+	"""Default mode for Script view column resizing"""
+
+class BSBinWatcherConfig:
+	"""Bin File Watcher Config"""
+
+	DEFAULT_DEBOUNCE_MSEC:int      = 500
+	"""Coalesce bursts of file events arriving within this window"""
+
+	DEFAULT_STABLE_MSEC:int        = 1_500
+	"""The bin must go unchanged for this long before it is considered done saving"""
+
+	DEFAULT_POLL_INTERVAL_MSEC:int = 3_000
+	"""Stat polling interval when native file events can't be trusted"""
+
+	POLLING_FILESYSTEM_TYPES:frozenset[str] = frozenset({
+		"smbfs", "cifs", "smb2", "smb3", "nfs", "nfs4", "afpfs", "webdav", "davfs", "fuse.sshfs", "9p",
+	})
+	"""Network file systems where native file events are unreliable, so stat polling is used instead"""
@@ -165,6 +165,133 @@ class BSSettingsManager:
 		logging.getLogger(__name__).debug("Returning mob_queue_size: %s", queue_size)
 		return queue_size
 	
+	@QtCore.Slot(int)
+	def setBatchBudget(self, budget_msec:int):
+
+		self.settings("bs").setValue("BinLoading/batch_budget_msec", budget_msec)
+		logging.getLogger(__name__).debug("Set batch_budget_msec: %s", budget_msec)
+
+	def batchBudget(self) -> int:
+		"""Main-thread time budget per batch of mobs, in milliseconds (`0` for fixed-size batches)"""
+		
+		budget_msec = max(0, self.settings("bs").value("BinLoading/batch_budget_msec", 12, int))
+		logging.getLogger(__name__).debug("Returning batch_budget_msec: %s", budget_msec)
+		return budget_msec
+	
+	@QtCore.Slot(int)
+	def setParallelLoadProcesses(self, process_count:int):
+
+		self.settings("bs").setValue("BinLoading/parallel_load_processes", process_count)
+		logging.getLogger(__name__).debug("Set parallel_load_processes: %s", process_count)
+
+	def parallelLoadProcesses(self) -> int:
+		
+		process_count = max(0, self.settings("bs").value("BinLoading/parallel_load_processes", 0, int))
+		logging.getLogger(__name__).debug("Returning parallel_load_processes: %s", process_count)
+		return process_count
+	
+	@QtCore.Slot(bool)
+	def setUseBinCache(self, use_cache:bool):
+
+		self.settings("bs").setValue("BinLoading/use_bin_cache", use_cache)
+		logging.getLogger(__name__).debug("Set use_bin_cache: %s", use_cache)
+
+	def useBinCache(self) -> bool:
+		
+		use_cache = self.settings("bs").value("BinLoading/use_bin_cache", True, bool)
+		logging.getLogger(__name__).debug("Returning use_bin_cache: %s", use_cache)
+		return use_cache
+	
+	@QtCore.Slot(int)
+	def setBinCacheSizeBudget(self, budget_mb:int):
+
+		self.settings("bs").setValue("BinLoading/bin_cache_size_budget_mb", budget_mb)
+		logging.getLogger(__name__).debug("Set bin_cache_size_budget_mb: %s", budget_mb)
+
+	def binCacheSizeBudget(self) -> int:
+		"""Bin cache size budget, in megabytes"""
+		
+		budget_mb = max(0, self.settings("bs").value("BinLoading/bin_cache_size_budget_mb", 256, int))
+		logging.getLogger(__name__).debug("Returning bin_cache_size_budget_mb: %s", budget_mb)
+		return budget_mb
+	
+	@QtCore.Slot(bool)
+	def setAutoReloadEnabled(self, use_auto_reload:bool):
+
+		self.settings("bs").setValue("BinLoading/auto_reload", use_auto_reload)
+		logging.getLogger(__name__).debug("Set auto_reload: %s", use_auto_reload)
+
+	def autoReloadEnabled(self) -> bool:
+		
+		use_auto_reload = self.settings("bs").value("BinLoading/auto_reload", True, bool)
+		logging.getLogger(__name__).debug("Returning auto_reload: %s", use_auto_reload)
+		return use_auto_reload
+	
+	@QtCore.Slot(int)
+	def setSlowMobReportCount(self, slow_mob_count:int):
+
+		self.settings("bs").setValue("BinLoading/slow_mob_report_count", slow_mob_count)
+		logging.getLogger(__name__).debug("Set slow_mob_report_count: %s", slow_mob_count)
+
+	def slowMobReportCount(self) -> int:
+		"""Number of slowest mobs listed in each bin load profile"""
+		
+		slow_mob_count = max(0, self.settings("bs").value("BinLoading/slow_mob_report_count", 10, int))
+		logging.getLogger(__name__).debug("Returning slow_mob_report_count: %s", slow_mob_count)
+		return slow_mob_count
+	
+	@QtCore.Slot(bool)
+	def setWriteLoadProfiles(self, write_profiles:bool):
+
+		self.settings("bs").setValue("BinLoading/write_load_profiles", write_profiles)
+		logging.getLogger(__name__).debug("Set write_load_profiles: %s", write_profiles)
+
+	def writeLoadProfiles(self) -> bool:
+		"""Save each bin load profile as JSON in local storage"""
+		
+		write_profiles = self.settings("bs").value("BinLoading/write_load_profiles", False, bool)
+		logging.getLogger(__name__).debug("Returning write_load_profiles: %s", write_profiles)
+		return write_profiles
+	
+	@QtCore.Slot(bool)
+	def setVisibleFirstLoading(self, visible_first:bool):
+
+		self.settings("bs").setValue("BinLoading/visible_first", visible_first)
+		logging.getLogger(__name__).debug("Set visible_first: %s", visible_first)
+
+	def visibleFirstLoading(self) -> bool:
+		"""Load the items that will be on screen first, ahead of the rest of the bin"""
+		
+		visible_first = self.settings("bs").value("BinLoading/visible_first", True, bool)
+		logging.getLogger(__name__).debug("Returning visible_first: %s", visible_first)
+		return visible_first
+	
+	@QtCore.Slot(int)
+	def setMaxConcurrentLoads(self, max_loads:int):
+
+		self.settings("bs").setValue("BinLoading/max_concurrent_loads", max_loads)
+		logging.getLogger(__name__).debug("Set max_concurrent_loads: %s", max_loads)
+
+	def maxConcurrentLoads(self) -> int:
+		"""Bins to load at once, across all windows"""
+		
+		max_loads = max(1, self.settings("bs").value("BinLoading/max_concurrent_loads", 2, int))
+		logging.getLogger(__name__).debug("Returning max_concurrent_loads: %s", max_loads)
+		return max_loads
+	
+	@QtCore.Slot(str)
+	def setBinReadMode(self, read_mode:str):
+
+		self.settings("bs").setValue("BinLoading/read_mode", str(read_mode))
+		logging.getLogger(__name__).debug("Set read_mode: %s", read_mode)
+
+	def binReadMode(self) -> str:
+		"""How bin files are read: `auto`, `buffered`, `read_ahead` or `mmap` (see `binio.BSBinReadMode`)"""
+		
+		read_mode = self.settings("bs").value("BinLoading/read_mode", "auto", str)
+		logging.getLogger(__name__).debug("Returning read_mode: %s", read_mode)
+		return read_mode
+	
 	@QtCore.Slot(bool)
 	def setUseFancyProgressBar(self, use_animation:bool):
 
@@ -37,6 +37,7 @@ class BSBinFrameScene(QtWidgets.QGraphicsScene):
 		self._bin_filter_model.rowsInserted         .connect(self.addBinItems)
 		self._bin_filter_model.rowsMoved            .connect(self.reloadBinFilterModel)
 		self._bin_filter_model.rowsAboutToBeRemoved .connect(self.removeBinItems)
+		self._bin_filter_model.dataChanged          .connect(self.updateBinItems)
 		self._bin_filter_model.modelReset           .connect(self.clear)
 
 		self._bin_filter_model.layoutChanged .connect(self.reloadBinFilterModel)
@@ -107,6 +108,20 @@ class BSBinFrameScene(QtWidgets.QGraphicsScene):
 
 			self.sig_bin_item_added.emit(bin_item)
 
+	@QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+	def updateBinItems(self, top_left:QtCore.QModelIndex, bottom_right:QtCore.QModelIndex, roles:list[int]=[]):
+		"""Refresh existing items in place"""
+
+		for row in range(top_left.row(), min(bottom_right.row(), len(self._bin_items)-1)+1):
+
+			proxy_row_index = self._bin_filter_model.index(row, 0, top_left.parent())
+			bin_item        = self._bin_items[row]
+
+			bin_item.setName(str(proxy_row_index.data(binitemtypes.BSBinItemDataRoles.ItemNameRole)))
+			bin_item.setClipColor(proxy_row_index.data(binitemtypes.BSBinItemDataRoles.ClipColorRole))
+			bin_item.setClipType(proxy_row_index.data(binitemtypes.BSBinItemDataRoles.ItemTypesRole))
+			bin_item.setPos(QtCore.QPoint(*(proxy_row_index.data(binitemtypes.BSBinItemDataRoles.FrameCoordinatesRole) or [-3000,-3000])))
+
 	@QtCore.Slot(QtCore.QModelIndex, int, int)
 	def removeBinItems(self, parent_row_index:QtCore.QModelIndex, row_start:int, row_end:int):
 
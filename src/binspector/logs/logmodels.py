@@ -1,5 +1,6 @@
 import logging, datetime
 from PySide6 import QtCore, QtGui, QtWidgets
+from ..core import binprofile
 
 class BSLogDataModel(QtCore.QAbstractItemModel):
 	"""Qt Data model for Lil' Gui' Loggin Boy"""
@@ -38,6 +39,20 @@ class BSLogDataModel(QtCore.QAbstractItemModel):
 
 		self.cullRecords()
 	
+	def addLoadProfile(self, profile:binprofile.BSBinLoadProfile):
+		"""Add a bin load profile as an info record, with the full breakdown as its tooltip"""
+
+		record = logging.makeLogRecord({
+			"name":      binprofile.__name__,
+			"module":    "binprofile",
+			"levelno":   logging.INFO,
+			"levelname": logging.getLevelName(logging.INFO),
+			"msg":       profile.summary(),
+		})
+		record.load_profile = profile
+
+		self.addLogRecord(record)
+	
 	def cullRecords(self) -> int:
 		"""Keep record count below max length"""
 
@@ -115,6 +130,10 @@ class BSLogDataModel(QtCore.QAbstractItemModel):
 					QtWidgets.QApplication.palette().color(QtGui.QPalette.ColorGroup.Disabled, QtGui.QPalette.ColorRole.Text)
 				)
 		
+		elif role == QtCore.Qt.ItemDataRole.ToolTipRole:
+			if getattr(record, "load_profile", None) is not None:
+				return record.load_profile.details()
+
 		elif role == QtCore.Qt.ItemDataRole.FontRole:
 			if record.levelno >= logging.CRITICAL:
 				font = QtWidgets.QApplication.font()
@@ -4,6 +4,7 @@ from PySide6 import QtCore
 
 from ..binitems import binitemsmodel, binitemtypes
 from ..binview import binviewmodel, binviewitemtypes
+from ..binfilters.siftfilter import siftindex, siftmatchtypes
 
 import avbutils
 
@@ -17,6 +18,34 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 		self._item_model = item_model
 		self._view_model = view_model
 
+		self._search_text:dict[tuple[avbutils.bins.BinColumnFieldIDs, str], list[str]] = {}
+		"""Casefolded display text of every row per column field, for sifting.  Filled in as it's asked for."""
+
+		self._search_haystacks:list[str]|None = None
+		"""Casefolded display text of each row's columns, separated, for Find in Bin.  Built when first asked for."""
+
+		self._trigram_indexes:dict[typing.Hashable, siftindex.BSTrigramIndex] = {}
+		"""Trigram indexes of search text, by column field key, or `None` for the row haystacks"""
+
+		self._trigram_builds:dict[typing.Hashable, tuple[int, set[int]]] = {}
+		"""Build ID and rows changed since, for each trigram index being built in the thread pool"""
+
+		self._trigram_build_id = 0
+
+		self._prefix_indexes:dict[tuple[avbutils.bins.BinColumnFieldIDs, str], siftindex.BSPrefixIndex] = {}
+		"""Sorted indexes of search text by column field key, built the first time a column needs one"""
+
+		self._range_indexes:dict[binitemtypes.BSBinItemDataRoles, siftindex.BSFrameRangeIndex] = {}
+		"""Indexes of bin item ranges by range role, built the first time a range is sifted"""
+
+		self._trigram_signals = siftindex.BSTrigramIndexWorker.Signals(self)
+		self._trigram_signals.sig_indexed.connect(self.trigramIndexBuilt)
+
+		self._trigram_timer = QtCore.QTimer(self)
+		self._trigram_timer.setSingleShot(True)
+		self._trigram_timer.setInterval(siftindex.TRIGRAM_INDEX_DELAY_MSEC)
+		self._trigram_timer.timeout.connect(self.indexSearchHaystacks)
+
 		self._setupViewModel()
 		self._setupItemModel()
 
@@ -34,11 +63,21 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 		self._item_model.layoutAboutToBeChanged.connect(self.binItemLayoutAboutToChange)
 		self._item_model.layoutChanged.connect(self.binItemLayoutChanged)
 
+		self._item_model.dataChanged.connect(self.binItemsDataChanged)
+
 		self._item_model.modelAboutToBeReset.connect(self.beginResetModel)
-		self._item_model.modelReset.connect(self.endResetModel)
+		self._item_model.modelReset.connect(self.binItemsReset)
 
 	def _setupViewModel(self):
 
+		# Haystacks follow the columns on show, so drop them ahead of anyone hearing about new columns
+		self._view_model.rowsInserted.connect(self._clearSearchHaystacks)
+		self._view_model.rowsMoved.connect(self._clearSearchHaystacks)
+		self._view_model.rowsRemoved.connect(self._clearSearchHaystacks)
+		self._view_model.layoutChanged.connect(self._clearSearchHaystacks)
+		self._view_model.modelReset.connect(self._clearSearchHaystacks)
+		self._view_model.dataChanged.connect(self._clearSearchHaystacks)
+
 		self._view_model.rowsAboutToBeInserted.connect(self.binColumnsAboutToBeInserted)
 		self._view_model.rowsInserted.connect(self.binColumnsInserted)
 
@@ -64,6 +103,22 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 
 	@QtCore.Slot(QtCore.QModelIndex, int, int)
 	def binItemsInserted(self, parent:QtCore.QModelIndex, row_start:int, row_end:int):
+
+		if self._search_text:
+			self._updateSearchText(range(row_start, row_end + 1), is_insert=True)
+
+		if self._search_haystacks is not None:
+			self._search_haystacks[row_start:row_start] = self._rowSearchHaystacks(range(row_start, row_end + 1))
+
+		# Indexes can take rows added to the end, but rows added anywhere else would renumber the rows after them
+		if row_end == self.rowCount(QtCore.QModelIndex()) - 1:
+			for index_key, trigram_index in self._trigram_indexes.items():
+				trigram_index.appendRows(self._indexedSearchText(index_key)[row_start:row_end + 1])
+		else:
+			self._dropTrigramIndexes()
+
+		self._trigram_timer.start()
+		self._range_indexes.clear()
 		
 		self.endInsertRows()
 
@@ -75,6 +130,11 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 	@QtCore.Slot(QtCore.QModelIndex, int, int, QtCore.QModelIndex, int)
 	def binItemsMoved(self, sourceParent:QtCore.QModelIndex, sourceStart:int, sourceEnd:int, destinationParent:QtCore.QModelIndex, destinationRow:int):
 
+		self._search_text.clear()
+		self._search_haystacks = None
+		self._dropTrigramIndexes()
+		self._prefix_indexes.clear()
+		self._range_indexes.clear()
 		self.endMoveRows()
 
 	@QtCore.Slot(QtCore.QModelIndex, int, int)
@@ -84,9 +144,51 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 
 	@QtCore.Slot(QtCore.QModelIndex, int, int)
 	def binItemsRemoved(self, parent:QtCore.QModelIndex, start:int, end:int):
+
+		for search_text in self._search_text.values():
+			del search_text[start:end + 1]
+
+		if self._search_haystacks is not None:
+			del self._search_haystacks[start:end + 1]
+
+		self._dropTrigramIndexes()
+		self._prefix_indexes.clear()
+		self._range_indexes.clear()
 		
 		self.endRemoveRows()
 
+	@QtCore.Slot()
+	def binItemsReset(self):
+
+		self._search_text.clear()
+		self._search_haystacks = None
+		self._dropTrigramIndexes()
+		self._prefix_indexes.clear()
+		self._range_indexes.clear()
+		self._trigram_timer.start()
+		self.endResetModel()
+
+	@QtCore.Slot(QtCore.QModelIndex, QtCore.QModelIndex, list)
+	def binItemsDataChanged(self, top_left:QtCore.QModelIndex, bottom_right:QtCore.QModelIndex, roles:list[int]=[]):
+
+		if self._search_text:
+			self._updateSearchText(range(top_left.row(), bottom_right.row() + 1))
+
+		if self._search_haystacks is not None:
+			self._search_haystacks[top_left.row():bottom_right.row() + 1] = self._rowSearchHaystacks(range(top_left.row(), bottom_right.row() + 1))
+
+		self._markTrigramIndexesStale(range(top_left.row(), bottom_right.row() + 1))
+		self._range_indexes.clear()
+
+		if not self.columnCount(QtCore.QModelIndex()):
+			return
+
+		self.dataChanged.emit(
+			self.index(top_left.row(), 0, QtCore.QModelIndex()),
+			self.index(bottom_right.row(), self.columnCount(QtCore.QModelIndex())-1, QtCore.QModelIndex()),
+			roles
+		)
+
 	@QtCore.Slot()
 	def binItemLayoutAboutToChange(self):
 
@@ -95,6 +197,11 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 	@QtCore.Slot()
 	def binItemLayoutChanged(self):
 
+		self._search_text.clear()
+		self._search_haystacks = None
+		self._dropTrigramIndexes()
+		self._prefix_indexes.clear()
+		self._range_indexes.clear()
 		self.layoutChanged.emit()
 
 
@@ -299,6 +406,323 @@ class BSBinCompositeModel(QtCore.QAbstractItemModel):
 		else:
 			return bin_item[field_id].data(role)
 	
+	def columnSortKeys(self, column:int) -> list[tuple]|None:
+		"""Sort keys for every row of a column, straight from the bin item model's columns if it can.  `None` if it can't."""
+
+		field_id   = self._view_model.data(self._view_model.index(column, 0, QtCore.QModelIndex()), binviewitemtypes.BSBinViewColumnInfoRole.FieldIdRole)
+		field_name = self._view_model.data(self._view_model.index(column, 0, QtCore.QModelIndex()), binviewitemtypes.BSBinViewColumnInfoRole.FieldNameRole)
+
+		# Follow rows down through any filters to the bin item model itself
+		item_model = self._item_model
+		item_rows  = range(item_model.rowCount(QtCore.QModelIndex()))
+
+		while isinstance(item_model, QtCore.QAbstractProxyModel):
+			item_rows  = [item_model.mapToSource(item_model.index(row, 0, QtCore.QModelIndex())).row() for row in item_rows]
+			item_model = item_model.sourceModel()
+
+		if not isinstance(item_model, binitemsmodel.BSBinItemModel):
+			return None
+
+		sort_keys = item_model.columnSortKeys(field_id, field_name)
+
+		if sort_keys is None:
+			return None
+
+		return [sort_keys[row] for row in item_rows]
+	
+	def columnSearchText(self, column:int, rows:typing.Sequence[int]) -> list[str]:
+		"""Casefolded display text of a column for the given rows, for sifting"""
+
+		search_text = self._columnSearchText(column)
+
+		if isinstance(rows, range) and rows.step == 1:
+			return search_text[rows.start:rows.stop]
+
+		return [search_text[row] for row in rows]
+
+	def rowSearchHaystacks(self, rows:typing.Sequence[int]) -> list[str]:
+		"""
+		Casefolded display text of every column on show for the given rows, for Find in Bin
+
+		Fields are separated by, and wrapped in, `siftmatchtypes.SEARCH_FIELD_SEPARATOR`
+		"""
+
+		search_haystacks = self._searchHaystacks()
+
+		if isinstance(rows, range) and rows.step == 1:
+			return search_haystacks[rows.start:rows.stop]
+
+		return [search_haystacks[row] for row in rows]
+
+	def rowsContaining(self, needle:str, rows:typing.Sequence[int], column:int|None=None) -> bytes:
+		"""
+		Whether the search text of each of the given rows contains a casefolded string, one byte (`0` or `1`) per row
+
+		Looks in the given column, or else in the row haystacks (see `rowSearchHaystacks()`).  Large bins are narrowed
+		down with a trigram index first, once there is one.
+		"""
+
+		index_key   = None if column is None else self._columnFieldKey(column)
+		search_text = self._searchHaystacks() if column is None else self._columnSearchText(column)
+
+		trigram_index = self._trigramIndex(index_key, search_text)
+		candidates    = trigram_index.candidateRows(needle) if trigram_index is not None else None
+
+		if candidates is None:
+
+			if isinstance(rows, range) and rows.step == 1:
+				return bytes([needle in text for text in search_text[rows.start:rows.stop]])
+
+			return bytes([needle in search_text[row] for row in rows])
+
+		# Just the candidates among the rows asked about, which might only be a chunk of them
+		return self._rowsAmong([row for row in candidates.intersection(rows) if needle in search_text[row]], rows)
+
+	def rowsMatching(self, sift_string:str, match_type:siftmatchtypes.BSSiftMatchTypes, rows:typing.Sequence[int], column:int) -> bytes:
+		"""
+		Whether a column's search text matches a casefolded string for each of the given rows, one byte (`0` or `1`) per row
+
+		Begins With and Matches Exactly are looked up in a sorted index of the column, built the first time it's needed
+		and kept until the column's text changes.
+		"""
+
+		if match_type == siftmatchtypes.BSSiftMatchTypes.Contains:
+			return self.rowsContaining(sift_string, rows, column)
+
+		field_key = self._columnFieldKey(column)
+
+		if field_key not in self._prefix_indexes:
+			self._prefix_indexes[field_key] = siftindex.BSPrefixIndex(self._columnSearchText(column))
+
+		if match_type == siftmatchtypes.BSSiftMatchTypes.BeginsWith:
+			return self._rowsAmong(self._prefix_indexes[field_key].rowsStartingWith(sift_string), rows)
+
+		return self._rowsAmong(self._prefix_indexes[field_key].rowsEqualTo(sift_string), rows)
+
+	def rowsWithRangeContaining(self, range_role:binitemtypes.BSBinItemDataRoles, frames_at_rate:typing.Callable[[typing.Any, typing.Any], int|None], rows:typing.Sequence[int]) -> bytes|None:
+		"""
+		Whether each of the given rows has a range containing a value, one byte (`0` or `1`) per row
+
+		`frames_at_rate(rate, mode)` gives the value as a frame count at a rate (see `siftindex.BSFrameRangeIndex`).
+		Returns `None` for ranges that can't be indexed, to be checked a row at a time instead.
+		"""
+
+		if range_role not in self._range_indexes:
+
+			_, item_model = self._binItemFilters()
+			frame_ranges  = item_model.frameRanges(range_role) if isinstance(item_model, binitemsmodel.BSBinItemModel) else None
+
+			if frame_ranges is None:
+				return None
+
+			self._range_indexes[range_role] = siftindex.BSFrameRangeIndex(*frame_ranges)
+
+		return self._rowsAmong(self._rowsFromBinItemRows(self._range_indexes[range_role].rowsContaining(frames_at_rate)), rows)
+
+	@QtCore.Slot()
+	def indexSearchHaystacks(self):
+		"""Index the row haystacks of a large bin in the background, ahead of Find in Bin"""
+
+		if self.rowCount(QtCore.QModelIndex()) < siftindex.TRIGRAM_INDEX_MIN_ROWS or not self.columnCount(QtCore.QModelIndex()):
+			return
+
+		self._trigramIndex(None, self._searchHaystacks())
+
+	@QtCore.Slot(object, int, object)
+	def trigramIndexBuilt(self, index_key:typing.Hashable, build_id:int, trigram_index:siftindex.BSTrigramIndex):
+		"""A trigram index came back from the thread pool"""
+
+		# Search text has changed past what the index can catch up on
+		if index_key not in self._trigram_builds or self._trigram_builds[index_key][0] != build_id:
+			return
+
+		_, stale_rows = self._trigram_builds.pop(index_key)
+
+		trigram_index.appendRows(self._indexedSearchText(index_key)[trigram_index.rowCount():])
+		trigram_index.markRowsStale(stale_rows)
+
+		self._trigram_indexes[index_key] = trigram_index
+
+	def _binItemFilters(self) -> tuple[list[QtCore.QAbstractProxyModel], QtCore.QAbstractItemModel]:
+		"""Any filters on the bin items, top down, and the bin item model beneath them"""
+
+		item_filters = []
+		item_model   = self._item_model
+
+		while isinstance(item_model, QtCore.QAbstractProxyModel):
+			item_filters.append(item_model)
+			item_model = item_model.sourceModel()
+
+		return item_filters, item_model
+
+	def _rowsFromBinItemRows(self, item_rows:typing.Iterable[int]) -> list[int]:
+		"""Rows for some rows of the bin item model, up through any filters on the bin items.  Filtered rows are left out."""
+
+		item_filters, _ = self._binItemFilters()
+		rows = list(item_rows)
+
+		for item_filter in reversed(item_filters):
+			source_model = item_filter.sourceModel()
+			rows = [row for row in (item_filter.mapFromSource(source_model.index(row, 0, QtCore.QModelIndex())).row() for row in rows) if row >= 0]
+
+		return rows
+
+	@staticmethod
+	def _rowsAmong(matched_rows:typing.Collection[int], rows:typing.Sequence[int]) -> bytes:
+		"""Whether each of the given rows is one of the matched rows, one byte (`0` or `1`) per row"""
+
+		if isinstance(rows, range) and rows.step == 1:
+
+			among = bytearray(len(rows))
+
+			for row in matched_rows:
+				if row in rows:
+					among[row - rows.start] = 1
+
+			return bytes(among)
+
+		matched_rows = set(matched_rows)
+
+		return bytes([row in matched_rows for row in rows])
+
+	def _columnSearchText(self, column:int) -> list[str]:
+		"""Casefolded display text of a column for every row"""
+
+		field_key = self._columnFieldKey(column)
+
+		if field_key not in self._search_text:
+
+			# View items are built a row at a time, so gather every column still missing while we're at it
+			field_keys = [
+				field_key for field_key in map(self._columnFieldKey, range(self.columnCount(QtCore.QModelIndex())))
+				if field_key not in self._search_text
+			]
+
+			self._search_text.update(zip(field_keys, self._fieldSearchText(field_keys, range(self.rowCount(QtCore.QModelIndex())))))
+
+		return self._search_text[field_key]
+
+	def _searchHaystacks(self) -> list[str]:
+		"""Row haystacks for every row"""
+
+		if self._search_haystacks is None:
+			self._search_haystacks = self._rowSearchHaystacks(range(self.rowCount(QtCore.QModelIndex())))
+
+		return self._search_haystacks
+
+	@QtCore.Slot()
+	def _clearSearchHaystacks(self):
+
+		self._search_haystacks = None
+		self._dropTrigramIndex(None)
+
+	def _indexedSearchText(self, index_key:typing.Hashable) -> list[str]:
+		"""The search text a trigram index is for"""
+
+		return self._search_haystacks if index_key is None else self._search_text[index_key]
+
+	def _trigramIndex(self, index_key:typing.Hashable, search_text:list[str]) -> siftindex.BSTrigramIndex|None:
+		"""The trigram index for some search text, if it's been built.  Large enough search text gets one built."""
+
+		if len(search_text) < siftindex.TRIGRAM_INDEX_MIN_ROWS:
+			return None
+
+		if index_key in self._trigram_indexes:
+			return self._trigram_indexes[index_key]
+
+		if index_key not in self._trigram_builds:
+
+			self._trigram_build_id += 1
+			self._trigram_builds[index_key] = (self._trigram_build_id, set())
+
+			# Index a copy, since the search text keeps up with the rows meanwhile
+			QtCore.QThreadPool.globalInstance().start(
+				siftindex.BSTrigramIndexWorker(self._trigram_signals, index_key, self._trigram_build_id, list(search_text))
+			)
+
+		return None
+
+	def _markTrigramIndexesStale(self, rows:range):
+		"""Rows have changed since they were indexed.  Indexes with too many changes are dropped, to be built again."""
+
+		for _, stale_rows in self._trigram_builds.values():
+			stale_rows.update(rows)
+
+		for index_key, trigram_index in list(self._trigram_indexes.items()):
+
+			trigram_index.markRowsStale(rows)
+
+			if trigram_index.staleRowCount() > trigram_index.rowCount() * siftindex.TRIGRAM_INDEX_MAX_STALE:
+				self._dropTrigramIndex(index_key)
+				self._trigram_timer.start()
+
+	def _dropTrigramIndex(self, index_key:typing.Hashable):
+
+		self._trigram_indexes.pop(index_key, None)
+		self._trigram_builds.pop(index_key, None)
+
+	def _dropTrigramIndexes(self):
+
+		self._trigram_indexes.clear()
+		self._trigram_builds.clear()
+
+	def _rowSearchHaystacks(self, rows:range) -> list[str]:
+
+		separator    = siftmatchtypes.SEARCH_FIELD_SEPARATOR
+		columns_text = [self.columnSearchText(column, rows) for column in range(self.columnCount(QtCore.QModelIndex()))]
+
+		if not columns_text:
+			return [separator * 2] * len(rows)
+
+		return [separator + separator.join(row_text) + separator for row_text in zip(*columns_text)]
+
+	def _columnFieldKey(self, column:int) -> tuple[avbutils.bins.BinColumnFieldIDs, str]:
+
+		column_index = self._view_model.index(column, 0, QtCore.QModelIndex())
+
+		return (
+			self._view_model.data(column_index, binviewitemtypes.BSBinViewColumnInfoRole.FieldIdRole),
+			self._view_model.data(column_index, binviewitemtypes.BSBinViewColumnInfoRole.FieldNameRole),
+		)
+
+	def _fieldSearchText(self, field_keys:list[tuple[avbutils.bins.BinColumnFieldIDs, str]], rows:range) -> list[list[str]]:
+		"""Casefolded display text for each field key, for a range of rows"""
+
+		search_text = [[] for _ in field_keys]
+
+		for row in rows:
+
+			bin_item = self._item_model.data(self._item_model.index(row, 0, QtCore.QModelIndex()), binitemtypes.BSBinItemDataRoles.ViewItemsRole)
+
+			for (field_id, field_name), field_text in zip(field_keys, search_text):
+
+				if field_id not in bin_item:
+					view_item = None
+				elif field_id == avbutils.bins.BinColumnFieldIDs.User:
+					view_item = bin_item[field_id].get(field_name)
+				else:
+					view_item = bin_item[field_id]
+
+				display_text = view_item.data(QtCore.Qt.ItemDataRole.DisplayRole) if view_item is not None else None
+				field_text.append(display_text.casefold() if isinstance(display_text, str) else "")
+
+		return search_text
+
+	def _updateSearchText(self, rows:range, is_insert:bool=False):
+		"""Bring cached search text up to date for new or changed rows"""
+
+		field_keys = list(self._search_text)
+
+		for field_key, field_text in zip(field_keys, self._fieldSearchText(field_keys, rows)):
+
+			if is_insert:
+				self._search_text[field_key][rows.start:rows.start] = field_text
+				self._prefix_indexes.pop(field_key, None)
+
+			elif self._search_text[field_key][rows.start:rows.stop] != field_text:
+				self._search_text[field_key][rows.start:rows.stop] = field_text
+				self._prefix_indexes.pop(field_key, None)
+	
 	def headerData(self, section:int, orientation:QtCore.Qt.Orientation, /, role:QtCore.Qt.ItemDataRole) -> typing.Any:
 		
 		if not orientation == QtCore.Qt.Orientation.Horizontal:
@@ -14,7 +14,8 @@ from ..binitems import binitemsmodel, binitemtypes
 from ..binview import binviewmodel, binviewitemtypes
 from ..managers import actions, binproperties, appearance
 from ..widgets import menus, toolboxes, buttons, about, overlaywidget
-from ..core import binloader, icon_engines, icon_providers
+from ..core import binio, binloader, binscheduler, bincache, icon_engines, icon_providers
+from .. import binwatcher
 from ..binvieweditor import editorwidget
 from ..binfilters.siftfilter import sifters
 
@@ -69,6 +70,17 @@ class BSMainWindow(QtWidgets.QMainWindow):
 
 		# Define signals
 		self._queue_size       = 500  # Mobs to batch-load
+		self._batch_budget     = 12   # Main-thread msec per batch when sizing batches adaptively (0 = fixed batches of `_queue_size`)
+		self._last_chunk_size  = 0
+		self._process_count    = 0    # Worker processes for parsing (0 = parse in the loader thread)
+		self._bin_cache        = None # Parsed bin cache (None = always parse)
+		self._load_scheduler   = None # Shared load scheduler (None = start loads right away on the global thread pool)
+		self._read_mode        = binio.BSBinReadMode.AUTO
+		self._slow_mob_count   = 10   # Slowest mobs to list in the load profile
+		self._use_visible_first = True # Load the items that'll be on screen first
+		self._is_reloading     = False # Current load is an incremental reload of the same bin
+		self._use_auto_reload  = True  # Reload when the bin changes on disk
+		self._bin_watcher      = binwatcher.BSBinLockWatcher(parent=self)
 		self._use_animation    = True # Use animated progress bar
 		self._use_sift         = True 
 		self._sigs_binloader   = binloader.BSBinViewLoader.Signals()
@@ -253,7 +265,7 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self._man_actions._act_quitapplication.triggered     .connect(self.sig_request_quit_application)
 		self._man_actions._act_show_about.triggered          .connect(self.showAboutBox)
 
-		self._man_actions._act_reloadcurrent.triggered       .connect(lambda: self.loadBinFromPath(self.windowFilePath()))
+		self._man_actions._act_reloadcurrent.triggered       .connect(self.reloadBin)
 		self._man_actions._act_stopcurrent.triggered         .connect(self._sigs_binloader.requestStop)
 
 		self._man_actions._act_check_updates.triggered       .connect(self.sig_request_check_updates)
@@ -301,6 +313,9 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self._tool_appearance.sig_colors_changed             .connect(self._man_appearance.setBinColors)
 
 		# Bin loader signals
+		self._bin_watcher.sig_bin_changed                    .connect(self.binChangedOnDisk)
+		self._bin_watcher.sig_lock_changed                   .connect(self.binLockChanged)
+
 		self._sigs_binloader.sig_begin_loading               .connect(self.prepareForBinLoading)
 		self._sigs_binloader.sig_done_loading                .connect(self.cleanupAfterBinLoading)
 		self._sigs_binloader.sig_got_exception               .connect(self.binLoadException)
@@ -311,13 +326,13 @@ class BSMainWindow(QtWidgets.QMainWindow):
  
 		self._sigs_binloader.sig_got_display_mode            .connect(self._bin_widget.setViewMode)
 		self._sigs_binloader.sig_got_bin_display_settings    .connect(self._man_bindisplay.setBinDisplayFlags)
-		self._sigs_binloader.sig_got_view_settings           .connect(self._bin_view_model.setBinViewInfo)
+		self._sigs_binloader.sig_got_view_settings           .connect(self.setBinViewInfoFromBin)
 		self._sigs_binloader.sig_got_text_column_widths      .connect(self._bin_widget.setTextColumnWidthsFromBin)
 		self._sigs_binloader.sig_got_frame_mode_scale        .connect(self._bin_widget.frameView().setZoom)
 		self._sigs_binloader.sig_got_script_mode_scale       .connect(self._bin_widget.scriptView().setFrameScale)
 		self._sigs_binloader.sig_got_sift_settings           .connect(self.setSiftCriteriaFromBin)
 		self._sigs_binloader.sig_got_bin_appearance_settings .connect(self._man_appearance.setAppearanceSettings)
-#		self._sigs_binloader.sig_got_sort_settings           .connect(self._man_binview.setDefaultSortColumns)
+		self._sigs_binloader.sig_got_sort_settings           .connect(self._bin_widget.setSortColumnsFromBin)
 #		self._sigs_binloader.sig_got_mobs                    .connect(self.updateLoadingBar, QtCore.Qt.ConnectionType.BlockingQueuedConnection)
 
 		# Sift Settings
@@ -373,10 +388,14 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		return self._binview_provider
 
 	@QtCore.Slot()
-	def addBinItems(self, bin_items:list[binitemtypes.BSBinItemInfo]):
+	def addBinItems(self, bin_items:list[binitemtypes.BSBinItemRecord]):
 
 		self.updateLoadingBar(bin_items)
-		self._bin_item_model.addBinItems(bin_items)
+
+		if self._bin_item_model.isMerging():
+			self._bin_item_model.mergeBinItems(bin_items)
+		else:
+			self._bin_item_model.addBinItems(bin_items)
 			
 	def actionsManager(self) -> actions.ActionsManager:
 		return self._man_actions
@@ -405,7 +424,70 @@ class BSMainWindow(QtWidgets.QMainWindow):
 
 	def mobQueueSize(self) -> int:
 		return self._queue_size
+
+	@QtCore.Slot(int)
+	def setBatchBudget(self, budget_msec:int):
+		self._batch_budget = max(int(budget_msec), 0)
+
+	def batchBudget(self) -> int:
+		return self._batch_budget
+
+	@QtCore.Slot(int)
+	def setParallelLoadProcesses(self, process_count:int):
+		self._process_count = max(int(process_count), 0)
+
+	def parallelLoadProcesses(self) -> int:
+		return self._process_count
+
+	def setBinCache(self, bin_cache:bincache.BSBinCache|None):
+		self._bin_cache = bin_cache
+
+	def binCache(self) -> bincache.BSBinCache|None:
+		return self._bin_cache
+
+	def setLoadScheduler(self, load_scheduler:binscheduler.BSBinLoadScheduler|None):
+		self._load_scheduler = load_scheduler
+
+	def loadScheduler(self) -> binscheduler.BSBinLoadScheduler|None:
+		return self._load_scheduler
+
+	@QtCore.Slot(str)
+	def setBinReadMode(self, read_mode:str):
+
+		try:
+			self._read_mode = binio.BSBinReadMode(read_mode)
+		except ValueError:
+			logging.getLogger(__name__).error("Unknown bin read mode %s, using %s instead", read_mode, binio.BSBinReadMode.AUTO)
+			self._read_mode = binio.BSBinReadMode.AUTO
+
+	def binReadMode(self) -> binio.BSBinReadMode:
+		return self._read_mode
+
+	@QtCore.Slot(int)
+	def setSlowMobReportCount(self, slow_mob_count:int):
+		self._slow_mob_count = max(int(slow_mob_count), 0)
+
+	def slowMobReportCount(self) -> int:
+		return self._slow_mob_count
+
+	@QtCore.Slot(bool)
+	def setVisibleFirstLoading(self, visible_first:bool):
+		self._use_visible_first = bool(visible_first)
+
+	def visibleFirstLoading(self) -> bool:
+		return self._use_visible_first
 	
+	@QtCore.Slot(bool)
+	def setAutoReloadEnabled(self, use_auto_reload:bool):
+		self._use_auto_reload = bool(use_auto_reload)
+		self._bin_watcher.setBinPath(self.windowFilePath() if self._use_auto_reload else None)
+
+	def autoReloadEnabled(self) -> bool:
+		return self._use_auto_reload
+
+	def binWatcher(self) -> binwatcher.BSBinLockWatcher:
+		return self._bin_watcher
+
 	@QtCore.Slot(bool)
 	def setUseSiftCriteriaFromBin(self, use_sift:bool):
 		self._use_sift = use_sift
@@ -539,9 +621,26 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self._man_actions._act_stopcurrent.setEnabled(True)
 		self._man_actions._act_stopcurrent.setVisible(True)
 		
-		self._bin_item_model.clear()
-		self._bin_widget.siftFilter().setLiveSiftEnabled(False)
-		self._bin_widget.siftFilter().resetSiftCriteria()
+		# Incremental reloads keep existing rows, selection and filters; only the delta is applied
+		is_reload, self._is_reloading = self._is_reloading and bin_path == self.windowFilePath(), False
+
+		if is_reload:
+			self._bin_item_model.beginMerge()
+		
+		else:
+			self._bin_item_model.clear()
+			self._bin_widget.siftFilter().setLiveSiftEnabled(False)
+			self._bin_widget.siftFilter().resetSiftCriteria()
+
+		# Take the bin as it is now as the baseline for auto-reload, and hold off while we're loading it
+		if self._use_auto_reload:
+
+			self._bin_watcher.setPaused(True)
+			
+			if self._bin_watcher.binPath() == QtCore.QFileInfo(bin_path).absoluteFilePath():
+				self._bin_watcher.rebaseline()
+			else:
+				self._bin_watcher.setBinPath(bin_path)
 		
 		self._bin_widget.topWidgetBar().progressBar().setFormat(self.tr("Loading bin properties..."))
 		self._bin_widget.topWidgetBar().progressBar().show()
@@ -562,8 +661,10 @@ class BSMainWindow(QtWidgets.QMainWindow):
 
 		if self._use_animation:
 
+			# Batches vary in size, so scale by the last one rather than the nominal queue size
 			last_duration     = self._time_last_chunk.restart() if self._time_last_chunk.isValid() else 5_000
-			adjusted_duration = round(last_duration * (len(mobs_list)/self._queue_size))
+			adjusted_duration = round(last_duration * (len(mobs_list)/(self._last_chunk_size or self._queue_size)))
+			self._last_chunk_size = len(mobs_list)
 
 			self._anim_progress.stop()
 			self._anim_progress.setStartValue(self._anim_progress.targetObject().value())
@@ -587,10 +688,34 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self.binContentsWidget().siftFilter().setSiftCriteria(criteria)
 		logging.getLogger(__name__).debug("Loaded sift settings from bin: %s", repr(criteria))
 	
+	@QtCore.Slot(object)
+	def setBinViewInfoFromBin(self, binview_info:binviewitemtypes.BSBinViewInfo):
+		"""Set the bin view stored in the bin"""
+
+		# Avoid resetting every column on reload if the bin view hasn't changed
+		if self._bin_item_model.isMerging() and self._isCurrentBinView(binview_info):
+			logging.getLogger(__name__).debug("Bin view unchanged on reload")
+			return
+		
+		self._bin_view_model.setBinViewInfo(binview_info)
+	
+	def _isCurrentBinView(self, binview_info:binviewitemtypes.BSBinViewInfo) -> bool:
+
+		def column_key(column:binviewitemtypes.BSBinViewColumnInfo) -> tuple:
+			return (column.field_id, column.format_id, column.display_name, column.is_hidden)
+		
+		current_info = self._bin_view_model.binViewInfo()
+
+		return current_info.name == binview_info.name and \
+			list(map(column_key, current_info.columns)) == list(map(column_key, binview_info.columns))
+
 	@QtCore.Slot()
 	def cleanupAfterBinLoading(self):
 		"""A bin has finished loading.  Reset UI elements."""
 
+		self._bin_item_model.endMerge()
+		self._bin_watcher.setPaused(False)
+
 		# NOTE: If I really wanna tween the last of the progress,
 		# I could do something like below. But is it necessary?
 		# PROBABLY NOT.
@@ -600,18 +725,13 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self._anim_progress.stop()
 		self._anim_progress.setEndValue(0)
 		self._time_last_chunk.invalidate()
+		self._last_chunk_size = 0
 
 
 		self._bin_widget.topWidgetBar().progressBar().setMaximum(0)
 		self._bin_widget.topWidgetBar().progressBar().setValue(0)
 		self._bin_widget.topWidgetBar().progressBar().hide()
 
-		# Enabling sorting also performs a sort... sooo
-		# Set invalid sort column first, per the docs
-		# TODO: Set as stored sort column if available from the bin
-#		self._bin_widget.textView().header().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
-		#self._bin_widget.textView().setSortingEnabled(True)
-		
 		self._man_actions._act_reloadcurrent.setEnabled(True)
 		self._man_actions._act_reloadcurrent.setVisible(True)
 
@@ -631,7 +751,7 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		total_load_time = self._time_last_load.elapsed()
 		self._time_last_load.invalidate()
 		
-		logging.getLogger(__name__).info("Finished loading %s in %s seconds (queuesize=%s, fancy=%s)", self.windowFilePath(), round(total_load_time/1000,2), self._queue_size, self._use_animation)
+		logging.getLogger(__name__).info("Finished loading %s in %s seconds (queuesize=%s, budget=%sms, fancy=%s)", self.windowFilePath(), round(total_load_time/1000,2), self._queue_size, self._batch_budget, self._use_animation)
 
 	@QtCore.Slot()
 	@QtCore.Slot(str)
@@ -640,6 +760,9 @@ class BSMainWindow(QtWidgets.QMainWindow):
 
 		
 		logging.getLogger(__name__).warning("Aborted loading bin")
+
+		# Rows not seen yet may well still be in the bin, so don't drop them
+		self._bin_item_model.endMerge(remove_unmatched=False)
 		
 		if message:
 			QtWidgets.QMessageBox.critical(self, self.tr("Bin Not Loaded"), message)
@@ -666,13 +789,44 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		if file_path:
 			self.loadBinFromPath(file_path)
 
+	@QtCore.Slot(str)
+	def binChangedOnDisk(self, bin_path:str):
+		"""The watched bin was saved and has settled"""
+
+		if not self._use_auto_reload or QtCore.QFileInfo(bin_path) != QtCore.QFileInfo(self.windowFilePath()):
+			return
+		
+		logging.getLogger(__name__).info("Bin changed on disk, reloading %s", bin_path)
+		self.reloadBin()
+
+	@QtCore.Slot(object)
+	def binLockChanged(self, lock_info:binwatcher.BSBinLockInfo|None):
+
+		if lock_info:
+			logging.getLogger(__name__).info("Bin is locked by %s", lock_info.name)
+		else:
+			logging.getLogger(__name__).info("Bin is no longer locked")
+
+	@QtCore.Slot()
+	def reloadBin(self):
+		"""Reload the current bin, applying only what changed"""
+
+		if not self.windowFilePath():
+			return
+		
+		self._is_reloading = True
+		self.loadBinFromPath(self.windowFilePath())
+
 	@QtCore.Slot(object)
 	def loadBinFromPath(self, bin_path:PathLike):
 		"""Load a bin from the given path"""
 
-		QtCore.QThreadPool.globalInstance().start(
-			binloader.BSBinViewLoader(bin_path, self._sigs_binloader, self._queue_size)
-		)
+		loader = binloader.BSBinViewLoader(bin_path, self._sigs_binloader, self._queue_size, self._process_count, self._bin_cache, self._slow_mob_count, self._batch_budget or None, self._bin_widget.visibleItemCounts() if self._use_visible_first else None, read_mode=self._read_mode)
+
+		if self._load_scheduler is not None:
+			self._load_scheduler.requestLoad(self, loader)
+		else:
+			QtCore.QThreadPool.globalInstance().start(loader)
 
 	@QtCore.Slot()
 	def showAboutBox(self):
@@ -691,6 +845,9 @@ class BSMainWindow(QtWidgets.QMainWindow):
 		self._sigs_binloader.requestStop()
 		self._sigs_binloader.disconnect(self)
 
+		if self._load_scheduler is not None:
+			self._load_scheduler.cancelLoads(self)
+
 	@QtCore.Slot(int)
 	def gotMobCount(self, mob_count:int):
 
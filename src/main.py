@@ -47,7 +47,10 @@ import binspector
 
 if __name__ == "__main__":
 	
-	import sys
+	import sys, multiprocessing
+
+	# Worker processes for parallel bin loading re-enter here in frozen builds
+	multiprocessing.freeze_support()
 	
 	sys.exit(
 		binspector.main(sys.argv[1:])
@@ -2,17 +2,34 @@ from __future__ import annotations
 
 from os import PathLike
 
+from PySide6 import QtCore
 from binspector import binwatcher
 
-def watch_bin(bin_path:PathLike):
+def watch_bin(bin_path:PathLike, force_polling:bool=False) -> binwatcher.BSBinLockWatcher:
 
 	print("Watching ", bin_path)
 
+	watcher = binwatcher.BSBinLockWatcher(bin_path, force_polling=force_polling)
+
+	watcher.sig_bin_changed    .connect(lambda p: print("Bin changed: ", p))
+	watcher.sig_bin_removed    .connect(lambda p: print("Bin removed: ", p))
+	watcher.sig_lock_changed   .connect(lambda l: print("Locked by: ", l.name) if l else print("Unlocked"))
+	watcher.sig_polling_changed.connect(lambda p: print("Polling: ", p))
+
+	print("Polling: ", watcher.isPolling())
+	print("Locked by: ", watcher.lockInfo().name if watcher.lockInfo() else None)
+
+	return watcher
+
 if __name__ == "__main__":
 
 	import sys, pathlib
 
 	if not len(sys.argv) > 1:
-		sys.exit(f"Usage: {pathlib.Path(sys.argv[0]).name} avid_bin.avb")
-	
-	binwatcher.BSBinLockWatcher(sys.argv[1])
\ No newline at end of file
+		sys.exit(f"Usage: {pathlib.Path(sys.argv[0]).name} avid_bin.avb [--poll]")
+
+	app = QtCore.QCoreApplication(sys.argv)
+
+	watcher = watch_bin(sys.argv[1], force_polling="--poll" in sys.argv[2:])
+
+	sys.exit(app.exec())